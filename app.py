@@ -1,9 +1,11 @@
 import os
 import uuid
+import atexit
+from datetime import datetime
 from flask import Flask, render_template, request, jsonify, send_from_directory
 from flask_socketio import SocketIO, emit, join_room
 from werkzeug.utils import secure_filename
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import pandas as pd
 import numpy as np
 from src.ingestion import DataIngestion
@@ -13,6 +15,11 @@ from src.correlation import CorrelationAnalyzer
 from src.multi_correlation import MultiFileCorrelationAnalyzer
 from src.data_processor import DataProcessor
 from src.export import DataExporter
+from src.drift import DEFAULT_DRIFT_SETTINGS, DatasetProfiler, DriftDetector, ProfileStore, dataset_name
+from src.results_store import ResultsStore
+from src.stats_context import StatsContext
+from src.plot_renderer import PlotRenderer
+from src.type_inference import TypeInferencer
 from src.logger import setup_logger
 from src.config import ConfigManager
 from threading import Thread, Lock
@@ -22,6 +29,7 @@ logger = setup_logger()
 
 # Initialize task management
 tasks = {}
+task_violations = {}  # task_id -> {check name: ViolationBitmap}, kept out of the JSON results
 task_lock = Lock()
 
 # Initialize Flask app and SocketIO
@@ -107,9 +115,25 @@ erd_generator = ERDGenerator()
 correlation_analyzer = CorrelationAnalyzer()
 multi_correlation_analyzer = MultiFileCorrelationAnalyzer()
 data_exporter = DataExporter()
+drift_settings = config.get_setting('drift')
+profile_store = ProfileStore(
+    drift_settings.get('directory', 'data/profiles'),
+    drift_settings.get('max_profiles_per_dataset', DEFAULT_DRIFT_SETTINGS['max_profiles_per_dataset'])
+)
+results_store_settings = config.get_setting('results_store')
+results_store = (
+    ResultsStore(results_store_settings.get('directory', 'data/results/store'))
+    if results_store_settings.get('enabled', True) else None
+)
+correlation_analyzer.plot_cache.collect()  # Clear plots left unused since the last run
+plot_renderer = PlotRenderer(config.get_setting('plots'))
+atexit.register(plot_renderer.shutdown, wait=False)
 
 # Global state
 task_lock = Lock()
+importance_lock = Lock()  # Guards importance_frames
+importance_frames: Dict[str, pd.DataFrame] = {}  # Last file loaded for feature importance, by content hash
+store_lock = Lock()  # Orders a task's results save with late updates such as attached plots
 
 # Add processed_requests initialization at the top with other globals
 processed_requests: Dict[str, str] = {}
@@ -378,11 +402,37 @@ def get_progress(task_id):
         return jsonify({'error': 'Task not found'}), 404
     return jsonify(task_status)
 
+@app.route('/results', methods=['GET'])
+def list_results():
+    """List stored task results, filtered by ?filename= and ISO ?since= / ?until= dates."""
+    if results_store is None:
+        return jsonify({'error': 'Results store is disabled'}), 404
+    limit = min(request.args.get('limit', 100, type=int), 1000)
+    return jsonify(results_store.query(
+        filename=request.args.get('filename'),
+        since=request.args.get('since'),
+        until=request.args.get('until'),
+        limit=limit
+    ))
+
 @app.route('/results/<task_id>', methods=['GET'])
 def get_results(task_id):
     """Get the results of a completed task."""
     if task_id not in tasks:
-        return jsonify({'error': 'Task not found'}), 404
+        # Tasks from before a restart are read from the results store
+        try:
+            stored = results_store.load_results(task_id) if results_store is not None else None
+        except ValueError:
+            stored = None
+        if stored is None:
+            return jsonify({'error': 'Task not found'}), 404
+        if isinstance(stored.get('correlation_analysis'), dict):
+            # Plots are collected independently of stored results. Nothing would announce a later
+            # redraw to this request, so it waits for a rendering worker to draw the heatmap again
+            correlation_analyzer.restore_heatmap(stored['correlation_analysis'], renderer=plot_renderer, wait=True)
+            if not restore_stored_tiles(task_id, stored['correlation_analysis']):
+                stored['correlation_analysis']['matrix_tiles'] = None
+        return jsonify(stored)
         
     task = get_task_status(task_id)
     if task.get('status') != 'Complete':
@@ -390,6 +440,138 @@ def get_results(task_id):
         
     return jsonify(task.get('results', {}))
 
+@app.route('/tasks/<task_id>/violations/<path:check>', methods=['GET'])
+def get_violations(task_id, check):
+    """Get one page of violating row positions for a validation check."""
+    try:
+        page = request.args.get('page', 1, type=int)
+        page_size = min(request.args.get('page_size', 100, type=int), 10000)
+
+        with task_lock:
+            bitmap = task_violations.get(task_id, {}).get(check)
+            stored_task_id = tasks.get(task_id, {}).get('stored_task_id', task_id)
+        if bitmap is None and results_store is not None:
+            bitmap = results_store.load_violation(stored_task_id, check)
+            if bitmap is not None:
+                with task_lock:
+                    task_violations.setdefault(task_id, {})[check] = bitmap
+        if bitmap is None:
+            return jsonify({'error': f"No violations recorded for check '{check}'"}), 404
+
+        rows = bitmap.page(page, page_size)
+        return jsonify({
+            'task_id': task_id,
+            'check': check,
+            'page': page,
+            'page_size': page_size,
+            'total_count': bitmap.count,
+            'total_pages': -(-bitmap.count // page_size),
+            'rows': rows
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error fetching violations: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/tasks/<task_id>/drift', methods=['GET'])
+def get_drift(task_id):
+    """Compare a task's column profile with a reference profile.
+
+    The reference is the task given by ``?reference=<task_id>``, or else the most
+    recent earlier upload of the same dataset. Only the stored profiles are read.
+    """
+    try:
+        current = profile_store.load(task_id)
+        if current is None:
+            return jsonify({'error': f"No profile recorded for task '{task_id}'"}), 404
+
+        reference_id = request.args.get('reference')
+        reference = profile_store.load(reference_id) if reference_id else profile_store.previous(current)
+        if reference is None:
+            return jsonify({'error': 'No reference profile to compare with'}), 404
+
+        return jsonify(clean_for_json(DriftDetector(drift_settings).compare(reference, current)))
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error computing drift: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/correlation_tiles/<key>', methods=['GET'])
+def get_correlation_tiles(key):
+    """Metadata of a tiled correlation matrix: size, levels, tile size and column order."""
+    try:
+        return jsonify(correlation_analyzer.matrix_tiles.metadata(key))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except FileNotFoundError:
+        return jsonify({'error': f"No correlation matrix stored under '{key}'"}), 404
+
+@app.route('/correlation_tiles/<key>/<int:level>/<int:row>/<int:col>.<fmt>', methods=['GET'])
+def get_correlation_tile(key, level, row, col, fmt):
+    """One tile of a stored correlation matrix, as a PNG or as its cell values (``.json``).
+
+    Level 0 has one pixel per pair; each level up halves the resolution and the
+    highest level is a single overview tile. Tiles are named by the matrix
+    content, so clients may cache them indefinitely.
+    """
+    try:
+        tiles = correlation_analyzer.matrix_tiles
+        if fmt == 'json':
+            return jsonify(tiles.tile_values(key, level, row, col))
+        if fmt != 'png':
+            return jsonify({'error': f"Unknown tile format '{fmt}'"}), 400
+        path = tiles.tile(key, level, row, col)
+        return send_from_directory(os.path.abspath(os.path.dirname(path)), os.path.basename(path),
+                                   mimetype='image/png', max_age=7 * 86400)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except FileNotFoundError:
+        return jsonify({'error': f"No correlation matrix stored under '{key}'"}), 404
+    except Exception as e:
+        logger.error(f"Error serving correlation tile: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/feature_importance', methods=['POST'])
+def feature_importance():
+    """Score every column of an uploaded file against one target column.
+
+    Expects ``filename`` and ``target`` (and optionally ``method``). Results are
+    cached per file content and target, and the last file stays loaded, so
+    switching between targets does not rescan the data.
+    """
+    try:
+        options = request.get_json() or {}
+        if not options.get('filename') or not options.get('target'):
+            return jsonify({'error': 'filename and target are required'}), 400
+        filepath = os.path.join(app.config['UPLOAD_FOLDER'], secure_filename(options['filename']))
+        if not os.path.exists(filepath):
+            return jsonify({'error': f"File not found: {options['filename']}"}), 404
+
+        content_hash = ResultsStore.file_hash(filepath)
+        with importance_lock:
+            df = importance_frames.get(content_hash)
+        if df is None:
+            df = data_ingestion.load_file(filepath)
+            df, _ = TypeInferencer(config.get_setting('validation.type_inference')).coerce(df)
+            with importance_lock:
+                importance_frames.clear()
+                importance_frames[content_hash] = df
+
+        results = correlation_analyzer.get_feature_importance(
+            df, options['target'], method=options.get('method'), dataset_hash=content_hash
+        )
+        return jsonify(clean_for_json(results))
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error computing feature importance: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/export', methods=['POST'])
 def export_data():
     """Export processed data."""
@@ -574,6 +756,16 @@ def process_data_task(task_id: str, config: Dict[str, Any]) -> None:
             
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
+
+        # Reuse stored results for the same file content, configuration and pipeline version
+        content_hash = config_hash = None
+        if results_store is not None:
+            content_hash = ResultsStore.file_hash(file_path)
+            task_options = {key: value for key, value in config.items() if key not in ('filename', 'filepath')}
+            config_hash = ResultsStore.config_hash(ResultsStore.file_hash('config.yaml'), task_options)
+            stored = results_store.find(content_hash, config_hash)
+            if stored is not None and reuse_stored_results(task_id, stored):
+                return
         
         # Load and validate data (commented out to bypass pandas)
         try:
@@ -586,8 +778,26 @@ def process_data_task(task_id: str, config: Dict[str, Any]) -> None:
         
         # Validation
         try:
-            validator = DataValidation()
-            validation_results = validator.validate_data(df)
+            validator = DataValidation(mode=config.get('mode'))
+            stats = StatsContext(df, correlation_analyzer.correlation_settings)
+            partial_results = {'basic_validation': {}, 'advanced_validation': {}, 'correlation_analysis': None}
+
+            def publish_check(section, name, result):
+                # Send each check as it finishes so fast profiles show results early
+                partial_results[section][name] = result
+                done = len(partial_results['basic_validation']) + len(partial_results['advanced_validation'])
+                update_task_status(task_id, {'progress': min(20 + done * 3, 59), 'results': partial_results})
+
+            validation_results = validator.validate_data(
+                df,
+                profile=config.get('profile'),
+                deadline_seconds=config.get('deadline_seconds'),
+                on_result=publish_check,
+                stats=stats
+            )
+            df = stats.frame  # Type-coerced frame, so later stages reuse validation's statistics
+            with task_lock:
+                task_violations[task_id] = validator.violations
             update_task_status(task_id, {
                 'progress': 60,
                 'results': validation_results  # Already has basic_validation and advanced_validation
@@ -596,10 +806,36 @@ def process_data_task(task_id: str, config: Dict[str, Any]) -> None:
         except Exception as e:
             logger.error(f"Error in validation: {str(e)}")
             raise ValueError(f"Error in validation: {str(e)}")
+
+        # Column profile for drift comparisons between uploads of the same dataset
+        if drift_settings.get('enabled', True):
+            try:
+                dataset = config.get('dataset') or dataset_name(file_path)
+                profile_store.save(task_id, DatasetProfiler(drift_settings).profile(df, dataset=dataset))
+            except Exception as e:
+                logger.warning(f"Could not save drift profile: {str(e)}")
         
         # Correlation analysis
         try:
-            correlation_results = correlation_analyzer.analyze(df)
+            def attach_plot(path, error):
+                # The heatmap is rendered off the task thread and may arrive after completion;
+                # only clients subscribed to this task receive it
+                socketio.emit('plot_ready', {
+                    'task_id': task_id,
+                    'kind': 'correlation_matrix',
+                    'path': path,
+                    'error': str(error) if error else None
+                }, room=task_id)
+                if results_store is not None:
+                    with store_lock:
+                        with task_lock:
+                            results = clean_for_json(tasks.get(task_id, {}).get('results', {}))
+                        results_store.update_results(task_id, results)
+
+            correlation_results = correlation_analyzer.analyze(
+                df, stats=stats, renderer=plot_renderer, on_plot=attach_plot,
+                method=config.get('correlation_method')
+            )
             update_task_status(task_id, {
                 'progress': 80,
                 'results': {
@@ -613,6 +849,22 @@ def process_data_task(task_id: str, config: Dict[str, Any]) -> None:
             raise ValueError(f"Error in correlation analysis: {str(e)}")
         update_task_status(task_id, {'progress': 100, 'status': 'Validation bypassed'}) # Mock completion
         
+        if results_store is not None:
+            try:
+                with store_lock:
+                    results_store.save(
+                        task_id,
+                        filename=os.path.basename(file_path),
+                        dataset=config.get('dataset') or dataset_name(file_path),
+                        content_hash=content_hash,
+                        config_hash=config_hash,
+                        results=clean_for_json({**validation_results, 'correlation_analysis': correlation_results}),
+                        violations=validator.violations,
+                        files=stored_tile_files(correlation_results)
+                    )
+            except Exception as e:
+                logger.warning(f"Could not store results: {str(e)}")
+
         # Mark task as complete
         update_task_status(task_id, {
             'status': 'Complete',
@@ -629,6 +881,66 @@ def process_data_task(task_id: str, config: Dict[str, Any]) -> None:
         })
         emit_progress(task_id)
 
+def reuse_stored_results(task_id: str, stored: Dict[str, Any]) -> bool:
+    """Complete a task from a stored task with the same content and configuration.
+
+    Returns:
+        True if the stored results were found and used
+    """
+    results = results_store.load_results(stored['task_id'])
+    if results is None:
+        return False
+    if isinstance(results.get('correlation_analysis'), dict) and \
+            not restore_stored_tiles(stored['task_id'], results['correlation_analysis']):
+        logger.info(f"Tiled matrix of stored task {stored['task_id']} is gone; recomputing")
+        return False
+
+    profile = profile_store.load(stored['task_id'])
+    if profile is not None:
+        profile_store.save(task_id, {**profile, 'created_at': datetime.now().isoformat()})
+
+    if isinstance(results.get('correlation_analysis'), dict):
+        def attach_plot(path, error):
+            socketio.emit('plot_ready', {
+                'task_id': task_id,
+                'kind': 'correlation_matrix',
+                'path': path,
+                'error': str(error) if error else None
+            }, room=task_id)
+
+        # The stored heatmap may have been collected since; it is redrawn at the stored path
+        correlation_analyzer.restore_heatmap(results['correlation_analysis'], renderer=plot_renderer,
+                                             on_plot=attach_plot)
+
+    logger.info(f"Reusing stored results of task {stored['task_id']} for task {task_id}")
+    update_task_status(task_id, {
+        'status': 'Complete',
+        'progress': 100,
+        'results': results,
+        'stored_task_id': stored['task_id']
+    })
+    emit_progress(task_id)
+    return True
+
+def stored_tile_files(correlation_results: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """Files of a tiled correlation matrix to keep with stored results, which outlive the tile cache."""
+    tiles = correlation_results.get('matrix_tiles')
+    if not tiles:
+        return None
+    return {f"tiles.{ext}": path for ext, path in correlation_analyzer.matrix_tiles.files(tiles['key']).items()}
+
+def restore_stored_tiles(stored_task_id: str, correlation_results: Dict[str, Any]) -> bool:
+    """Make the tiled matrix of stored results servable again.
+
+    Returns:
+        False if the results are tiled and neither the tile cache nor the store still has the matrix
+    """
+    tiles = correlation_results.get('matrix_tiles')
+    if not tiles:
+        return True
+    files = {ext: results_store.file_path(stored_task_id, f"tiles.{ext}") for ext in ('npy', 'json')}
+    return correlation_analyzer.matrix_tiles.restore(tiles['key'], files)
+
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection."""
@@ -821,6 +1133,9 @@ def handle_start_processing(data):
                 logger.warning(f"No config found for task {task_id}")  # Add debug log
                 raise ValueError('No configuration found for task')
         
+        # Task events sent to the task's room (plot_ready) reach the client that started it
+        join_room(task_id)
+
         # Start background task
         logger.info(f"Starting background task for {task_id}")  # Add debug log
         socketio.start_background_task(process_data_task, task_id, task['config'])
@@ -842,8 +1157,8 @@ def process_multiple_files_task(task_id: str, file_paths: List[str]) -> None:
             'message': 'Analyzing correlations between files'
         })
         
-        # Analyze correlations
-        results = multi_correlation_analyzer.analyze_cross_file_correlations(file_paths)
+        # Analyze correlations; the heatmap is drawn by a rendering worker and comes with the results
+        results = multi_correlation_analyzer.analyze_cross_file_correlations(file_paths, renderer=plot_renderer)
         
         if 'error' in results:
             raise ValueError(results['error'])
@@ -930,6 +1245,9 @@ def handle_process_data(data):
             'progress': 0
         })
 
+        # Task events sent to the task's room (plot_ready) reach the client that started it
+        join_room(task_id)
+
         # Start processing in background thread
         Thread(target=process_data_task, args=(task_id, task)).start()
         
@@ -0,0 +1,248 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Iterable, Optional
+from src.logger import setup_logger
+from src.sketches import HyperLogLog, TDigest, MisraGries, StreamingMoments
+from src.range_validation import RangeValidator
+from src.categorical_profile import CategoricalProfiler, categorical_columns
+
+logger = setup_logger()
+
+DEFAULT_APPROXIMATE_SETTINGS = {
+    'chunk_rows': 100000,
+    'hll_precision': 14,
+    'tdigest_compression': 200,
+    'top_k': 20,
+    'sample_size': 10000,
+    'seed': 42
+}
+
+
+class ApproximateValidator:
+    """Single-pass, sketch-based validation for exploratory runs.
+
+    Chunks are consumed once; memory is bounded by the sketches rather than the
+    data. Exact counters are kept where they are as cheap as a sketch (missing,
+    negative and out-of-range counts); uniqueness, quartiles, top-k values and
+    higher moments are estimated and reported with their error bounds.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None, z_score_threshold: float = 3,
+                 iqr_threshold: float = 1.5, range_config: Optional[Dict[str, Any]] = None,
+                 missing_threshold: float = 0.2, categorical_settings: Optional[Dict[str, Any]] = None):
+        """Initialize ApproximateValidator.
+
+        Args:
+            settings: Overrides for ``DEFAULT_APPROXIMATE_SETTINGS``
+            z_score_threshold: Z-score outlier threshold
+            iqr_threshold: IQR multiplier for outlier bounds
+            range_config: Range validation config ({'column': {'min': x, 'max': y}})
+            missing_threshold: Fraction of missing values that flags a column
+            categorical_settings: Overrides for the categorical profiler settings
+        """
+        self.logger = logger
+        self.settings = {**DEFAULT_APPROXIMATE_SETTINGS, **(settings or {})}
+        self.z_score_threshold = z_score_threshold
+        self.iqr_threshold = iqr_threshold
+        self.range_validator = RangeValidator(range_config, track_rows=False)
+        self.missing_threshold = missing_threshold
+
+        self.rows = 0
+        self.columns = None
+        self.dtypes = {}
+        self.missing = {}
+        self.negative = {}
+        self.distinct = {}
+        self.digests = {}
+        self.moments = {}
+        self.heavy_hitters = {}
+        self.categorical = CategoricalProfiler({
+            'hll_precision': self.settings['hll_precision'], 'top_k': self.settings['top_k'],
+            **(categorical_settings or {})
+        })
+        self.row_distinct = HyperLogLog(self.settings['hll_precision'])
+
+    def validate(self, chunks: Iterable[pd.DataFrame]) -> Dict[str, Any]:
+        """Consume all chunks and return validation results."""
+        for chunk in chunks:
+            self.update(chunk)
+        return self.results()
+
+    @staticmethod
+    def iter_chunks(df: pd.DataFrame, chunk_rows: int) -> Iterable[pd.DataFrame]:
+        """Yield row slices of an in-memory DataFrame."""
+        for start in range(0, max(len(df), 1), chunk_rows):
+            yield df.iloc[start:start + chunk_rows]
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Update every sketch with one chunk of rows."""
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            self.dtypes = chunk.dtypes.astype(str).to_dict()
+            categorical = set(categorical_columns(chunk))
+            for col in self.columns:
+                self.missing[col] = 0
+                self.distinct[col] = HyperLogLog(self.settings['hll_precision'])
+                if pd.api.types.is_numeric_dtype(chunk[col]):
+                    self.negative[col] = 0
+                    self.digests[col] = TDigest(self.settings['tdigest_compression'])
+                    self.moments[col] = StreamingMoments(self.settings['sample_size'], self.settings['seed'])
+                elif col not in categorical:
+                    self.heavy_hitters[col] = MisraGries(self.settings['top_k'])
+
+        self.rows += len(chunk)
+        self.row_distinct.update(chunk)
+        self.range_validator.update(chunk)
+        self.categorical.update(chunk)
+
+        missing = chunk.isnull().sum()
+        for col in self.columns:
+            series = chunk[col]
+            self.missing[col] += int(missing[col])
+            # pandas' is_unique treats missing values as equal, so hash them too
+            self.distinct[col].update(series)
+
+            if col in self.digests:
+                values = series.to_numpy(dtype=float, na_value=np.nan)
+                self.negative[col] += int((values < 0).sum())
+                self.digests[col].update(values)
+                self.moments[col].update(values)
+            elif col in self.heavy_hitters:
+                self.heavy_hitters[col].update(series)
+
+    def results(self) -> Dict[str, Any]:
+        """Build results in the same layout as exact validation, with error bounds."""
+        if self.columns is None:
+            return {'mode': 'approximate', 'basic_validation': {}, 'advanced_validation': {}}
+
+        rows = max(self.rows, 1)
+        missing_pct = {col: count / rows * 100 for col, count in self.missing.items()}
+        distinct_rows = self.row_distinct.result()
+
+        basic_validation = {
+            'missing_values': {
+                'total_missing': dict(self.missing),
+                'missing_percentages': missing_pct,
+                'columns_above_threshold': {
+                    col: pct for col, pct in missing_pct.items() if pct > self.missing_threshold * 100
+                }
+            },
+            'negative_values': {col: count for col, count in self.negative.items() if count > 0},
+            'duplicates': {
+                'total_duplicates': int(round(max(self.rows - distinct_rows['estimate'], 0))),
+                'error_bound': distinct_rows['error_bound'],
+                'duplicate_rows': []
+            },
+            'data_types': dict(self.dtypes),
+            'data_type_validation': "No expected data types provided",
+            'range_validation': self.range_validator.results()[0],
+            'custom_rule_validation': "Custom rules are not evaluated in approximate mode"
+        }
+
+        outliers = {col: self._outliers(col) for col in self.digests}
+        categorical_profile = self.categorical.results()
+        top_k = {col: sketch.top() for col, sketch in self.heavy_hitters.items()}
+        top_k.update({col: profile['top_values'] for col, profile in categorical_profile.items()})
+        advanced_validation = {
+            'outliers': outliers,
+            'quality_scores': self._quality_scores(outliers),
+            'distribution_analysis': {col: self._distribution(col) for col in self.digests if self.digests[col].count >= 3},
+            'categorical_top_k': {col: top_k[col] for col in self.columns if col in top_k},
+            'categorical_profile': categorical_profile,
+            'multicollinearity': {'message': 'Multicollinearity is not computed in approximate mode'}
+        }
+
+        return {
+            'mode': 'approximate',
+            'basic_validation': basic_validation,
+            'advanced_validation': advanced_validation
+        }
+
+    def _outliers(self, col: str) -> Dict[str, Any]:
+        """Estimate outlier counts from the t-digest CDF."""
+        digest = self.digests[col]
+        moments = self.moments[col].result()
+        n = digest.count
+        if n == 0:
+            return {'z_score_outliers': 0, 'iqr_outliers': 0, 'error_bounds': {}}
+
+        q1, q3 = digest.quantile_result(0.25), digest.quantile_result(0.75)
+        iqr = q3['estimate'] - q1['estimate']
+        iqr_low = q1['estimate'] - self.iqr_threshold * iqr
+        iqr_high = q3['estimate'] + self.iqr_threshold * iqr
+
+        mean, std = moments['mean']['estimate'], moments['std']['estimate']
+        z_low = mean - self.z_score_threshold * std
+        z_high = mean + self.z_score_threshold * std
+
+        tails = digest.cdf(np.array([iqr_low, iqr_high, z_low, z_high]))
+        iqr_fraction = tails[0] + (1 - tails[1])
+        z_fraction = tails[2] + (1 - tails[3]) if std > 0 else 0.0
+        # Each tail estimate is off by at most the rank error of the extreme centroids
+        count_error = (digest.rank_error(0.0) + digest.rank_error(1.0)) * n
+
+        return {
+            'z_score_outliers': int(round(z_fraction * n)),
+            'iqr_outliers': int(round(iqr_fraction * n)),
+            'quartiles': {'q1': q1, 'q3': q3},
+            'error_bounds': {
+                'z_score_outliers': float(count_error),
+                'iqr_outliers': float(count_error)
+            }
+        }
+
+    def _quality_scores(self, outliers: Dict[str, Any]) -> Dict[str, Any]:
+        scores = {}
+        for col in self.columns:
+            distinct = self.distinct[col].result()
+            # Unique if the distinct estimate cannot be told apart from the row count
+            is_unique = distinct['estimate'] + distinct['error_bound'] >= self.rows
+
+            score = 100 - self.missing[col] / max(self.rows, 1) * 30
+            if not is_unique:
+                score -= 10
+            if col in outliers and self.digests[col].count:
+                score -= outliers[col]['z_score_outliers'] / self.digests[col].count * 20
+            score = max(0, min(100, score))
+
+            scores[col] = {
+                'score': round(score, 2),
+                'grade': _grade(score),
+                'is_unique': bool(is_unique),
+                'distinct_count': distinct
+            }
+
+        overall = round(sum(entry['score'] for entry in scores.values()) / len(scores), 2)
+        return {
+            'column_scores': scores,
+            'overall_score': overall,
+            'overall_grade': _grade(overall)
+        }
+
+    def _distribution(self, col: str) -> Dict[str, Any]:
+        moments = self.moments[col].result()
+        median = self.digests[col].quantile_result(0.5)
+        return {
+            'mean': moments['mean']['estimate'],
+            'median': median['estimate'],
+            'std': moments['std']['estimate'],
+            'skewness': moments['skewness']['estimate'],
+            'kurtosis': moments['kurtosis']['estimate'],
+            'error_bounds': {
+                'mean': moments['mean']['error_bound'],
+                'median': median['error_bound'],
+                'std': moments['std']['error_bound'],
+                'skewness': moments['skewness']['error_bound'],
+                'kurtosis': moments['kurtosis']['error_bound']
+            },
+            'sample_size': moments['sample_size'],
+            'normality_tests': 'Normality tests are not run in approximate mode'
+        }
+
+
+def _grade(score: float) -> str:
+    if score >= 90: return 'A'
+    elif score >= 80: return 'B'
+    elif score >= 70: return 'C'
+    elif score >= 60: return 'D'
+    else: return 'F'
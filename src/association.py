@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+from src.logger import setup_logger
+from src.categorical_profile import categorical_columns
+from src.correlation_engine import map_pairs
+
+logger = setup_logger()
+
+DEFAULT_ASSOCIATION_SETTINGS = {
+    'max_categories': 100,           # Columns with more distinct values (IDs, addresses) are skipped
+    'threshold': 0.5,                # Associations reported as strong from this value
+    'n_jobs': -1,
+    'parallel_min_work': 5_000_000   # Pair-rows below which pairs are computed in-process
+}
+
+
+def encode(series: pd.Series) -> Tuple[np.ndarray, int]:
+    """Integer category codes of a column (-1 for missing) and the number of categories."""
+    codes, categories = pd.factorize(series, sort=False)
+    return codes.astype(np.int64, copy=False), len(categories)
+
+
+def cramers_v(x: np.ndarray, x_size: int, y: np.ndarray, y_size: int) -> float:
+    """Bias-corrected Cramér's V (Bergsma, 2013) of two coded columns.
+
+    The contingency table is one ``bincount`` of the combined codes over the
+    rows where both columns are present; categories absent from those rows
+    are dropped. NaN when either column has a single category there.
+    """
+    valid = (x >= 0) & (y >= 0)
+    n = int(valid.sum())
+    if n < 2:
+        return np.nan
+    table = np.bincount(x[valid] * y_size + y[valid], minlength=x_size * y_size).reshape(x_size, y_size)
+    rows, cols = table.sum(axis=1), table.sum(axis=0)
+    table = table[rows > 0][:, cols > 0].astype(float)
+    rows, cols = rows[rows > 0], cols[cols > 0]
+    r, k = len(rows), len(cols)
+    if r < 2 or k < 2:
+        return np.nan
+    phi2 = (table * table / np.outer(rows, cols)).sum() - 1.0  # chi-squared / n
+    phi2 = max(0.0, phi2 - (k - 1) * (r - 1) / (n - 1))
+    r_corrected = r - (r - 1) ** 2 / (n - 1)
+    k_corrected = k - (k - 1) ** 2 / (n - 1)
+    denominator = min(k_corrected - 1, r_corrected - 1)
+    if denominator <= 0:
+        return np.nan
+    return float(min(1.0, np.sqrt(phi2 / denominator)))
+
+
+def correlation_ratio(codes: np.ndarray, size: int, values: np.ndarray) -> float:
+    """Correlation ratio η of a numeric column on a coded categorical column.
+
+    Per-category counts and sums are ``bincount``s over the rows where both
+    are present. NaN when the numeric column is constant there.
+    """
+    valid = (codes >= 0) & ~np.isnan(values)
+    if valid.sum() < 2:
+        return np.nan
+    codes, values = codes[valid], values[valid]
+    centered = values - values.mean()
+    total = float(centered @ centered)
+    if total <= 0:
+        return np.nan
+    counts = np.bincount(codes, minlength=size)
+    sums = np.bincount(codes, weights=centered, minlength=size)
+    present = counts > 0
+    between = float((sums[present] ** 2 / counts[present]).sum())
+    return float(min(1.0, np.sqrt(between / total)))
+
+
+def association_matrix(df: pd.DataFrame, numeric_columns: Optional[List[str]] = None,
+                       settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Associations involving the categorical columns of ``df``.
+
+    Categorical columns are coded once; every pair is then computed from the
+    integer codes, spread over ``n_jobs`` workers for large inputs.
+
+    Args:
+        df: DataFrame to analyze
+        numeric_columns: Columns used for the correlation ratio; defaults to
+            the numeric columns of ``df``
+        settings: Overrides for ``DEFAULT_ASSOCIATION_SETTINGS``
+
+    Returns:
+        Dictionary with ``cramers_v`` (categorical x categorical),
+        ``correlation_ratio`` (categorical column -> numeric column -> η),
+        ``strong_associations`` (pairs from ``threshold``, strongest first)
+        and ``skipped_columns`` (categorical columns over ``max_categories``,
+        with their cardinality)
+    """
+    settings = {**DEFAULT_ASSOCIATION_SETTINGS, **(settings or {})}
+    if numeric_columns is None:
+        numeric_columns = list(df.select_dtypes(include=[np.number]).columns)
+
+    columns, coded, sizes, skipped = [], [], [], {}
+    for column in categorical_columns(df):
+        codes, size = encode(df[column])
+        if size > settings['max_categories']:
+            skipped[column] = size
+            continue
+        columns.append(column)
+        coded.append(codes)
+        sizes.append(size)
+    if skipped:
+        logger.info(f"Skipping high-cardinality columns for associations: {skipped}")
+
+    codes = np.column_stack(coded) if coded else np.zeros((len(df), 0), dtype=np.int64)
+    values = df[numeric_columns].to_numpy(dtype=float) if numeric_columns else np.zeros((len(df), 0))
+    sizes = np.array(sizes, dtype=np.int64)
+    data = (codes, sizes, values)
+
+    c = len(columns)
+    cramers = np.full((c, c), np.nan)
+    np.fill_diagonal(cramers, np.where(sizes > 1, 1.0, np.nan))
+    pairs = [(i, j) for i in range(c) for j in range(i + 1, c)]
+    for (i, j), value in zip(pairs, map_pairs(_cramers_pairs, data, pairs, settings)):
+        cramers[i, j] = cramers[j, i] = value
+
+    ratio = np.full((c, len(numeric_columns)), np.nan)
+    pairs = [(i, j) for i in range(c) for j in range(len(numeric_columns))]
+    for (i, j), value in zip(pairs, map_pairs(_ratio_pairs, data, pairs, settings)):
+        ratio[i, j] = value
+
+    cramers = pd.DataFrame(cramers, index=columns, columns=columns)
+    ratio = pd.DataFrame(ratio, index=columns, columns=numeric_columns)
+    return {
+        'cramers_v': cramers.to_dict(),
+        'correlation_ratio': ratio.T.to_dict(),
+        'strong_associations': _strong(cramers, ratio, settings['threshold']),
+        'skipped_columns': skipped
+    }
+
+
+def _strong(cramers: pd.DataFrame, ratio: pd.DataFrame, threshold: float) -> List[Dict[str, Any]]:
+    found = []
+    for measure, matrix, upper in (('cramers_v', cramers, True), ('correlation_ratio', ratio, False)):
+        values = matrix.to_numpy()
+        with np.errstate(invalid='ignore'):
+            mask = values >= threshold
+        if upper:
+            mask &= np.triu(np.ones(values.shape, dtype=bool), k=1)
+        for i, j in zip(*np.nonzero(mask)):
+            found.append({'column1': matrix.index[i], 'column2': matrix.columns[j],
+                          'measure': measure, 'association': float(values[i, j])})
+    return sorted(found, key=lambda item: -item['association'])
+
+
+def _cramers_pairs(data: Tuple[np.ndarray, np.ndarray, np.ndarray], pairs: List[Tuple[int, int]]) -> List[float]:
+    codes, sizes, _ = data
+    return [cramers_v(codes[:, i], int(sizes[i]), codes[:, j], int(sizes[j])) for i, j in pairs]
+
+
+def _ratio_pairs(data: Tuple[np.ndarray, np.ndarray, np.ndarray], pairs: List[Tuple[int, int]]) -> List[float]:
+    codes, sizes, values = data
+    return [correlation_ratio(codes[:, i], int(sizes[i]), values[:, j]) for i, j in pairs]
@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Dict, Any, Iterable, List, Optional
+from src.logger import setup_logger
+from src.sketches import HyperLogLog, MisraGries, hash_values
+
+logger = setup_logger()
+
+DEFAULT_CATEGORICAL_SETTINGS = {
+    'chunk_rows': 100000,
+    'hll_precision': 14,
+    'top_k': 20,
+    'sample_size': 10000  # Distinct values kept with exact counts; exact profile below this cardinality
+}
+
+
+def categorical_columns(df: pd.DataFrame) -> List[str]:
+    """Columns profiled as categorical: object, string, category and boolean dtypes."""
+    return [
+        column for column in df.columns
+        if isinstance(df[column].dtype, pd.CategoricalDtype)
+        or pd.api.types.is_object_dtype(df[column])
+        or pd.api.types.is_string_dtype(df[column])
+        or pd.api.types.is_bool_dtype(df[column])
+    ]
+
+
+def to_arrow_strings(series: pd.Series) -> pa.Array:
+    """Convert a column to an Arrow string array (missing values become nulls)."""
+    try:
+        array = pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed Python objects: compare them by their string form
+        array = pa.array(series.astype('string'), from_pandas=True)
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        array = pc.cast(array, pa.string())
+    return array
+
+
+class CategoricalSketch:
+    """Bounded-memory profile of one categorical column.
+
+    Each chunk is reduced to exact value counts with Arrow; the counts feed a
+    HyperLogLog (on the hashes of the distinct values only), a Misra-Gries
+    heavy-hitter summary and a distinct-value sample: the values with the
+    ``sample_size`` smallest hashes. A value that is in the sample at the end
+    has been in it since it first appeared, so its count is exact. While the
+    column has at most ``sample_size`` distinct values the sample holds all of
+    them and cardinality, top values and entropy are exact.
+    """
+
+    def __init__(self, hll_precision: int = 14, top_k: int = 20, sample_size: int = 10000):
+        self.distinct = HyperLogLog(hll_precision)
+        self.heavy_hitters = MisraGries(top_k)
+        self.sample_size = sample_size
+        self.sample_counts = pd.Series(dtype='int64')   # value hash -> exact count
+        self.sample_values = pd.Series(dtype=object)    # value hash -> value
+        self.threshold = np.iinfo(np.uint64).max        # Largest hash still sampled
+        self.sampled = False
+        self.count = 0
+        self.missing = 0
+        self.length_min = None
+        self.length_max = None
+        self.length_sum = 0.0
+        self.length_sum_sq = 0.0
+
+    def update(self, array: pa.Array) -> 'CategoricalSketch':
+        """Add a chunk given as an Arrow string array."""
+        self.missing += array.null_count
+        values = array.drop_null()
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+
+        lengths = pc.cast(pc.utf8_length(values), pa.float64())
+        bounds = pc.min_max(lengths).as_py()
+        self._add_lengths(int(bounds['min']), int(bounds['max']),
+                          pc.sum(lengths).as_py(), pc.sum(pc.multiply(lengths, lengths)).as_py())
+
+        value_counts = pc.value_counts(values)
+        uniques = value_counts.field('values').to_numpy(zero_copy_only=False)
+        counts = value_counts.field('counts').to_numpy().astype('int64')
+        hashes = hash_values(uniques)
+        self.distinct.update_hashes(hashes)
+        self.heavy_hitters.update_counts(pd.Series(counts, index=uniques))
+        keep = hashes <= self.threshold
+        self._add_sample(pd.Series(counts[keep], index=hashes[keep]), pd.Series(uniques[keep], index=hashes[keep]))
+        return self
+
+    def merge(self, other: 'CategoricalSketch') -> 'CategoricalSketch':
+        """Merge another sketch with the same settings into this one."""
+        self.distinct.merge(other.distinct)
+        self.heavy_hitters.merge(other.heavy_hitters)
+        self.count += other.count
+        self.missing += other.missing
+        if other.length_min is not None:
+            self._add_lengths(other.length_min, other.length_max, other.length_sum, other.length_sum_sq)
+        self.sampled = self.sampled or other.sampled
+        self.threshold = min(self.threshold, other.threshold)
+        self._add_sample(other.sample_counts, other.sample_values)
+        return self
+
+    def _add_lengths(self, minimum: int, maximum: int, total: float, total_sq: float) -> None:
+        self.length_min = minimum if self.length_min is None else min(self.length_min, minimum)
+        self.length_max = maximum if self.length_max is None else max(self.length_max, maximum)
+        self.length_sum += total
+        self.length_sum_sq += total_sq
+
+    def _add_sample(self, counts: pd.Series, values: pd.Series) -> None:
+        counts = counts[counts.index <= self.threshold]
+        if len(self.sample_counts):
+            counts = self.sample_counts.add(counts, fill_value=0)
+            values = self.sample_values.combine_first(values)
+        counts = counts.astype('int64').sort_index()
+        if len(counts) > self.sample_size:
+            counts = counts.iloc[:self.sample_size]
+            self.threshold = counts.index[-1]
+            self.sampled = True
+        self.sample_counts = counts
+        self.sample_values = values.reindex(counts.index)
+
+    def result(self) -> Dict[str, Any]:
+        """Cardinality, top values, string-length stats and entropy with their error bounds."""
+        if self.sampled:
+            distinct = {key: float(value) for key, value in self.distinct.result().items()}
+            top_values = self.heavy_hitters.top()
+            entropy = self._estimated_entropy(distinct['estimate'])
+        else:
+            counts = pd.Series(self.sample_counts.to_numpy(), index=self.sample_values.to_numpy())
+            counts = counts.sort_values(ascending=False, kind='stable')
+            distinct = {'estimate': float(len(counts)), 'error_bound': 0.0}
+            top_values = [
+                {'value': value, 'count': int(count), 'error_bound': 0}
+                for value, count in counts.head(self.heavy_hitters.k).items()
+            ]
+            entropy = _entropy(counts.to_numpy(), self.count)
+
+        mean_length = self.length_sum / self.count if self.count else float('nan')
+        variance = self.length_sum_sq / self.count - mean_length ** 2 if self.count else float('nan')
+        n_distinct = max(distinct['estimate'], 1.0)
+        return {
+            'count': self.count,
+            'missing': self.missing,
+            'distinct_count': distinct,
+            'top_values': top_values,
+            'string_length': {
+                'min': self.length_min,
+                'max': self.length_max,
+                'mean': float(mean_length),
+                'std': float(np.sqrt(max(variance, 0.0))) if self.count else float('nan')
+            },
+            'entropy': {
+                'estimate': entropy,
+                'normalized': min(entropy / float(np.log2(n_distinct)), 1.0) if n_distinct > 1 else 0.0,
+                'exact': not self.sampled
+            }
+        }
+
+    def _estimated_entropy(self, distinct: float) -> float:
+        """Entropy of the heavy hitters plus the sampled tail scaled to the estimated distinct count."""
+        heavy = self.heavy_hitters.counts
+        heavy_hashes = hash_values(heavy.index.to_numpy(dtype=object))
+        in_sample = np.isin(heavy_hashes, self.sample_counts.index.to_numpy())
+        tail = self.sample_counts[~self.sample_counts.index.isin(heavy_hashes)].to_numpy()
+        tail_distinct = max(distinct - len(heavy), len(tail))
+        scale = tail_distinct / len(tail) if len(tail) else 0.0
+
+        # Heavy hitters in the sample have exact counts. The others are undercounted by at
+        # most the Misra-Gries error; credit them the mass the tail estimate leaves over.
+        heavy_counts = np.where(in_sample, self.sample_counts.reindex(heavy_hashes).to_numpy(), heavy.to_numpy())
+        unaccounted = max(self.count - scale * tail.sum() - heavy_counts.sum(), 0.0)
+        undercounted = int((~in_sample).sum())
+        if undercounted:
+            heavy_counts = np.where(
+                in_sample, heavy_counts,
+                heavy_counts + min(self.heavy_hitters.error, unaccounted / undercounted)
+            )
+        return _entropy(heavy_counts, self.count) + scale * _entropy(tail, self.count)
+
+
+def _entropy(counts: np.ndarray, total: int) -> float:
+    """Shannon entropy in bits contributed by values with the given counts out of ``total``."""
+    if total == 0:
+        return 0.0
+    probabilities = np.asarray(counts, dtype=float) / total
+    probabilities = probabilities[probabilities > 0]
+    return float(-(probabilities * np.log2(probabilities)).sum())
+
+
+class CategoricalProfiler:
+    """Streaming profile of the categorical columns of a DataFrame.
+
+    Chunks are converted to Arrow string arrays one at a time and reduced with
+    Arrow kernels, so memory is bounded by the chunk size and the sketches
+    rather than by the number of distinct values.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """Initialize CategoricalProfiler.
+
+        Args:
+            settings: Overrides for ``DEFAULT_CATEGORICAL_SETTINGS``
+        """
+        self.logger = logger
+        self.settings = {**DEFAULT_CATEGORICAL_SETTINGS, **(settings or {})}
+        self.sketches = {}
+
+    def profile(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Profile categorical columns of an in-memory DataFrame chunk by chunk.
+
+        Args:
+            df: DataFrame to profile
+            columns: Columns to profile; defaults to ``categorical_columns(df)``
+
+        Returns:
+            Dictionary of {column: profile}
+        """
+        columns = categorical_columns(df) if columns is None else columns
+        chunk_rows = self.settings['chunk_rows']
+        for start in range(0, len(df), chunk_rows):
+            self.update(df.iloc[start:start + chunk_rows], columns)
+        return self.results()
+
+    def profile_stream(self, chunks: Iterable[pd.DataFrame]) -> Dict[str, Dict[str, Any]]:
+        """Consume all chunks and return the profiles."""
+        for chunk in chunks:
+            self.update(chunk)
+        return self.results()
+
+    def update(self, chunk: pd.DataFrame, columns: Optional[List[str]] = None) -> None:
+        """Update the sketches of every categorical column (or of ``columns``) with one chunk."""
+        if not self.sketches:
+            for column in categorical_columns(chunk) if columns is None else columns:
+                self.sketches[column] = CategoricalSketch(
+                    self.settings['hll_precision'], self.settings['top_k'], self.settings['sample_size']
+                )
+        for column, sketch in self.sketches.items():
+            sketch.update(to_arrow_strings(chunk[column]))
+
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        return {column: sketch.result() for column, sketch in self.sketches.items()}
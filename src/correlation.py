@@ -1,26 +1,191 @@
 import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib
-matplotlib.use('Agg')  # Set non-interactive backend before importing pyplot
-import matplotlib.pyplot as plt
 from src.logger import setup_logger
+from src.stats_context import stats_for
+from src.association import DEFAULT_ASSOCIATION_SETTINGS, association_matrix
+from src.correlation_pairs import correlated_pairs, top_pairs
+from src.correlation_engine import (
+    CORRELATION_METHODS, DEFAULT_CORRELATION_SETTINGS, column_shift, moment_sums, pearson_from_sums
+)
+from src.plot_renderer import render_heatmap
+from src.plot_cache import PlotCache
+from src.matrix_tiles import MatrixTiles
+from src.result_cache import ResultCache
+from src.feature_importance import DEFAULT_IMPORTANCE_SETTINGS, target_importance
 import yaml
-import os
+from typing import Any, Dict, Iterable, List, Optional
 
 logger = setup_logger()
 
+
+class CorrelationAccumulator:
+    """Mergeable streaming Pearson correlation from sufficient statistics.
+
+    Keeps, for every pair of columns over the rows where both are present, the
+    row count and the sums of x, x squared and x * y: O(p^2) memory whatever
+    the number of rows. Chunks are added with ``update``; states built on
+    other chunks, processes or files are combined with ``merge``, and a saved
+    state can be loaded and updated with new rows without rescanning the old
+    ones. The result equals the pairwise-complete Pearson matrix of all rows
+    seen, as ``DataFrame.corr`` would compute it.
+
+    Sums are kept around a per-column shift taken from the first chunk, which
+    keeps them well conditioned; merging re-expresses the other state's sums
+    around this one's shift.
+    """
+
+    def __init__(self, columns: Optional[List[str]] = None, settings: Optional[Dict[str, Any]] = None):
+        """Initialize CorrelationAccumulator.
+
+        Args:
+            columns: Columns to correlate; defaults to the numeric columns of
+                the first chunk. Columns that first appear in a merged state
+                are added.
+            settings: Overrides for ``DEFAULT_CORRELATION_SETTINGS``
+        """
+        self.settings = {**DEFAULT_CORRELATION_SETTINGS, **(settings or {})}
+        self.columns = list(columns) if columns is not None else None
+        self.rows = 0
+        self.shift = None
+        self.sums = None
+
+    def _start(self, columns: List[str], shift: np.ndarray) -> None:
+        p = len(columns)
+        self.columns = list(columns)
+        self.shift = shift.astype(float)
+        self.sums = tuple(np.zeros((p, p)) for _ in range(4))
+
+    def update(self, chunk: pd.DataFrame) -> 'CorrelationAccumulator':
+        """Add a chunk of rows; columns missing from the chunk count as missing values."""
+        if self.columns is None:
+            self.columns = list(chunk.select_dtypes(include=[np.number]).columns)
+        values = chunk.reindex(columns=self.columns).to_numpy(dtype=float)
+        if len(values) == 0:
+            return self
+        if self.sums is None:
+            self._start(self.columns, column_shift(values))
+        self.sums = moment_sums(values, self.shift, np.dtype(self.settings['dtype']), self.sums)
+        self.rows += len(values)
+        return self
+
+    def merge(self, other: 'CorrelationAccumulator') -> 'CorrelationAccumulator':
+        """Merge another accumulator into this one."""
+        if other.sums is None:
+            if self.columns is None:
+                self.columns = other.columns
+            return self
+        if self.sums is None:
+            columns = self.columns or other.columns
+            shift = pd.Series(other.shift, index=other.columns).reindex(columns).fillna(0.0)
+            self._start(columns, shift.to_numpy())
+        self._add_columns(other)
+
+        # Positions of the other state's columns in this one, and its sums around this shift
+        index = np.array([self.columns.index(column) for column in other.columns], dtype=int)
+        delta = (other.shift - self.shift[index])[:, None]
+        count, sx, sxx, sxy = other.sums
+        sxy = sxy + sx * delta.T + delta * sx.T + count * delta * delta.T
+        sxx = sxx + 2 * delta * sx + count * delta ** 2
+        sx = sx + count * delta
+        block = np.ix_(index, index)
+        for total, part in zip(self.sums, (count, sx, sxx, sxy)):
+            total[block] += part
+        self.rows += other.rows
+        return self
+
+    def _add_columns(self, other: 'CorrelationAccumulator') -> None:
+        new = [column for column in other.columns if column not in self.columns]
+        if not new:
+            return
+        # New columns have no shared rows yet; their shift is taken from the other state
+        shift = np.concatenate([self.shift, other.shift[[other.columns.index(column) for column in new]]])
+        p, old = len(self.columns) + len(new), len(self.columns)
+        sums = []
+        for total in self.sums:
+            grown = np.zeros((p, p))
+            grown[:old, :old] = total
+            sums.append(grown)
+        self.columns, self.shift, self.sums = self.columns + new, shift, tuple(sums)
+
+    def result(self) -> pd.DataFrame:
+        """Pearson correlation matrix of all rows added so far."""
+        columns = self.columns or []
+        if self.sums is None:
+            return pd.DataFrame(np.nan, index=columns, columns=columns)
+        return pd.DataFrame(pearson_from_sums(*self.sums), index=columns, columns=columns)
+
+    def save(self, path: str) -> None:
+        """Write the state to an ``.npz`` file for a later ``load``."""
+        p = len(self.columns or [])
+        count, sx, sxx, sxy = self.sums if self.sums is not None else tuple(np.zeros((p, p)) for _ in range(4))
+        np.savez(path, columns=np.array(self.columns or [], dtype=str), rows=self.rows,
+                 shift=self.shift if self.shift is not None else np.zeros(p),
+                 count=count, sx=sx, sxx=sxx, sxy=sxy)
+
+    @classmethod
+    def load(cls, path: str, settings: Optional[Dict[str, Any]] = None) -> 'CorrelationAccumulator':
+        """Read a state written by ``save``."""
+        with np.load(path) as state:
+            accumulator = cls(state['columns'].tolist(), settings)
+            accumulator.rows = int(state['rows'])
+            if accumulator.rows:
+                accumulator.shift = state['shift']
+                accumulator.sums = tuple(state[name].copy() for name in ('count', 'sx', 'sxx', 'sxy'))
+        return accumulator
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame], columns: Optional[List[str]] = None,
+                    settings: Optional[Dict[str, Any]] = None) -> 'CorrelationAccumulator':
+        """Accumulate an iterable of chunks, e.g. ``pd.read_csv(path, chunksize=...)``."""
+        accumulator = cls(columns, settings)
+        for chunk in chunks:
+            accumulator.update(chunk)
+        return accumulator
+
+
 class CorrelationAnalyzer:
     def __init__(self):
         self.logger = logger
         with open('config.yaml', 'r') as f:
             config = yaml.safe_load(f)
         self.correlation_threshold = config['validation']['correlation_threshold']
+        self.correlation_settings = {**DEFAULT_CORRELATION_SETTINGS, **config['validation'].get('correlation', {})}
+        self.association_settings = {**DEFAULT_ASSOCIATION_SETTINGS, **config['validation'].get('association', {})}
+        self.plot_cache = PlotCache(config.get('plots', {}).get('cache'))
+        self.matrix_tiles = MatrixTiles(config.get('plots', {}).get('tiles'))
+        self.importance_settings = {**DEFAULT_IMPORTANCE_SETTINGS, **config['validation'].get('feature_importance', {})}
+        # Importance results per (dataset hash, target, settings), so switching targets back is instant
+        self.importance_cache = ResultCache(cache_dir=None, max_entries=self.importance_settings['cache_entries'])
+
+    def analyze(self, df, stats=None, renderer=None, on_plot=None, method=None):
+        """Analyze correlations in the dataset.
 
-    def analyze(self, df):
-        """Analyze correlations in the dataset."""
+        Args:
+            df: DataFrame to analyze
+            stats: StatsContext whose correlation matrix is reused when it covers ``df``
+            renderer: PlotRenderer that draws the heatmap in the background; without
+                one the heatmap is drawn before returning
+            on_plot: Called with (path, error) when a background heatmap is done
+            method: 'pearson', 'spearman' or 'kendall'; defaults to the configured method
+
+        Returns:
+            Dictionary of correlations and of ``associations`` involving
+            categorical columns (see ``association_matrix``). Matrices wider
+            than the tile settings' ``wide_columns`` come as ``matrix_tiles``
+            metadata instead of ``correlations`` and a heatmap. With a
+            renderer, ``correlation_matrix_path`` is filled in and
+            ``correlation_matrix_status`` moves from 'pending' to 'ready' or
+            'failed' when the heatmap is done
+        """
+        method = method or self.correlation_settings['method']
+        if method not in CORRELATION_METHODS:
+            raise ValueError(f"Unknown correlation method '{method}', expected one of {CORRELATION_METHODS}")
+        stats = stats_for(df, stats, self.correlation_settings)
         # Get numeric columns
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        numeric_cols = stats.numeric_columns()
+        associations = stats.memo(
+            'associations', lambda: association_matrix(df, numeric_cols, self.association_settings)
+        )
         
         if len(numeric_cols) < 2:
             self.logger.warning("Not enough numeric columns for correlation analysis")
@@ -28,62 +193,186 @@ class CorrelationAnalyzer:
                 'correlations': {},
                 'high_correlations': [],
                 'top_correlations': [],
-                'correlation_matrix_path': None
+                'correlation_matrix_path': None,
+                'method': method,
+                'associations': associations
             }
 
-        # Calculate correlations
-        correlation_matrix = df[numeric_cols].corr()
-        
-        # Find all correlations (excluding self-correlations)
-        all_correlations = []
-        for i in range(len(correlation_matrix.columns)):
-            for j in range(i+1, len(correlation_matrix.columns)):  # Only upper triangle to avoid duplicates
-                col1 = correlation_matrix.columns[i]
-                col2 = correlation_matrix.columns[j]
-                corr = correlation_matrix.loc[col1, col2]
-                all_correlations.append({
-                    'column1': col1,
-                    'column2': col2,
-                    'correlation': corr
-                })
+        # Calculate correlations (or reuse the matrix computed during validation)
+        correlation_matrix = stats.correlation_matrix(method)
         
-        # Sort by absolute correlation value and get top 5
-        all_correlations.sort(key=lambda x: abs(x['correlation']), reverse=True)
-        top_correlations = all_correlations[:5]
+        # P-values and FDR-adjusted q-values for every pair at once
+        alpha = self.correlation_settings.get('alpha')
+        significance = stats.correlation_significance(method) if alpha is not None else None
+
+        def record(col1, col2, corr):
+            entry = {'column1': col1, 'column2': col2, 'correlation': corr}
+            if significance is not None:
+                entry['p_value'] = float(significance[0].at[col1, col2])
+                entry['q_value'] = float(significance[1].at[col1, col2])
+            return entry
+
+        # Select pairs from the upper triangle (excluding self-correlations and duplicates)
+        top_correlations = [record(*pair) for pair in top_pairs(correlation_matrix, 5)]
         
         # Debug logging
         self.logger.info(f"Top 5 correlations: {top_correlations}")
         
-        # Filter high correlations based on threshold
-        high_correlations = [corr for corr in all_correlations if abs(corr['correlation']) >= self.correlation_threshold]
-
-        # Generate correlation heatmap
-        plt.figure(figsize=(10, 8))
-        sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0)
-        plt.title('Correlation Matrix')
-        
-        # Save plot with unique name
-        os.makedirs('static/plots', exist_ok=True)
-        plot_path = f'static/plots/correlation_matrix_{hash(frozenset(numeric_cols))}.png'
-        plt.savefig(plot_path)
-        plt.close()
+        # High correlations need both the effect size and FDR-adjusted significance, strongest first
+        significant = None
+        if significance is not None:
+            with np.errstate(invalid='ignore'):
+                significant = significance[1].to_numpy() <= alpha
+        high_correlations = [
+            record(*pair)
+            for pair in correlated_pairs(correlation_matrix, self.correlation_threshold, mask=significant)
+        ]
 
-        return {
-            'correlations': correlation_matrix.to_dict(),
+        results = {
+            'correlations': {},
             'high_correlations': high_correlations,
             'top_correlations': top_correlations,
-            'correlation_matrix_path': plot_path
+            'correlation_matrix_path': None,
+            'method': method,
+            'associations': associations
         }
+        if significance is not None:
+            results['significance'] = self._significance_summary(correlation_matrix, significance[1], alpha)
+        if self.matrix_tiles.is_wide(correlation_matrix):
+            # Too wide for a nested dict or one heatmap: served as tiles of the stored matrix
+            results['matrix_tiles'] = self.matrix_tiles.save(correlation_matrix)
+            return results
+        results['correlations'] = stats.correlation_dict(method)
 
-    def get_feature_importance(self, df, target_column):
-        """Calculate feature importance based on correlation with target."""
-        if target_column not in df.columns:
-            raise ValueError(f"Target column '{target_column}' not found in dataset")
+        # Generate correlation heatmap, named by the matrix and render parameters
+        params = {'annotate': True, 'dpi': 100} if renderer is None else renderer.heatmap_params(correlation_matrix)
+        plot_path = self.plot_cache.path('correlation_matrix', correlation_matrix, params)
+        if self.plot_cache.lookup(plot_path):
+            results['correlation_matrix_path'] = plot_path
+            if renderer is not None:
+                results['correlation_matrix_status'] = 'ready'
+        elif renderer is None:
+            results['correlation_matrix_path'] = render_heatmap(correlation_matrix, plot_path, **params)
+            self.plot_cache.maybe_collect()
+        else:
+            results['correlation_matrix_status'] = 'pending'
 
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        correlations = df[numeric_cols].corr()[target_column].sort_values(ascending=False)
-        
+            def attach(path, error):
+                results['correlation_matrix_path'] = path
+                results['correlation_matrix_status'] = 'failed' if error else 'ready'
+                self.plot_cache.maybe_collect()
+                if on_plot is not None:
+                    on_plot(path, error)
+
+            renderer.submit_heatmap(correlation_matrix, plot_path, callback=attach)
+        return results
+
+    def restore_heatmap(self, results, renderer=None, on_plot=None, wait=False):
+        """Make the heatmap of stored correlation results servable again.
+
+        Stored results keep ``correlation_matrix_path`` after the plot collector
+        removed the image. A missing image is redrawn at the same path from the
+        stored ``correlations`` (in the background with a renderer, as in
+        ``analyze``); without stored correlations the path is cleared.
+
+        Args:
+            results: Correlation analysis results, updated in place
+            renderer: PlotRenderer that draws the heatmap in the background
+            on_plot: Called with (path, error) when a background heatmap is done
+            wait: Wait for the renderer, for callers with no way to deliver a
+                later ``plot_ready``; the path is kept, or cleared if rendering fails
+
+        Returns:
+            The updated results
+        """
+        path = results.get('correlation_matrix_path')
+        if not path or self.plot_cache.lookup(path):
+            return results
+        if not results.get('correlations'):
+            results['correlation_matrix_path'] = None
+            return results
+
+        self.logger.info(f"Redrawing collected plot {path} for stored results")
+        matrix = pd.DataFrame(results['correlations']).astype(float)
+        params = {'annotate': True, 'dpi': 100} if renderer is None else renderer.heatmap_params(matrix)
+        if renderer is None:
+            render_heatmap(matrix, path, **params)
+            self.plot_cache.maybe_collect()
+            return results
+        if wait:
+            try:
+                renderer.submit_heatmap(matrix, path).result()
+            except Exception as e:
+                self.logger.error(f"Could not redraw {path}: {str(e)}")
+                results['correlation_matrix_path'] = None
+            self.plot_cache.maybe_collect()
+            return results
+
+        results['correlation_matrix_path'] = None
+        results['correlation_matrix_status'] = 'pending'
+
+        def attach(rendered, error):
+            results['correlation_matrix_path'] = rendered
+            results['correlation_matrix_status'] = 'failed' if error else 'ready'
+            self.plot_cache.maybe_collect()
+            if on_plot is not None:
+                on_plot(rendered, error)
+
+        renderer.submit_heatmap(matrix, path, callback=attach)
+        return results
+
+    def _significance_summary(self, matrix, qvalues, alpha):
+        """Counts of tested and significant pairs, and of strong pairs that are not significant."""
+        upper = np.triu_indices(len(matrix), k=1)
+        q = qvalues.to_numpy()[upper]
+        strong = np.abs(matrix.to_numpy()[upper]) >= self.correlation_threshold
+        tested = ~np.isnan(q)
+        with np.errstate(invalid='ignore'):
+            significant = q <= alpha
         return {
-            'feature_importance': correlations.to_dict(),
-            'top_features': correlations[1:6].index.tolist()  # Exclude target column itself
+            'alpha': alpha,
+            'correction': 'benjamini-hochberg',
+            'tested_pairs': int(tested.sum()),
+            'significant_pairs': int(significant.sum()),
+            'strong_but_not_significant': int((strong & tested & ~significant).sum())
         }
+
+    def get_feature_importance(self, df, target_column, stats=None, method=None, dataset_hash=None):
+        """Calculate feature importance with respect to one target column.
+
+        Only the target's scores are computed (see ``target_importance``), and
+        results are cached per dataset and target.
+
+        Args:
+            df: DataFrame to analyze
+            target_column: Column to score the others against; numeric or categorical
+            stats: StatsContext the dataset hash is memoized in when it covers ``df``
+            method: Correlation method for numeric pairs; defaults to the configured method
+            dataset_hash: Content hash identifying ``df`` (e.g. of its file); computed
+                from the frame when omitted
+
+        Returns:
+            Dictionary with ``feature_importance``, ``measures``,
+            ``mutual_information`` and ``top_features``
+        """
+        method = method or self.correlation_settings['method']
+        if method not in CORRELATION_METHODS:
+            raise ValueError(f"Unknown correlation method '{method}', expected one of {CORRELATION_METHODS}")
+        if target_column not in df.columns:
+            raise ValueError(f"Target column '{target_column}' not found in dataset")
+
+        if dataset_hash is None:
+            stats = stats_for(df, stats, self.correlation_settings)
+            dataset_hash = stats.memo('frame_hash', lambda: ResultCache.frame_hash(df))
+        key = ResultCache.make_key(dataset_hash, f"feature_importance|{target_column}", {
+            'method': method,
+            'importance': self.importance_settings,
+            'correlation': self.correlation_settings,
+            'association': self.association_settings
+        })
+        results = self.importance_cache.get(key)
+        if results is None:
+            results = target_importance(df, target_column, method, self.importance_settings,
+                                        self.correlation_settings, self.association_settings)
+            self.importance_cache.set(key, results)
+        return results
@@ -2,6 +2,7 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, List
+from src.correlation_pairs import correlated_pairs
 
 def analyze(df: pd.DataFrame) -> Dict[str, Any]:
     """Analyze correlations in the dataset."""
@@ -26,20 +27,11 @@ def analyze(df: pd.DataFrame) -> Dict[str, Any]:
             correlations[col1][col2] = float(corr_matrix.loc[col1, col2])
     
     # Find high correlations (absolute value > 0.7)
-    high_correlations = []
-    for i, col1 in enumerate(corr_matrix.columns):
-        for j, col2 in enumerate(corr_matrix.columns):
-            if i < j:  # Only look at upper triangle to avoid duplicates
-                corr = float(corr_matrix.loc[col1, col2])
-                if abs(corr) > 0.7:
-                    high_correlations.append({
-                        'column1': col1,
-                        'column2': col2,
-                        'correlation': corr
-                    })
-    
-    # Sort high correlations by absolute correlation value
-    high_correlations.sort(key=lambda x: abs(x['correlation']), reverse=True)
+    # Sorted by absolute correlation value
+    high_correlations = [
+        {'column1': col1, 'column2': col2, 'correlation': corr}
+        for col1, col2, corr in correlated_pairs(corr_matrix, 0.7, strict=True)
+    ]
     
     # Get top 10 correlations
     top_correlations = high_correlations[:10]
@@ -0,0 +1,409 @@
+import warnings
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy.stats import kendalltau, norm, rankdata, t as t_distribution
+from typing import Any, Dict, List, Optional, Tuple
+from src.logger import setup_logger
+
+logger = setup_logger()
+
+CORRELATION_METHODS = ('pearson', 'spearman', 'kendall')
+
+DEFAULT_CORRELATION_SETTINGS = {
+    'method': 'pearson',               # Default for correlation analysis; 'spearman' or 'kendall' for skewed data
+    'n_jobs': -1,                      # Workers for pairs that are computed one at a time
+    'parallel_min_work': 5_000_000,    # Pair-rows below which those pairs are computed in-process
+    'dtype': 'float64',                # 'float32' halves memory and doubles BLAS throughput at ~1e-6 precision
+    'block_bytes': 256 * 1024 * 1024,  # Bound on the row block copied for the Pearson products
+    'alpha': 0.05                      # False discovery rate for significant correlations; None to disable
+}
+
+
+def correlation_matrix(df: pd.DataFrame, method: str = 'pearson',
+                       settings: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """Correlation matrix of the numeric columns of ``df``.
+
+    Matches ``DataFrame.corr(method=method)`` (to 1e-9 for Pearson in float64):
+    missing values are excluded pair by pair and undefined correlations
+    (constant columns, fewer than two shared rows) are NaN.
+
+    Args:
+        df: DataFrame of numeric columns
+        method: 'pearson', 'spearman' or 'kendall'
+        settings: Overrides for ``DEFAULT_CORRELATION_SETTINGS``
+
+    Returns:
+        Square DataFrame indexed by the columns of ``df``
+    """
+    settings = {**DEFAULT_CORRELATION_SETTINGS, **(settings or {})}
+    if method == 'pearson':
+        values = pearson_matrix(df.to_numpy(dtype=float), settings)
+    elif method == 'spearman':
+        values = spearman_matrix(df.to_numpy(dtype=float), settings)
+    elif method == 'kendall':
+        values = kendall_matrix(df.to_numpy(dtype=float), settings)
+    else:
+        raise ValueError(f"Unknown correlation method '{method}', expected one of {CORRELATION_METHODS}")
+    return pd.DataFrame(values, index=df.columns, columns=df.columns)
+
+
+def pearson_matrix(values: np.ndarray, settings: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """Pairwise-complete Pearson correlation of the columns of a 2-D array.
+
+    Rows are processed in blocks of at most ``block_bytes``. For each block the
+    data is shifted by the column means (which keeps the sums well conditioned)
+    and missing values are zero-filled, so the pairwise counts, sums, sums of
+    squares and cross-products are four matrix products of the block and its
+    validity mask. Blocks without missing values need only the cross-product.
+    """
+    settings = {**DEFAULT_CORRELATION_SETTINGS, **(settings or {})}
+    dtype = np.dtype(settings['dtype'])
+    shift = column_shift(values)
+    block_rows = max(1, int(settings['block_bytes'] // max(1, values.shape[1] * dtype.itemsize * 3)))
+    sums = None
+    for start in range(0, len(values), block_rows):
+        sums = moment_sums(values[start:start + block_rows], shift, dtype, sums)
+    if sums is None:
+        return np.full((values.shape[1], values.shape[1]), np.nan)
+    return pearson_from_sums(*sums)
+
+
+def correlation_vector(features: pd.DataFrame, target: pd.Series, method: str = 'pearson',
+                       settings: Optional[Dict[str, Any]] = None) -> pd.Series:
+    """Correlation of each column of ``features`` with ``target``.
+
+    One column of ``correlation_matrix`` for O(n * p) instead of O(n * p^2)
+    work, with the same pairwise-complete handling of missing values.
+
+    Args:
+        features: DataFrame of numeric columns
+        target: Numeric Series aligned with ``features``
+        method: 'pearson', 'spearman' or 'kendall'
+        settings: Overrides for ``DEFAULT_CORRELATION_SETTINGS``
+
+    Returns:
+        Series indexed by the columns of ``features``
+    """
+    settings = {**DEFAULT_CORRELATION_SETTINGS, **(settings or {})}
+    values = np.column_stack([target.to_numpy(dtype=float), features.to_numpy(dtype=float)])
+    if method == 'pearson':
+        result = pearson_vector(values[:, 1:], values[:, 0], settings)
+    elif method in ('spearman', 'kendall'):
+        pairs = [(0, j) for j in range(1, values.shape[1])]
+        if method == 'spearman':
+            data, function = (values, np.argsort(values, axis=0, kind='stable')), _spearman_pairs
+        else:
+            data, function = values, _kendall_pairs
+        result = np.array(map_pairs(function, data, pairs, settings), dtype=float)
+    else:
+        raise ValueError(f"Unknown correlation method '{method}', expected one of {CORRELATION_METHODS}")
+    return pd.Series(result, index=features.columns, dtype=float)
+
+
+def pearson_vector(values: np.ndarray, target: np.ndarray, settings: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """Pairwise-complete Pearson correlation of each column of ``values`` with ``target``.
+
+    Same shifted sums as ``pearson_matrix``, but each is a column sum over a
+    row block instead of a matrix product.
+    """
+    settings = {**DEFAULT_CORRELATION_SETTINGS, **(settings or {})}
+    dtype = np.dtype(settings['dtype'])
+    shift, target_shift = column_shift(values), column_shift(target[:, None])[0]
+    block_rows = max(1, int(settings['block_bytes'] // max(1, values.shape[1] * dtype.itemsize * 4)))
+    sums = np.zeros((6, values.shape[1]))  # count, sx, sy, sxx, syy, sxy
+    for start in range(0, len(values), block_rows):
+        x = (values[start:start + block_rows] - shift).astype(dtype, copy=False)
+        y = (target[start:start + block_rows] - target_shift).astype(dtype, copy=False)[:, None]
+        valid = ~(np.isnan(x) | np.isnan(y))
+        x, y = np.where(valid, x, 0), np.where(valid, y, 0)
+        sums += [valid.sum(axis=0), x.sum(axis=0, dtype=np.float64), y.sum(axis=0, dtype=np.float64),
+                 np.einsum('ij,ij->j', x, x, dtype=np.float64), np.einsum('ij,ij->j', y, y, dtype=np.float64),
+                 np.einsum('ij,ij->j', x, y, dtype=np.float64)]
+    count, sx, sy, sxx, syy, sxy = sums
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var_x, var_y = sxx - sx * sx / count, syy - sy * sy / count
+        result = (sxy - sx * sy / count) / np.sqrt(var_x * var_y)
+    result[(count < 2) | ~(var_x > 0) | ~(var_y > 0)] = np.nan
+    return np.clip(result, -1.0, 1.0)
+
+
+def column_shift(values: np.ndarray) -> np.ndarray:
+    """Column means, or the value itself for constant columns so they centre to exact zeros."""
+    with warnings.catch_warnings(), np.errstate(invalid='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)  # All-missing columns
+        shift = np.nanmean(values, axis=0)
+        low, high = np.nanmin(values, axis=0), np.nanmax(values, axis=0)
+    shift = np.where(low == high, low, shift)
+    return np.nan_to_num(shift, nan=0.0)
+
+
+def moment_sums(block: np.ndarray, shift: np.ndarray, dtype: np.dtype = np.dtype('float64'),
+                sums: Optional[Tuple[np.ndarray, ...]] = None) -> Tuple[np.ndarray, ...]:
+    """Add a block of rows to pairwise-complete moment sums around ``shift``.
+
+    Returns:
+        (count, sx, sxx, sxy) as float64 p x p arrays, where for columns i, j
+        over rows where both are present: count[i, j] is the number of rows,
+        sx[i, j] the sum of x_i, sxx[i, j] the sum of x_i squared and sxy[i, j]
+        the sum of x_i * x_j (all shifted)
+    """
+    p = block.shape[1]
+    if sums is None:
+        sums = tuple(np.zeros((p, p)) for _ in range(4))
+    count, sx, sxx, sxy = sums
+    centered = (block - shift).astype(dtype, copy=False)
+    valid = ~np.isnan(centered)
+    if valid.all():
+        count += len(centered)
+        sx += centered.sum(axis=0, dtype=np.float64)[:, None]
+        sxx += np.einsum('ij,ij->j', centered, centered, dtype=np.float64)[:, None]
+        sxy += centered.T @ centered
+    else:
+        filled = np.where(valid, centered, 0).astype(dtype, copy=False)
+        mask = valid.astype(dtype)
+        count += mask.T @ mask
+        sx += filled.T @ mask
+        sxx += (filled * filled).T @ mask
+        sxy += filled.T @ filled
+    return count, sx, sxx, sxy
+
+
+def pearson_from_sums(count: np.ndarray, sx: np.ndarray, sxx: np.ndarray, sxy: np.ndarray) -> np.ndarray:
+    """Correlation matrix from ``moment_sums``; NaN where undefined, as in pandas."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sxy - sx * sx.T / count
+        var_x = sxx - sx * sx / count
+        var_y = var_x.T
+        result = cov / np.sqrt(var_x * var_y)
+    result[(count < 2) | ~(var_x > 0) | ~(var_y > 0)] = np.nan
+    np.clip(result, -1.0, 1.0, out=result)
+    np.fill_diagonal(result, np.where((np.diag(count) >= 2) & (np.diag(var_x) > 0), 1.0, np.nan))
+    return result
+
+
+def pairwise_counts(values: np.ndarray, settings: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """Number of rows where both columns of each pair are present."""
+    settings = {**DEFAULT_CORRELATION_SETTINGS, **(settings or {})}
+    p = values.shape[1]
+    present = ~np.isnan(values)
+    if present.all():
+        return np.full((p, p), float(len(values)))
+    counts = np.zeros((p, p))
+    block_rows = max(1, int(settings['block_bytes'] // max(1, p * 8)))
+    for start in range(0, len(values), block_rows):
+        block = present[start:start + block_rows].astype(np.float64)
+        counts += block.T @ block
+    return counts
+
+
+def tie_sums(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Tie statistics of each column over the rows it shares with each other column.
+
+    For column i and the rows where columns i and j are both present, with
+    t the sizes of the groups of tied values of column i:
+
+    Returns:
+        (sum t(t-1), sum t(t-1)(t-2), sum t(t-1)(2t+5)) as p x p arrays
+    """
+    p = values.shape[1]
+    present = ~np.isnan(values)
+    sums = tuple(np.zeros((p, p)) for _ in range(3))
+    for i in range(p):
+        rows = np.flatnonzero(present[:, i])
+        _, codes, sizes = np.unique(values[rows, i], return_inverse=True, return_counts=True)
+        tied = sizes > 1
+        if not tied.any():
+            continue
+        if present.all():
+            groups = np.repeat(sizes[tied][:, None].astype(float), p, axis=1)
+        else:
+            # Group sizes restricted to the rows where each other column is present
+            rows, codes = rows[tied[codes]], codes[tied[codes]]
+            order = np.argsort(codes, kind='stable')
+            starts = np.flatnonzero(np.r_[True, np.diff(codes[order]) != 0])
+            groups = np.add.reduceat(present[rows[order]].astype(float), starts, axis=0)
+        pairs = groups * (groups - 1)
+        sums[0][i] = pairs.sum(axis=0)
+        sums[1][i] = (pairs * (groups - 2)).sum(axis=0)
+        sums[2][i] = (pairs * (2 * groups + 5)).sum(axis=0)
+    return sums
+
+
+def correlation_pvalues(matrix: np.ndarray, counts: np.ndarray, method: str = 'pearson',
+                        ties: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> np.ndarray:
+    """Two-sided p-values of a correlation matrix against no correlation.
+
+    Pearson and Spearman use t = r * sqrt((n - 2) / (1 - r^2)) with n - 2
+    degrees of freedom, as scipy's pearsonr and spearmanr do. Kendall's tau-b
+    uses the normal approximation of scipy's asymptotic test, with the tie
+    correction taken from ``tie_sums`` when given. ``counts`` holds each
+    pair's n. Pairs with an undefined correlation or too few rows get NaN.
+    """
+    r = np.asarray(matrix, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method == 'kendall':
+            n = counts
+            m = n * (n - 1)
+            t1, t2, t3 = ties if ties is not None else tuple(np.zeros_like(n) for _ in range(3))
+            # Concordant minus discordant pairs, recovered from tau-b and its normalization
+            score = r * np.sqrt((m / 2 - t1 / 2) * (m / 2 - t1.T / 2))
+            variance = (m * (2 * n + 5) - t3 - t3.T) / 18 + t1 * t1.T / (2 * m) + t2 * t2.T / (9 * m * (n - 2))
+            pvalues = 2 * norm.sf(np.abs(score) / np.sqrt(variance))
+        else:
+            dof = counts - 2
+            t = np.abs(r) * np.sqrt(dof / np.maximum(1 - r * r, 0.0))
+            pvalues = 2 * t_distribution.sf(t, np.where(dof > 0, dof, np.nan))
+    pvalues[np.isnan(r) | (counts < 3)] = np.nan
+    return np.clip(pvalues, 0.0, 1.0)
+
+
+def benjamini_hochberg(pvalues: np.ndarray) -> np.ndarray:
+    """Benjamini-Hochberg adjusted p-values (q-values) for an array of tests.
+
+    NaN entries are not counted as tests and stay NaN. A test is significant
+    at false discovery rate ``alpha`` when its q-value is at most ``alpha``.
+    """
+    flat = np.asarray(pvalues, dtype=float).ravel()
+    tested = np.flatnonzero(~np.isnan(flat))
+    qvalues = np.full(flat.shape, np.nan)
+    if len(tested):
+        order = tested[np.argsort(flat[tested], kind='stable')]
+        scaled = flat[order] * len(order) / np.arange(1, len(order) + 1)
+        # Each q-value is the smallest scaled p-value at its rank or above
+        qvalues[order] = np.minimum(np.minimum.accumulate(scaled[::-1])[::-1], 1.0)
+    return qvalues.reshape(np.shape(pvalues))
+
+
+def correlation_significance(matrix: np.ndarray, counts: np.ndarray, method: str = 'pearson',
+                             ties: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+                             ) -> Tuple[np.ndarray, np.ndarray]:
+    """P-values and Benjamini-Hochberg q-values of a symmetric correlation matrix.
+
+    The correction counts each pair once (upper triangle); the diagonal is NaN.
+    """
+    pvalues = correlation_pvalues(matrix, counts, method, ties)
+    np.fill_diagonal(pvalues, np.nan)
+    upper = np.triu_indices(len(pvalues), k=1)
+    qvalues = np.full(pvalues.shape, np.nan)
+    qvalues[upper] = benjamini_hochberg(pvalues[upper])
+    qvalues.T[upper] = qvalues[upper]
+    return pvalues, qvalues
+
+
+def spearman_matrix(values: np.ndarray, settings: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """Spearman correlation of the columns of a 2-D array.
+
+    Columns without missing values are ranked once (ties get average ranks)
+    and correlated with one matrix product. A pair involving a column with
+    missing values is ranked on the rows both columns share, as pandas does.
+    """
+    settings = {**DEFAULT_CORRELATION_SETTINGS, **(settings or {})}
+    p = values.shape[1]
+    missing = np.isnan(values)
+    complete = np.flatnonzero(~missing.any(axis=0))
+    result = np.full((p, p), np.nan)
+
+    if len(complete):
+        result[np.ix_(complete, complete)] = _pearson_complete(rankdata(values[:, complete], axis=0))
+
+    has_missing = missing.any(axis=0)
+    pairs = [(i, j) for i in range(p) for j in range(i, p) if has_missing[i] or has_missing[j]]
+    if pairs:
+        # Sort each column once; a pair's ranks are then read off the sorted order in linear time
+        order = np.argsort(values, axis=0, kind='stable')
+        for (i, j), value in zip(pairs, map_pairs(_spearman_pairs, (values, order), pairs, settings)):
+            result[i, j] = result[j, i] = value
+    return result
+
+
+def kendall_matrix(values: np.ndarray, settings: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """Kendall tau-b correlation of the columns of a 2-D array.
+
+    Each pair is computed on the rows both columns share with scipy's
+    O(n log n) merge-sort algorithm, which accounts for ties in either column;
+    pairs are spread over ``n_jobs`` workers.
+    """
+    settings = {**DEFAULT_CORRELATION_SETTINGS, **(settings or {})}
+    p = values.shape[1]
+    result = np.eye(p)  # pandas reports 1 on the diagonal even for constant columns
+    pairs = [(i, j) for i in range(p) for j in range(i + 1, p)]
+    for (i, j), value in zip(pairs, map_pairs(_kendall_pairs, values, pairs, settings)):
+        result[i, j] = result[j, i] = value
+    return result
+
+
+def _pearson_complete(values: np.ndarray) -> np.ndarray:
+    """Pearson correlation of the columns of an array without missing values."""
+    centered = values - values.mean(axis=0)
+    norms = np.sqrt(np.einsum('ij,ij->j', centered, centered))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scaled = centered / np.where(norms > 0, norms, np.nan)
+    result = np.clip(scaled.T @ scaled, -1.0, 1.0)
+    np.fill_diagonal(result, np.where(norms > 0, 1.0, np.nan))
+    return result
+
+
+def map_pairs(function, data: Any, pairs: List[Tuple[int, int]],
+               settings: Dict[str, Any]) -> List[float]:
+    """Apply a per-pair kernel to batches of pairs, in parallel for large inputs."""
+    if not pairs:
+        return []
+    n_jobs = effective_n_jobs(settings['n_jobs'])
+    rows = len(data[0]) if isinstance(data, tuple) else len(data)
+    if n_jobs == 1 or len(pairs) * rows < settings['parallel_min_work']:
+        return function(data, pairs)
+    batches = [pairs[start::n_jobs * 4] for start in range(min(n_jobs * 4, len(pairs)))]
+    results = Parallel(n_jobs=n_jobs)(delayed(function)(data, batch) for batch in batches)
+    # Batches are strided, so interleave them back into pair order
+    ordered = [None] * len(pairs)
+    for start, batch_results in enumerate(results):
+        ordered[start::len(batches)] = batch_results
+    return ordered
+
+
+def _shared_rows(values: np.ndarray, i: int, j: int) -> Tuple[np.ndarray, np.ndarray]:
+    x, y = values[:, i], values[:, j]
+    valid = ~(np.isnan(x) | np.isnan(y))
+    if valid.all():
+        return x, y
+    return x[valid], y[valid]
+
+
+def _shared_ranks(values: np.ndarray, order: np.ndarray, valid: np.ndarray, column: int) -> np.ndarray:
+    """Average ranks of a column among the valid rows, from the column's sort order."""
+    rows = order[:, column]
+    rows = rows[valid[rows]]  # Valid rows in ascending order of the column
+    sorted_values = values[rows, column]
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    ends = np.r_[starts[1:], len(rows)]
+    ranks = np.empty(len(values))
+    ranks[rows] = np.repeat((starts + ends + 1) / 2, ends - starts)  # Ties share their average rank
+    return ranks[valid]
+
+
+def _spearman_pairs(data: Tuple[np.ndarray, np.ndarray], pairs: List[Tuple[int, int]]) -> List[float]:
+    values, order = data
+    missing = np.isnan(values)
+    results = []
+    for i, j in pairs:
+        valid = ~(missing[:, i] | missing[:, j])
+        if valid.sum() < 2:
+            results.append(np.nan)
+            continue
+        x = _shared_ranks(values, order, valid, i)
+        y = x if i == j else _shared_ranks(values, order, valid, j)
+        x, y = x - x.mean(), y - y.mean()
+        denominator = np.sqrt((x @ x) * (y @ y))
+        results.append(float(np.clip((x @ y) / denominator, -1.0, 1.0)) if denominator > 0 else np.nan)
+    return results
+
+
+def _kendall_pairs(values: np.ndarray, pairs: List[Tuple[int, int]]) -> List[float]:
+    results = []
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # Constant input: the statistic is NaN, as in pandas
+        for i, j in pairs:
+            x, y = _shared_rows(values, i, j)
+            results.append(float(kendalltau(x, y, variant='b').statistic) if len(x) >= 2 else np.nan)
+    return results
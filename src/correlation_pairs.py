@@ -0,0 +1,67 @@
+"""Vectorized selection of column pairs from a correlation matrix."""
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Tuple
+
+Pair = Tuple[str, str, float]
+
+
+def _upper_abs(matrix: pd.DataFrame) -> np.ndarray:
+    """Absolute correlations with the diagonal and lower triangle set to NaN."""
+    absolute = np.abs(matrix.to_numpy(dtype=float))
+    absolute[np.tri(len(absolute), dtype=bool)] = np.nan
+    return absolute
+
+
+def _records(matrix: pd.DataFrame, flat_index: np.ndarray) -> List[Pair]:
+    rows, cols = np.divmod(flat_index, matrix.shape[1])
+    values = matrix.to_numpy(dtype=float)[rows, cols]
+    columns = matrix.columns
+    return [(columns[i], columns[j], float(value)) for i, j, value in zip(rows, cols, values)]
+
+
+def correlated_pairs(matrix: pd.DataFrame, threshold: float, strict: bool = False,
+                     sort: bool = True, mask: Optional[np.ndarray] = None) -> List[Pair]:
+    """Pairs whose absolute correlation reaches ``threshold``.
+
+    Args:
+        matrix: Square correlation matrix
+        threshold: Minimum absolute correlation
+        strict: Require the absolute correlation to exceed ``threshold``
+        sort: Order by absolute correlation, strongest first; otherwise pairs
+            are in upper-triangle order
+        mask: Boolean matrix of pairs that may be selected (e.g. significant ones)
+
+    Returns:
+        List of (column1, column2, correlation) with the signed correlation
+    """
+    absolute = _upper_abs(matrix)
+    with np.errstate(invalid='ignore'):
+        selected = absolute > threshold if strict else absolute >= threshold
+    if mask is not None:
+        selected &= mask
+    flat_index = np.flatnonzero(selected)
+    if sort:
+        flat_index = flat_index[np.lexsort((flat_index, -absolute.ravel()[flat_index]))]
+    return _records(matrix, flat_index)
+
+
+def top_pairs(matrix: pd.DataFrame, k: int) -> List[Pair]:
+    """The ``k`` pairs with the largest absolute correlation, strongest first.
+
+    Pairs with an undefined (NaN) correlation are never selected; ties keep
+    upper-triangle order.
+    """
+    absolute = _upper_abs(matrix).ravel()
+    np.nan_to_num(absolute, copy=False, nan=-1.0)
+    k = min(k, absolute.size)
+    if k <= 0:
+        return []
+    # Partition to find the k-th largest value; ties at it are taken in triangle order
+    kth = np.partition(absolute, -k)[-k]
+    above = np.flatnonzero(absolute > kth)
+    ties = np.flatnonzero(absolute == kth)[:k - len(above)]
+    flat_index = np.concatenate([above, ties])
+    flat_index = flat_index[absolute[flat_index] >= 0]
+    flat_index = flat_index[np.lexsort((flat_index, -absolute[flat_index]))]
+    return _records(matrix, flat_index)
@@ -0,0 +1,188 @@
+import time
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Optional
+from scipy.stats import shapiro, anderson, normaltest
+from src.logger import setup_logger
+
+logger = setup_logger()
+
+DEFAULT_DISTRIBUTION_SETTINGS = {
+    'shapiro_max_n': 5000,        # Shapiro-Wilk p-values are unreliable above this size
+    'anderson_max_n': 100000,     # Anderson-Darling runs on a subsample above this size
+    'dagostino_min_n': 20,        # D'Agostino-Pearson needs a reasonable sample for kurtosis
+    'seed': 42,
+    'histogram_bins': 20,
+    'time_budget_seconds': 30
+}
+
+BUDGET_EXHAUSTED_MESSAGE = 'Skipping normality tests - distribution analysis time budget exhausted'
+
+
+class DistributionAnalyzer:
+    """Size-aware, time-budgeted distribution analysis for numeric columns.
+
+    Summary statistics, histograms and binned KDE summaries are computed for all
+    numeric columns at once on the 2-D numeric block. Normality tests are chosen
+    by sample size and run on seeded subsamples when a column is too long for
+    them; once the time budget is spent the remaining tests are skipped instead
+    of stalling the task.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """Initialize DistributionAnalyzer.
+
+        Args:
+            settings: Overrides for ``DEFAULT_DISTRIBUTION_SETTINGS``
+        """
+        self.logger = logger
+        self.settings = {**DEFAULT_DISTRIBUTION_SETTINGS, **(settings or {})}
+
+    def analyze(self, df: pd.DataFrame, time_budget: Optional[float] = None) -> Dict[str, Any]:
+        """Analyze distributions of numeric columns.
+
+        Args:
+            df: DataFrame to analyze
+            time_budget: Seconds available for normality testing (defaults to the
+                configured ``time_budget_seconds``)
+
+        Returns:
+            Dictionary of per-column distribution summaries
+        """
+        started = time.monotonic()
+        budget = self.settings['time_budget_seconds'] if time_budget is None else time_budget
+        deadline = started + budget
+
+        numeric = df.select_dtypes(include=[np.number])
+        counts = numeric.notna().sum()
+        numeric = numeric.loc[:, counts >= 3]  # Skip columns with too few samples
+        if numeric.shape[1] == 0:
+            return {}
+
+        summary = numeric.agg(['mean', 'median', 'std', 'skew', 'kurt'])
+        histograms = self.compute_histograms(numeric)
+
+        distributions = {}
+        for col in numeric.columns:
+            stats_dict = {
+                'mean': float(summary.at['mean', col]),
+                'median': float(summary.at['median', col]),
+                'std': float(summary.at['std', col]),
+                'skewness': float(summary.at['skew', col]),
+                'kurtosis': float(summary.at['kurt', col]),
+                'histogram': histograms[col]['histogram'],
+                'kde': histograms[col]['kde']
+            }
+
+            if not summary.at['std', col] > 0:
+                stats_dict['normality_tests'] = 'Skipping normality tests - zero variance in data'
+                self.logger.warning(f"Column {col} has zero variance, skipping normality tests")
+            elif time.monotonic() > deadline:
+                stats_dict['normality_tests'] = BUDGET_EXHAUSTED_MESSAGE
+                self.logger.warning(f"Time budget of {budget}s exhausted, skipping normality tests for column {col}")
+            else:
+                try:
+                    stats_dict['normality_tests'] = self.run_normality_tests(numeric[col].dropna().to_numpy())
+                except Exception as e:
+                    self.logger.error(f"Error in normality tests for column {col}: {str(e)}")
+                    stats_dict['normality_tests'] = f'Could not perform normality tests: {str(e)}'
+
+            distributions[col] = stats_dict
+
+        self.logger.info(f"Analyzed distributions of {len(distributions)} columns in {time.monotonic() - started:.2f}s")
+        return distributions
+
+    def run_normality_tests(self, data: np.ndarray) -> Dict[str, Any]:
+        """Run normality tests appropriate for the sample size.
+
+        Shapiro-Wilk and Anderson-Darling run on seeded subsamples once the data
+        exceeds ``shapiro_max_n`` / ``anderson_max_n``; D'Agostino-Pearson is
+        linear in n and runs on the full column.
+        """
+        rng = np.random.default_rng(self.settings['seed'])
+        n = len(data)
+        tests = {}
+
+        shapiro_data = self._subsample(data, self.settings['shapiro_max_n'], rng)
+        shapiro_stat, shapiro_p = shapiro(shapiro_data)
+        tests['shapiro_wilk'] = {
+            'statistic': float(shapiro_stat),
+            'p_value': float(shapiro_p),
+            'is_normal': int(shapiro_p > 0.05),  # Convert boolean to int
+            'sample_size': len(shapiro_data),
+            'sampled': int(len(shapiro_data) < n)
+        }
+
+        anderson_data = self._subsample(data, self.settings['anderson_max_n'], rng)
+        anderson_result = anderson(anderson_data)
+        tests['anderson_darling'] = {
+            'statistic': float(anderson_result.statistic),
+            'critical_values': [float(x) for x in anderson_result.critical_values.tolist()],
+            'significance_level': [float(x) for x in anderson_result.significance_level.tolist()],
+            'sample_size': len(anderson_data),
+            'sampled': int(len(anderson_data) < n)
+        }
+
+        if n >= self.settings['dagostino_min_n']:
+            dagostino_stat, dagostino_p = normaltest(data)
+            tests['dagostino_pearson'] = {
+                'statistic': float(dagostino_stat),
+                'p_value': float(dagostino_p),
+                'is_normal': int(dagostino_p > 0.05),
+                'sample_size': n,
+                'sampled': 0
+            }
+
+        return tests
+
+    def compute_histograms(self, numeric: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """Compute histograms and binned KDE summaries for all columns in one pass.
+
+        Every value is mapped to a global bin id (column offset + bin index) and
+        counted with a single ``np.bincount`` over the whole numeric block.
+        """
+        bins = self.settings['histogram_bins']
+        values = numeric.to_numpy(dtype=float)
+        n_cols = values.shape[1]
+
+        valid = ~np.isnan(values)
+        mins = np.nanmin(values, axis=0)
+        maxs = np.nanmax(values, axis=0)
+        widths = np.where(maxs > mins, maxs - mins, 1.0)
+
+        bin_index = np.floor((values - mins) / widths * bins)
+        bin_index = np.clip(np.nan_to_num(bin_index), 0, bins - 1).astype(np.int64)
+        global_index = bin_index + np.arange(n_cols) * bins
+        counts = np.bincount(global_index[valid], minlength=n_cols * bins).reshape(n_cols, bins)
+
+        edges = mins[:, None] + widths[:, None] * np.arange(bins + 1) / bins
+        centers = (edges[:, :-1] + edges[:, 1:]) / 2
+
+        # Binned Gaussian KDE on the bin centers with Scott's bandwidth
+        n = valid.sum(axis=0)
+        std = np.nanstd(values, axis=0, ddof=1)
+        bandwidth = np.where(std > 0, 1.06 * std * n ** (-1 / 5), widths / bins)
+        offsets = (centers[:, :, None] - centers[:, None, :]) / bandwidth[:, None, None]
+        kernel = np.exp(-0.5 * offsets ** 2) / np.sqrt(2 * np.pi)
+        density = (kernel * counts[:, None, :]).sum(axis=2) / (n * bandwidth)[:, None]
+
+        return {
+            col: {
+                'histogram': {
+                    'counts': counts[i].tolist(),
+                    'bin_edges': edges[i].tolist()
+                },
+                'kde': {
+                    'grid': centers[i].tolist(),
+                    'density': density[i].tolist(),
+                    'bandwidth': float(bandwidth[i])
+                }
+            }
+            for i, col in enumerate(numeric.columns)
+        }
+
+    def _subsample(self, data: np.ndarray, max_n: int, rng: np.random.Generator) -> np.ndarray:
+        """Return a seeded subsample of at most ``max_n`` values."""
+        if len(data) <= max_n:
+            return data
+        return rng.choice(data, size=max_n, replace=False)
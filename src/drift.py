@@ -0,0 +1,351 @@
+import os
+import re
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from threading import Lock
+from typing import Dict, Any, List, Optional
+from src.logger import setup_logger
+from src.sketches import TDigest
+from src.categorical_profile import CategoricalProfiler, categorical_columns
+
+logger = setup_logger()
+
+DEFAULT_DRIFT_SETTINGS = {
+    'enabled': True,
+    'directory': 'data/profiles',
+    'chunk_rows': 100000,
+    'tdigest_compression': 200,
+    'histogram_bins': 20,
+    'top_k': 20,
+    'psi_bins': 10,              # Reference-quantile bins used for PSI and JS divergence
+    'max_profiles_per_dataset': 50,  # Older profiles of a dataset are deleted
+    'thresholds': {
+        'psi': 0.2,
+        'ks': 0.1,
+        'js': 0.1,
+        'null_rate': 0.05
+    }
+}
+
+PROFILE_VERSION = 1
+_EPSILON = 1e-4  # Floor for empty bins in PSI
+
+
+def dataset_name(filename: str) -> str:
+    """Dataset a file belongs to: its name without extension or the upload counter suffix."""
+    base = os.path.splitext(os.path.basename(filename))[0]
+    return re.sub(r'_\d+$', '', base)
+
+
+class DatasetProfiler:
+    """Compact, JSON-serializable column profiles for drift detection.
+
+    Numeric (and datetime) columns keep a t-digest and a histogram derived from
+    it; categorical columns keep their top values, distinct count and the count
+    of all other values. Every column records its null rate. The frame is read
+    one chunk at a time.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """Initialize DatasetProfiler.
+
+        Args:
+            settings: Overrides for ``DEFAULT_DRIFT_SETTINGS``
+        """
+        self.logger = logger
+        self.settings = {**DEFAULT_DRIFT_SETTINGS, **(settings or {})}
+
+    def profile(self, df: pd.DataFrame, dataset: Optional[str] = None) -> Dict[str, Any]:
+        """Build the profile of a DataFrame.
+
+        Args:
+            df: DataFrame to profile
+            dataset: Name of the dataset the frame is a snapshot of
+
+        Returns:
+            Dictionary with rows, columns and per-column profiles
+        """
+        chunk_rows = self.settings['chunk_rows']
+        categorical = categorical_columns(df)
+        numeric = [
+            column for column in df.columns
+            if column not in categorical and (
+                pd.api.types.is_numeric_dtype(df[column]) or pd.api.types.is_datetime64_any_dtype(df[column])
+            )
+        ]
+
+        digests = {column: TDigest(self.settings['tdigest_compression']) for column in numeric}
+        profiler = CategoricalProfiler({'chunk_rows': chunk_rows, 'top_k': self.settings['top_k']})
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start:start + chunk_rows]
+            for column, digest in digests.items():
+                digest.update(_as_float(chunk[column]))
+            if categorical:
+                profiler.update(chunk, categorical)
+
+        rows = len(df)
+        columns = {}
+        for column in df.columns:
+            null_rate = float(df[column].isna().mean()) if rows else 0.0
+            if column in digests:
+                columns[column] = {
+                    'kind': 'datetime' if pd.api.types.is_datetime64_any_dtype(df[column]) else 'numeric',
+                    'null_rate': null_rate,
+                    'count': int(digests[column].count),
+                    'digest': digests[column].to_dict(),
+                    'histogram': self._histogram(digests[column])
+                }
+            elif column in profiler.sketches:
+                result = profiler.sketches[column].result()
+                top_values = [{'value': entry['value'], 'count': entry['count']} for entry in result['top_values']]
+                columns[column] = {
+                    'kind': 'categorical',
+                    'null_rate': null_rate,
+                    'count': result['count'],
+                    'distinct_count': result['distinct_count']['estimate'],
+                    'top_values': top_values,
+                    'other_count': result['count'] - sum(entry['count'] for entry in top_values)
+                }
+
+        return {
+            'version': PROFILE_VERSION,
+            'dataset': dataset,
+            'created_at': datetime.now().isoformat(),
+            'rows': rows,
+            'columns': columns
+        }
+
+    def _histogram(self, digest: TDigest) -> Dict[str, List[float]]:
+        if digest.count == 0:
+            return {'edges': [], 'counts': []}
+        edges = np.linspace(digest.min, digest.max, self.settings['histogram_bins'] + 1)
+        counts = np.diff(digest.cdf(edges)) * digest.count
+        return {'edges': edges.tolist(), 'counts': np.round(counts).tolist()}
+
+
+class ProfileStore:
+    """Profiles of completed tasks, one JSON file per task.
+
+    Each dataset also has an index file listing its profiles by creation time,
+    so finding the previous upload reads one small file instead of every
+    profile. Beyond ``max_per_dataset`` the oldest profiles of a dataset are
+    deleted.
+    """
+
+    def __init__(self, directory: str = 'data/profiles',
+                 max_per_dataset: int = DEFAULT_DRIFT_SETTINGS['max_profiles_per_dataset']):
+        """Initialize ProfileStore.
+
+        Args:
+            directory: Directory holding ``<task_id>.json`` files
+            max_per_dataset: Number of profiles kept per dataset
+        """
+        self.logger = logger
+        self.directory = directory
+        self.max_per_dataset = max_per_dataset
+        self.index_directory = os.path.join(directory, 'datasets')
+        self._lock = Lock()
+        os.makedirs(directory, exist_ok=True)
+        if not os.path.isdir(self.index_directory):
+            self._build_index()
+
+    def _path(self, task_id: str) -> str:
+        if not re.fullmatch(r'[\w-]+', task_id):
+            raise ValueError(f"Invalid task id: {task_id}")
+        return os.path.join(self.directory, f"{task_id}.json")
+
+    def _index_path(self, dataset: Optional[str]) -> str:
+        # Dataset names come from file names, so they are hashed into a safe file name
+        digest = hashlib.sha1(str(dataset).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.index_directory, f"{digest}.json")
+
+    def _read_index(self, dataset: Optional[str]) -> List[List[str]]:
+        path = self._index_path(dataset)
+        if not os.path.exists(path):
+            return []
+        with open(path, 'r') as f:
+            return json.load(f)['profiles']
+
+    def _write_index(self, dataset: Optional[str], entries: List[List[str]]) -> None:
+        path = self._index_path(dataset)
+        with open(f"{path}.tmp", 'w') as f:
+            json.dump({'dataset': dataset, 'profiles': entries}, f)
+        os.replace(f"{path}.tmp", path)
+
+    def _build_index(self) -> None:
+        """Index profiles written before the store kept per-dataset indexes."""
+        os.makedirs(self.index_directory, exist_ok=True)
+        datasets: Dict[Optional[str], List[List[str]]] = {}
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                profile = self.load(name[:-len('.json')])
+            except (ValueError, OSError, json.JSONDecodeError):
+                continue
+            if profile and 'created_at' in profile:
+                datasets.setdefault(profile.get('dataset'), []).append([profile['created_at'], profile['task_id']])
+        for dataset, entries in datasets.items():
+            self._write_index(dataset, sorted(entries))
+        if datasets:
+            self.logger.info(f"Indexed existing profiles of {len(datasets)} datasets")
+
+    def save(self, task_id: str, profile: Dict[str, Any]) -> None:
+        """Persist the profile of a task and drop the dataset's oldest profiles beyond the limit."""
+        path = self._path(task_id)
+        dataset = profile.get('dataset')
+        with self._lock:
+            with open(f"{path}.tmp", 'w') as f:
+                json.dump({**profile, 'task_id': task_id}, f, default=str)
+            os.replace(f"{path}.tmp", path)
+
+            entries = [entry for entry in self._read_index(dataset) if entry[1] != task_id]
+            entries = sorted(entries + [[str(profile['created_at']), task_id]])
+            expired, entries = entries[:-self.max_per_dataset], entries[-self.max_per_dataset:]
+            self._write_index(dataset, entries)
+            for _, expired_id in expired:
+                if os.path.exists(self._path(expired_id)):
+                    os.remove(self._path(expired_id))
+        self.logger.info(f"Saved profile for task {task_id}")
+        if expired:
+            self.logger.info(f"Removed {len(expired)} old profiles of dataset {dataset}")
+
+    def load(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Load a task's profile, or None if it has none."""
+        path = self._path(task_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def previous(self, profile: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Most recent earlier profile of the same dataset, or None."""
+        with self._lock:
+            entries = self._read_index(profile.get('dataset'))
+        for created_at, task_id in reversed(entries):
+            if created_at < str(profile['created_at']) and task_id != profile.get('task_id'):
+                other = self.load(task_id)
+                if other:
+                    return other
+        return None
+
+
+class DriftDetector:
+    """Compare two dataset profiles without the raw data.
+
+    Numeric columns are compared with PSI and Jensen-Shannon divergence on bins
+    at the reference quantiles and with the Kolmogorov-Smirnov statistic on the
+    two t-digest CDFs. Categorical columns use PSI and Jensen-Shannon
+    divergence over the values in both top-value lists plus an 'other' bucket.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """Initialize DriftDetector.
+
+        Args:
+            settings: Overrides for ``DEFAULT_DRIFT_SETTINGS``
+        """
+        self.logger = logger
+        self.settings = {**DEFAULT_DRIFT_SETTINGS, **(settings or {})}
+        self.thresholds = {**DEFAULT_DRIFT_SETTINGS['thresholds'], **self.settings.get('thresholds', {})}
+
+    def compare(self, reference: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+        """Compare a current profile with a reference profile.
+
+        Returns:
+            Dictionary with per-column metrics, added/removed columns, row counts
+            and the list of drifted columns
+        """
+        columns = {}
+        for column, ref in reference['columns'].items():
+            cur = current['columns'].get(column)
+            if cur is None:
+                continue
+            if ref['kind'] != cur['kind']:
+                columns[column] = {'kind_changed': [ref['kind'], cur['kind']], 'drifted': True}
+                continue
+
+            if ref['kind'] == 'categorical':
+                metrics = self._compare_categorical(ref, cur)
+            else:
+                metrics = self._compare_numeric(ref, cur)
+            metrics['null_rate_change'] = cur['null_rate'] - ref['null_rate']
+            metrics['drifted'] = bool(
+                (metrics['psi'] is not None and metrics['psi'] > self.thresholds['psi'])
+                or (metrics['ks'] is not None and metrics['ks'] > self.thresholds['ks'])
+                or (metrics['js'] is not None and metrics['js'] > self.thresholds['js'])
+                or abs(metrics['null_rate_change']) > self.thresholds['null_rate']
+            )
+            columns[column] = {'kind': ref['kind'], **metrics}
+
+        return {
+            'reference': {key: reference.get(key) for key in ('task_id', 'dataset', 'created_at', 'rows')},
+            'current': {key: current.get(key) for key in ('task_id', 'dataset', 'created_at', 'rows')},
+            'columns': columns,
+            'added_columns': [column for column in current['columns'] if column not in reference['columns']],
+            'removed_columns': [column for column in reference['columns'] if column not in current['columns']],
+            'drifted_columns': [column for column, metrics in columns.items() if metrics['drifted']],
+            'thresholds': self.thresholds
+        }
+
+    def _compare_numeric(self, ref: Dict[str, Any], cur: Dict[str, Any]) -> Dict[str, Any]:
+        ref_digest, cur_digest = TDigest.from_dict(ref['digest']), TDigest.from_dict(cur['digest'])
+        if ref_digest.count == 0 or cur_digest.count == 0:
+            return {'psi': None, 'ks': None, 'js': None}
+
+        quantiles = np.linspace(0, 1, self.settings['psi_bins'] + 1)[1:-1]
+        edges = np.unique([ref_digest.quantile(q) for q in quantiles])
+        expected = np.diff(np.concatenate(([0.0], ref_digest.cdf(edges), [1.0])))
+        actual = np.diff(np.concatenate(([0.0], cur_digest.cdf(edges), [1.0])))
+
+        grid = np.unique(np.concatenate([ref_digest.means, cur_digest.means, [ref_digest.min, ref_digest.max,
+                                                                              cur_digest.min, cur_digest.max]]))
+        ks = float(np.max(np.abs(ref_digest.cdf(grid) - cur_digest.cdf(grid))))
+        return {'psi': _psi(expected, actual), 'ks': ks, 'js': _js_divergence(expected, actual)}
+
+    def _compare_categorical(self, ref: Dict[str, Any], cur: Dict[str, Any]) -> Dict[str, Any]:
+        if ref['count'] == 0 or cur['count'] == 0:
+            return {'psi': None, 'ks': None, 'js': None}
+        ref_counts = {entry['value']: entry['count'] for entry in ref['top_values']}
+        cur_counts = {entry['value']: entry['count'] for entry in cur['top_values']}
+        # A value missing from one top list still has unknown mass in that profile's
+        # 'other' count, so only values in both lists get a bucket of their own
+        values = [value for value in ref_counts if value in cur_counts]
+
+        def distribution(counts, profile):
+            known = np.array([counts[value] for value in values], dtype=float)
+            other = max(profile['count'] - known.sum(), 0.0)
+            return np.append(known, other) / profile['count']
+
+        expected, actual = distribution(ref_counts, ref), distribution(cur_counts, cur)
+        return {'psi': _psi(expected, actual), 'ks': None, 'js': _js_divergence(expected, actual)}
+
+
+def _as_float(series: pd.Series) -> np.ndarray:
+    if pd.api.types.is_datetime64_any_dtype(series):
+        values = series.to_numpy(dtype='datetime64[ns]').astype('int64').astype(float) / 1e9  # Epoch seconds
+        values[series.isna().to_numpy()] = np.nan
+        return values
+    return series.to_numpy(dtype=float, na_value=np.nan)
+
+
+def _psi(expected: np.ndarray, actual: np.ndarray) -> float:
+    """Population stability index of two bin distributions."""
+    expected = np.clip(expected, _EPSILON, None)
+    actual = np.clip(actual, _EPSILON, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def _js_divergence(p: np.ndarray, q: np.ndarray) -> float:
+    """Jensen-Shannon divergence in bits (0 for identical, 1 for disjoint distributions)."""
+    p, q = p / p.sum(), q / q.sum()
+    m = (p + q) / 2
+
+    def kl(a, b):
+        mask = a > 0
+        return float(np.sum(a[mask] * np.log2(a[mask] / b[mask])))
+
+    return (kl(p, m) + kl(q, m)) / 2
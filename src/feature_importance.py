@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+from sklearn.feature_selection import mutual_info_classif, mutual_info_regression
+from src.logger import setup_logger
+from src.association import DEFAULT_ASSOCIATION_SETTINGS, correlation_ratio, cramers_v, encode
+from src.categorical_profile import categorical_columns
+from src.correlation_engine import DEFAULT_CORRELATION_SETTINGS, correlation_vector
+
+logger = setup_logger()
+
+DEFAULT_IMPORTANCE_SETTINGS = {
+    'mutual_information': True,
+    'max_rows': 50000,      # Rows sampled for mutual information (k-NN estimates grow as n log n)
+    'n_neighbors': 3,
+    'seed': 42,
+    'n_jobs': -1,
+    'top_k': 5,
+    'cache_entries': 256    # Results kept per (dataset, target, settings)
+}
+
+
+def target_importance(df: pd.DataFrame, target_column: str, method: str = 'pearson',
+                      settings: Optional[Dict[str, Any]] = None,
+                      correlation_settings: Optional[Dict[str, Any]] = None,
+                      association_settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Importance of every column of ``df`` for one target column.
+
+    Only the target's vector of scores is computed. Each feature is scored
+    with the measure that fits the pair of types: ``method`` correlation for
+    numeric features of a numeric target, the correlation ratio between a
+    numeric and a categorical column, and Cramér's V between two categorical
+    columns. Categorical columns over ``max_categories`` are left out.
+
+    Args:
+        df: DataFrame to analyze
+        target_column: Column to score the others against
+        method: Correlation method for numeric pairs
+        settings: Overrides for ``DEFAULT_IMPORTANCE_SETTINGS``
+        correlation_settings: Overrides for ``DEFAULT_CORRELATION_SETTINGS``
+        association_settings: Overrides for ``DEFAULT_ASSOCIATION_SETTINGS``
+
+    Returns:
+        Dictionary with ``feature_importance`` (column -> score, the target
+        itself scoring 1), ``measures`` (column -> measure used),
+        ``mutual_information`` (column -> nats) and ``top_features`` (the
+        ``top_k`` columns with the largest absolute score)
+    """
+    settings = {**DEFAULT_IMPORTANCE_SETTINGS, **(settings or {})}
+    correlation_settings = {**DEFAULT_CORRELATION_SETTINGS, **(correlation_settings or {})}
+    association_settings = {**DEFAULT_ASSOCIATION_SETTINGS, **(association_settings or {})}
+    if target_column not in df.columns:
+        raise ValueError(f"Target column '{target_column}' not found in dataset")
+
+    target = df[target_column]
+    numeric = [column for column in df.select_dtypes(include=[np.number]).columns if column != target_column]
+    coded = {}
+    for column in categorical_columns(df):
+        if column == target_column:
+            continue
+        codes, size = encode(df[column])
+        if size <= association_settings['max_categories']:
+            coded[column] = (codes, size)
+
+    scores, measures = {}, {}
+    if pd.api.types.is_numeric_dtype(target) and not pd.api.types.is_bool_dtype(target):
+        target_type = 'numeric'
+        values = target.to_numpy(dtype=float)
+        scores.update(correlation_vector(df[numeric], target, method, correlation_settings).to_dict())
+        measures.update(dict.fromkeys(numeric, method))
+        for column, (codes, size) in coded.items():
+            scores[column] = correlation_ratio(codes, size, values)
+            measures[column] = 'correlation_ratio'
+    else:
+        target_type = 'categorical'
+        target_codes, target_size = encode(target)
+        if target_size > association_settings['max_categories']:
+            raise ValueError(f"Target column '{target_column}' has {target_size} categories, "
+                             f"more than the {association_settings['max_categories']} allowed")
+        for column in numeric:
+            scores[column] = correlation_ratio(target_codes, target_size, df[column].to_numpy(dtype=float))
+            measures[column] = 'correlation_ratio'
+        for column, (codes, size) in coded.items():
+            scores[column] = cramers_v(target_codes, target_size, codes, size)
+            measures[column] = 'cramers_v'
+
+    ranked = pd.Series(scores, dtype=float)
+    ranked = ranked.reindex(ranked.abs().sort_values(ascending=False, kind='stable', na_position='last').index)
+    importance = {target_column: 1.0, **ranked.to_dict()}
+
+    mutual_information = {}
+    if settings['mutual_information']:
+        mutual_information = _mutual_information(df, target_column, target_type, numeric, coded, settings)
+
+    return {
+        'target': target_column,
+        'target_type': target_type,
+        'method': method,
+        'feature_importance': importance,
+        'measures': measures,
+        'mutual_information': mutual_information,
+        'top_features': ranked.dropna().index[:settings['top_k']].tolist()
+    }
+
+
+def _mutual_information(df: pd.DataFrame, target_column: str, target_type: str, numeric: List[str],
+                        coded: Dict[str, Any], settings: Dict[str, Any]) -> Dict[str, float]:
+    """Mutual information of each feature with the target (scikit-learn k-NN estimators).
+
+    Rows without a target value are dropped and at most ``max_rows`` are
+    sampled; missing numeric values are filled with the column median and
+    missing categories form a category of their own.
+    """
+    rows = np.flatnonzero(df[target_column].notna().to_numpy())
+    if len(rows) > settings['max_rows']:
+        rows = np.sort(np.random.default_rng(settings['seed']).choice(rows, settings['max_rows'], replace=False))
+    if len(rows) <= settings['n_neighbors'] or not (numeric or coded):
+        return {}
+
+    numeric_values = df[numeric].iloc[rows].astype(float)
+    numeric_values = numeric_values.fillna(numeric_values.median()).fillna(0.0).to_numpy()
+    category_values = np.column_stack([codes[rows] for codes, _ in coded.values()]) if coded else np.zeros((len(rows), 0))
+    features = np.column_stack([numeric_values, category_values])
+    discrete = np.r_[np.zeros(len(numeric), dtype=bool), np.ones(len(coded), dtype=bool)]
+
+    common = {'discrete_features': discrete, 'n_neighbors': settings['n_neighbors'],
+              'random_state': settings['seed'], 'n_jobs': settings['n_jobs']}
+    if target_type == 'numeric':
+        values = mutual_info_regression(features, df[target_column].iloc[rows].to_numpy(dtype=float), **common)
+    else:
+        values = mutual_info_classif(features, encode(df[target_column].iloc[rows])[0], **common)
+    return {column: float(value) for column, value in zip(numeric + list(coded), values)}
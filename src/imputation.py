@@ -0,0 +1,311 @@
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Iterable, Optional
+from src.logger import setup_logger
+
+logger = setup_logger()
+
+IMPUTATION_METHODS = ('auto', 'mean', 'median', 'mode')
+
+DEFAULT_KNN_SETTINGS = {
+    'n_neighbors': 5,
+    'algorithm': 'auto',       # 'kd_tree', 'ball_tree' or 'auto' (sklearn NearestNeighbors)
+    'batch_size': 10000,       # Rows per kneighbors query
+    'max_fit_rows': 200000,    # Complete rows kept in the neighbour index
+    'n_jobs': -1,
+    'seed': 42
+}
+
+DEFAULT_ITERATIVE_SETTINGS = {
+    'max_iter': 10,
+    'tol': 1e-3,               # Stop once imputed values change less than this (scaled)
+    'n_nearest_features': None,  # Predict each column from its most correlated columns only
+    'max_fit_rows': 100000,    # Rows used to fit the chained regressions
+    'seed': 42
+}
+
+
+class ImputationPlanner:
+    """Plan and apply missing-value imputation.
+
+    All fill statistics are computed up front - mean, median and skew of the
+    numeric columns in one aggregation, modes of the remaining columns in one
+    ``DataFrame.mode`` call - and recorded in a JSON-serializable plan. The plan
+    is applied with a single dict-based ``fillna`` and can be reused on later
+    chunks or files without recomputing anything.
+    """
+
+    def __init__(self):
+        self.logger = logger
+
+    @staticmethod
+    def choose_method(is_numeric: bool, skew: float) -> str:
+        """Pick an imputation method: mean for roughly symmetric numeric data,
+        median for skewed numeric data and mode otherwise."""
+        if not is_numeric:
+            return 'mode'
+        return 'mean' if skew < 1 else 'median'
+
+    def plan(self, df: pd.DataFrame, method: str = 'auto',
+             columns: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Compute a fill plan.
+
+        Args:
+            df: DataFrame to compute fill statistics from
+            method: 'auto', 'mean', 'median' or 'mode' (non-numeric columns
+                always use the mode)
+            columns: Columns to plan for (defaults to all columns)
+
+        Returns:
+            Plan dictionary: {'method': method, 'columns': {column: {'method',
+            'value', 'dtype'}}}
+        """
+        if method not in IMPUTATION_METHODS:
+            raise ValueError(f"Unknown imputation method: {method}")
+
+        columns = list(df.columns if columns is None else columns)
+        is_numeric = {col: pd.api.types.is_numeric_dtype(df[col]) for col in columns}
+        numeric_cols = [col for col in columns if is_numeric[col]]
+
+        stats = df[numeric_cols].agg(['mean', 'median', 'skew']) if numeric_cols else pd.DataFrame()
+        methods = {}
+        for col in columns:
+            if not is_numeric[col]:
+                methods[col] = 'mode'
+            elif method == 'auto':
+                methods[col] = self.choose_method(True, stats.at['skew', col])
+            else:
+                methods[col] = method
+
+        mode_cols = [col for col in columns if methods[col] == 'mode']
+        modes = df[mode_cols].mode(dropna=True) if mode_cols else pd.DataFrame()
+
+        fills = {}
+        for col in columns:
+            col_method = methods[col]
+            if col_method == 'mode':
+                value = modes.at[0, col] if len(modes) else np.nan
+                if pd.isna(value) and not is_numeric[col]:
+                    value = "Unknown"
+            else:
+                value = stats.at[col_method, col]
+
+            fills[col] = {
+                'method': col_method,
+                'value': None if pd.isna(value) else _to_native(value),
+                'dtype': str(df[col].dtype)
+            }
+
+        return {'method': method, 'columns': fills}
+
+    def apply(self, df: pd.DataFrame, plan: Dict[str, Any], inplace: bool = False) -> Optional[pd.DataFrame]:
+        """Fill missing values according to a plan.
+
+        Args:
+            df: DataFrame to fill; plan columns missing from it are ignored
+            plan: Plan produced by ``plan`` (or loaded with ``load``)
+            inplace: Fill ``df`` in place instead of returning a new frame
+
+        Returns:
+            Filled DataFrame, or None when ``inplace`` is True
+        """
+        values = {}
+        for col, fill in plan['columns'].items():
+            if col in df.columns and fill['value'] is not None:
+                values[col] = _from_native(fill['value'], fill.get('dtype', ''))
+
+        if not values:
+            return None if inplace else df.copy()
+        return df.fillna(value=values, inplace=inplace)
+
+    @staticmethod
+    def save(plan: Dict[str, Any], path: str) -> None:
+        """Write a plan to a JSON file."""
+        with open(path, 'w') as f:
+            json.dump(plan, f, indent=2)
+
+    @staticmethod
+    def load(path: str) -> Dict[str, Any]:
+        """Read a plan written by ``save``."""
+        with open(path) as f:
+            return json.load(f)
+
+
+class KNNImputation:
+    """K-nearest-neighbour imputation for numeric columns.
+
+    Features are standardized and a tree index (sklearn ``NearestNeighbors``)
+    is built over a seeded sample of complete rows. Incomplete rows are grouped
+    by their missing-value pattern; each group is queried in batches against an
+    index restricted to the features it does have, and missing values are filled
+    with the neighbours' mean.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """Initialize KNNImputation.
+
+        Args:
+            settings: Overrides for ``DEFAULT_KNN_SETTINGS``
+        """
+        self.logger = logger
+        self.settings = {**DEFAULT_KNN_SETTINGS, **(settings or {})}
+
+    def impute(self, df: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Return a copy of ``df`` with missing numeric values imputed.
+
+        Args:
+            df: DataFrame to impute
+            columns: Numeric columns used as features and imputed (defaults to all)
+        """
+        from sklearn.neighbors import NearestNeighbors
+
+        columns = _numeric_columns(df, columns)
+        df_imputed = df.copy()
+        if not columns:
+            return df_imputed
+
+        values = df[columns].to_numpy(dtype=float, na_value=np.nan)
+        scaled, _, _ = _standardize(values)
+        missing = np.isnan(values)
+        complete = ~missing.any(axis=1)
+        incomplete = np.flatnonzero(~complete)
+        if len(incomplete) == 0:
+            return df_imputed
+
+        reference = np.flatnonzero(complete)
+        if len(reference) > self.settings['max_fit_rows']:
+            rng = np.random.default_rng(self.settings['seed'])
+            reference = np.sort(rng.choice(reference, self.settings['max_fit_rows'], replace=False))
+        n_neighbors = min(self.settings['n_neighbors'], len(reference))
+        if n_neighbors == 0:
+            self.logger.warning("No complete rows available for KNN imputation, falling back to column means")
+            df_imputed[columns] = df[columns].fillna(df[columns].mean())
+            return df_imputed
+
+        # Rows with the same missing-value pattern share one index over their observed features
+        patterns, pattern_ids = np.unique(missing[incomplete], axis=0, return_inverse=True)
+        pattern_ids = pattern_ids.ravel()
+        for pattern_id, pattern in enumerate(patterns):
+            rows = incomplete[pattern_ids == pattern_id]
+            observed = ~pattern
+            if not observed.any():
+                values[np.ix_(rows, pattern)] = np.nanmean(values[reference], axis=0)[pattern]
+                continue
+
+            index = NearestNeighbors(
+                n_neighbors=n_neighbors,
+                algorithm=self.settings['algorithm'],
+                n_jobs=self.settings['n_jobs']
+            ).fit(scaled[np.ix_(reference, observed)])
+
+            reference_values = values[np.ix_(reference, pattern)]
+            for start in range(0, len(rows), self.settings['batch_size']):
+                batch = rows[start:start + self.settings['batch_size']]
+                neighbours = index.kneighbors(scaled[np.ix_(batch, observed)], return_distance=False)
+                values[np.ix_(batch, pattern)] = reference_values[neighbours].mean(axis=1)
+
+        self.logger.info(f"KNN-imputed {int(missing.sum())} values in {len(incomplete)} rows "
+                         f"using {len(patterns)} missing-value patterns")
+        return _assign_filled(df_imputed, columns, values, missing)
+
+
+class IterativeImputation:
+    """Chained-equations (MICE-style) imputation for numeric columns.
+
+    Wraps sklearn's ``IterativeImputer``: each column with missing values is
+    regressed on the others in turn until the imputed values change less than
+    ``tol`` (early stopping) or ``max_iter`` rounds have run. Regressions are fitted
+    on a seeded sample of rows and can be restricted to the ``n_nearest_features``
+    most correlated columns.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """Initialize IterativeImputation.
+
+        Args:
+            settings: Overrides for ``DEFAULT_ITERATIVE_SETTINGS``
+        """
+        self.logger = logger
+        self.settings = {**DEFAULT_ITERATIVE_SETTINGS, **(settings or {})}
+        self.n_iter_ = None
+
+    def impute(self, df: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Return a copy of ``df`` with missing numeric values imputed.
+
+        Args:
+            df: DataFrame to impute
+            columns: Numeric columns used as features and imputed (defaults to all)
+        """
+        from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+        from sklearn.impute import IterativeImputer
+
+        columns = _numeric_columns(df, columns)
+        df_imputed = df.copy()
+        if not columns:
+            return df_imputed
+
+        values = df[columns].to_numpy(dtype=float, na_value=np.nan)
+        missing = np.isnan(values)
+        if not missing.any():
+            return df_imputed
+
+        # Fit on standardized values so tol means the same for every column scale
+        scaled, mean, std = _standardize(values)
+        fit_rows = scaled
+        if len(scaled) > self.settings['max_fit_rows']:
+            rng = np.random.default_rng(self.settings['seed'])
+            fit_rows = scaled[rng.choice(len(scaled), self.settings['max_fit_rows'], replace=False)]
+
+        imputer = IterativeImputer(
+            max_iter=self.settings['max_iter'],
+            tol=self.settings['tol'],
+            n_nearest_features=self.settings['n_nearest_features'],
+            random_state=self.settings['seed']
+        ).fit(fit_rows)
+        self.n_iter_ = int(imputer.n_iter_)
+
+        values = imputer.transform(scaled) * std + mean
+        self.logger.info(f"Iteratively imputed {int(missing.sum())} values "
+                         f"after {self.n_iter_} rounds")
+        return _assign_filled(df_imputed, columns, values, missing)
+
+
+def _numeric_columns(df: pd.DataFrame, columns: Optional[Iterable[str]]) -> list:
+    """Numeric, non-boolean columns with at least one observed value."""
+    columns = df.columns if columns is None else columns
+    return [col for col in columns if pd.api.types.is_numeric_dtype(df[col])
+            and not pd.api.types.is_bool_dtype(df[col]) and df[col].notna().any()]
+
+
+def _assign_filled(df: pd.DataFrame, columns: list, values: np.ndarray, missing: np.ndarray) -> pd.DataFrame:
+    """Write back only the columns that had missing values, keeping other dtypes intact."""
+    filled = missing.any(axis=0)
+    df[[col for col, has_missing in zip(columns, filled) if has_missing]] = values[:, filled]
+    return df
+
+
+def _standardize(values: np.ndarray):
+    """Scale columns to zero mean and unit variance, ignoring NaNs."""
+    mean = np.nanmean(values, axis=0)
+    std = np.nanstd(values, axis=0)
+    std = np.where(std > 0, std, 1.0)
+    return (values - mean) / std, mean, std
+
+
+def _to_native(value: Any) -> Any:
+    """Convert a fill value to a JSON-serializable Python value."""
+    if isinstance(value, (pd.Timestamp, pd.Timedelta)):
+        return str(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _from_native(value: Any, dtype: str) -> Any:
+    """Restore datetime-like fill values serialized by ``_to_native``."""
+    if isinstance(value, str) and dtype.startswith('datetime'):
+        return pd.Timestamp(value)
+    if isinstance(value, str) and dtype.startswith('timedelta'):
+        return pd.Timedelta(value)
+    return value
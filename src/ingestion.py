@@ -3,12 +3,14 @@ import os
 import numpy as np
 from werkzeug.utils import secure_filename
 from src.logger import setup_logger
+from src.imputation import ImputationPlanner
 
 logger = setup_logger()
 
 class DataIngestion:
     def __init__(self):
         self.logger = logger
+        self.imputation_plan = None
 
     def load_file(self, file_path: str) -> pd.DataFrame:
         """Load data from a file into a pandas DataFrame."""
@@ -63,26 +65,26 @@ class DataIngestion:
             self.logger.error(f"Error saving processed data: {str(e)}")
             raise
 
-    def preprocess_data(self, df):
-        """Preprocess the data by removing duplicates and handling missing values."""
+    def preprocess_data(self, df, imputation_plan=None):
+        """Preprocess the data by removing duplicates and handling missing values.
+
+        Numeric columns are filled with their mean and other columns with their
+        mode. The fill plan is kept in ``self.imputation_plan``; pass it back as
+        ``imputation_plan`` to preprocess later chunks with the same values.
+        """
         try:
             self.logger.info("Starting data preprocessing")
             
-            # Create a copy of the dataframe to avoid modifying the original
-            df_processed = df.copy()
-            
-            # Remove duplicates (keep first occurrence, consider 'id' and 'value' columns)
-            df_processed = df_processed.drop_duplicates(subset=['id', 'value'], keep='first')
+            # Remove duplicates (keep first occurrence, consider 'id' and 'value' columns);
+            # drop_duplicates returns a new frame, so the original is not modified
+            df_processed = df.drop_duplicates(subset=['id', 'value'], keep='first')
             
             # Handle missing values
-            for column in df_processed.columns:
-                if pd.api.types.is_numeric_dtype(df_processed[column]):
-                    # For numeric columns, fill with mean
-                    df_processed[column] = df_processed[column].fillna(df_processed[column].mean())
-                else:
-                    # For non-numeric columns, fill with mode
-                    mode_value = df_processed[column].mode()[0] if not df_processed[column].mode().empty else "Unknown"
-                    df_processed[column] = df_processed[column].fillna(mode_value)
+            planner = ImputationPlanner()
+            if imputation_plan is None:
+                imputation_plan = planner.plan(df_processed, method='mean')
+            self.imputation_plan = imputation_plan
+            df_processed = planner.apply(df_processed, imputation_plan)
             
             self.logger.info("Data preprocessing completed successfully")
             return df_processed
@@ -0,0 +1,245 @@
+import os
+import re
+import json
+import uuid
+import shutil
+from typing import Any, Dict, List, Optional
+import numpy as np
+import pandas as pd
+from scipy.cluster.hierarchy import leaves_list, linkage
+from scipy.spatial.distance import squareform
+from src.logger import setup_logger
+from src.plot_cache import PlotCache
+
+logger = setup_logger()
+
+DEFAULT_TILE_SETTINGS = {
+    'directory': 'data/results/matrices',
+    'wide_columns': 200,              # Wider matrices are served as tiles instead of a dict and one heatmap
+    'tile_size': 256,                 # Tile side in matrix cells (level 0) or pooled cells
+    'cluster': True,                  # Order columns by hierarchical clustering of 1 - |r|
+    'max_bytes': 1024 * 1024 * 1024,  # Least recently used matrices and tiles are removed beyond this
+    'max_age_days': 7,
+    'collect_interval_seconds': 300
+}
+
+_KEY = re.compile(r'^[0-9a-f]{32}$')
+
+
+def cluster_order(matrix: pd.DataFrame) -> np.ndarray:
+    """Column order that places strongly correlated columns next to each other.
+
+    Average-linkage clustering on the distance 1 - |r|; undefined correlations
+    count as no correlation.
+    """
+    if len(matrix) < 3:
+        return np.arange(len(matrix))
+    distance = 1.0 - np.abs(np.nan_to_num(matrix.to_numpy(dtype=float), nan=0.0))
+    distance = np.clip((distance + distance.T) / 2, 0.0, 1.0)
+    np.fill_diagonal(distance, 0.0)
+    return leaves_list(linkage(squareform(distance, checks=False), method='average'))
+
+
+def pool_strongest(block: np.ndarray, factor: int) -> np.ndarray:
+    """Downsample by ``factor`` keeping, per cell, the value of largest magnitude.
+
+    Averaging would let positive and negative correlations cancel and hide
+    strong pairs in the overview; missing values are ignored.
+    """
+    if factor == 1:
+        return np.asarray(block, dtype=np.float32)
+    rows, cols = -(-block.shape[0] // factor), -(-block.shape[1] // factor)
+    padded = np.full((rows * factor, cols * factor), np.nan, dtype=np.float32)
+    padded[:block.shape[0], :block.shape[1]] = block
+    cells = padded.reshape(rows, factor, cols, factor).transpose(0, 2, 1, 3).reshape(rows, cols, -1)
+    magnitude = np.nan_to_num(np.abs(cells), nan=-1.0)
+    strongest = np.take_along_axis(cells, magnitude.argmax(axis=2)[..., None], axis=2)[..., 0]
+    strongest[magnitude.max(axis=2) < 0] = np.nan
+    return strongest
+
+
+def encode_png(values: np.ndarray, path: str) -> None:
+    """Write values in [-1, 1] as a coolwarm PNG with one pixel per cell (missing values grey)."""
+    from matplotlib import colormaps
+    from PIL import Image
+
+    colors = colormaps['coolwarm']((np.nan_to_num(values, nan=0.0) + 1.0) / 2.0, bytes=True)[..., :3]
+    colors[np.isnan(values)] = 200
+    temp_path = _temp_path(path, 'png')
+    Image.fromarray(colors, 'RGB').save(temp_path, format='PNG')
+    os.replace(temp_path, path)
+
+
+def _temp_path(path: str, extension: str) -> str:
+    """Unique file beside ``path`` to write before renaming it into place.
+
+    Unique per call, not per process: request threads rendering the same tile
+    or tasks storing the same matrix each rename their own file, and the last
+    (identical) one wins.
+    """
+    return f"{path}.{uuid.uuid4().hex}.tmp.{extension}"
+
+
+class MatrixTiles:
+    """Correlation matrices stored as float32 arrays and served as image tiles.
+
+    A stored matrix is reordered by ``cluster_order`` and written once as an
+    ``.npy`` file named by its content hash; tiles read only their region
+    through a memory map. Level 0 has one pixel per cell, and each level up
+    halves the resolution with ``pool_strongest`` until the whole matrix fits
+    in one tile, the overview. Tiles are rendered on first request and cached
+    as PNG files; both directories are garbage-collected like plots, and every
+    tile or metadata request counts as a use of the stored matrix.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """Initialize MatrixTiles.
+
+        Args:
+            settings: Overrides for ``DEFAULT_TILE_SETTINGS``
+        """
+        self.logger = logger
+        self.settings = {**DEFAULT_TILE_SETTINGS, **(settings or {})}
+        self.directory = self.settings['directory']
+        limits = {key: self.settings[key] for key in ('max_bytes', 'max_age_days', 'collect_interval_seconds')}
+        self.matrix_cache = PlotCache({**limits, 'directory': self.directory})
+        self.tile_cache = PlotCache({**limits, 'directory': os.path.join(self.directory, 'tiles')})
+
+    def is_wide(self, matrix: pd.DataFrame) -> bool:
+        """Whether ``matrix`` should be served as tiles."""
+        return len(matrix.columns) > self.settings['wide_columns']
+
+    def save(self, matrix: pd.DataFrame) -> Dict[str, Any]:
+        """Store a correlation matrix (once per content) and return its tile metadata."""
+        key = PlotCache.key(matrix, {'tiles': True, 'cluster': self.settings['cluster']})
+        meta_path = os.path.join(self.directory, f"{key}.json")
+        if self.matrix_cache.lookup(os.path.join(self.directory, f"{key}.npy")) and self.matrix_cache.lookup(meta_path):
+            return self.metadata(key)
+
+        order = cluster_order(matrix) if self.settings['cluster'] else np.arange(len(matrix))
+        values = matrix.to_numpy(dtype=np.float32)[np.ix_(order, order)]
+        size, tile_size = len(values), self.settings['tile_size']
+        levels = 1
+        while -(-size // 2 ** (levels - 1)) > tile_size:  # Up to the level that fits in one tile
+            levels += 1
+        meta = {
+            'key': key,
+            'size': size,
+            'tile_size': tile_size,
+            'levels': levels,
+            'columns': [str(column) for column in matrix.columns[order]]
+        }
+
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = _temp_path(os.path.join(self.directory, key), 'npy')
+        np.save(temp_path, values)
+        os.replace(temp_path, os.path.join(self.directory, f"{key}.npy"))
+        temp_path = _temp_path(os.path.join(self.directory, key), 'json')
+        with open(temp_path, 'w') as f:
+            json.dump(meta, f)
+        os.replace(temp_path, meta_path)  # Written last: a matrix counts as stored once its metadata exists
+        self.logger.info(f"Stored {size}x{size} correlation matrix {key} for tiling ({levels} levels)")
+        self.matrix_cache.maybe_collect()
+        return meta
+
+    def metadata(self, key: str) -> Dict[str, Any]:
+        """Tile metadata of a stored matrix.
+
+        Raises:
+            ValueError: If the key is malformed
+            FileNotFoundError: If no matrix is stored under the key
+        """
+        if not _KEY.match(key):
+            raise ValueError(f"Invalid matrix key '{key}'")
+        self._use(key)
+        with open(os.path.join(self.directory, f"{key}.json")) as f:
+            return json.load(f)
+
+    def files(self, key: str) -> Dict[str, str]:
+        """The files of a stored matrix by name, for keeping a copy beside stored results."""
+        return {ext: os.path.join(self.directory, f"{key}.{ext}") for ext in ('npy', 'json')}
+
+    def restore(self, key: str, files: Dict[str, Optional[str]]) -> bool:
+        """Make a stored matrix servable again, copying it back from ``files`` if it expired.
+
+        Args:
+            key: Matrix key from the tile metadata
+            files: Copies of the matrix's files by name, as from ``files``
+
+        Returns:
+            False if the matrix is gone and no complete copy was given
+        """
+        try:
+            self.metadata(key)
+            return True
+        except FileNotFoundError:
+            pass
+        if not all(files.get(ext) for ext in ('npy', 'json')):
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        for ext in ('npy', 'json'):  # Metadata last: a matrix counts as stored once it exists
+            temp_path = _temp_path(os.path.join(self.directory, key), ext)
+            shutil.copyfile(files[ext], temp_path)
+            os.replace(temp_path, os.path.join(self.directory, f"{key}.{ext}"))
+        self.logger.info(f"Restored correlation matrix {key} for stored results")
+        self.matrix_cache.maybe_collect()
+        return True
+
+    def _use(self, key: str) -> None:
+        """Record a use of a stored matrix so browsing keeps it from expiring.
+
+        A matrix missing either of its files cannot be served; what is left of
+        it is removed.
+        """
+        paths = [os.path.join(self.directory, f"{key}.npy"), os.path.join(self.directory, f"{key}.json")]
+        if all([self.matrix_cache.lookup(path) for path in paths]):
+            return
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        raise FileNotFoundError(f"No correlation matrix stored under '{key}'")
+
+    def _region(self, key: str, level: int, row: int, col: int) -> np.ndarray:
+        meta = self.metadata(key)
+        tile_size = meta['tile_size']
+        if not 0 <= level < meta['levels']:
+            raise ValueError(f"Level must be between 0 and {meta['levels'] - 1}")
+        factor = 2 ** level
+        tiles = -(-meta['size'] // (tile_size * factor))
+        if not (0 <= row < tiles and 0 <= col < tiles):
+            raise ValueError(f"Tile ({row}, {col}) is outside the {tiles}x{tiles} tiles of level {level}")
+        span = tile_size * factor
+        values = np.load(os.path.join(self.directory, f"{key}.npy"), mmap_mode='r')
+        return pool_strongest(values[row * span:(row + 1) * span, col * span:(col + 1) * span], factor)
+
+    def tile(self, key: str, level: int, row: int, col: int) -> str:
+        """Path of a PNG tile, rendering it on first request.
+
+        Raises:
+            ValueError: If the key, level or tile position is invalid
+            FileNotFoundError: If no matrix is stored under the key
+        """
+        path = os.path.join(self.tile_cache.directory, f"{key}_{level}_{row}_{col}.png")
+        if _KEY.match(key) and self.tile_cache.lookup(path):
+            self._use(key)
+            return path
+        region = self._region(key, level, row, col)
+        os.makedirs(self.tile_cache.directory, exist_ok=True)
+        encode_png(region, path)
+        self.tile_cache.maybe_collect()
+        return path
+
+    def tile_values(self, key: str, level: int, row: int, col: int) -> Dict[str, Any]:
+        """Cell values of a tile (3 decimals, missing as None) with the labels of level-0 tiles."""
+        region = self._region(key, level, row, col)
+        values: List[List[Optional[float]]] = np.round(region.astype(float), 3).tolist()
+        values = [[None if value != value else value for value in line] for line in values]
+        result = {'level': level, 'row': row, 'col': col, 'values': values}
+        if level == 0:
+            meta = self.metadata(key)
+            start_row, start_col = row * meta['tile_size'], col * meta['tile_size']
+            result['row_labels'] = meta['columns'][start_row:start_row + region.shape[0]]
+            result['col_labels'] = meta['columns'][start_col:start_col + region.shape[1]]
+        return result
@@ -1,11 +1,10 @@
 import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
 from typing import List, Dict, Any
 import os
 from src.logger import setup_logger
 from src.correlation import CorrelationAnalyzer
+from src.plot_renderer import render_heatmap
 
 logger = setup_logger()
 
@@ -39,17 +38,21 @@ class MultiFileCorrelationAnalyzer:
         
         return similar_columns
 
-    def analyze_cross_file_correlations(self, files: List[str]) -> Dict[str, Any]:
+    def analyze_cross_file_correlations(self, files: List[str], renderer=None) -> Dict[str, Any]:
         """Analyze correlations between multiple CSV files.
         
         Args:
             files: List of paths to CSV files
+            renderer: PlotRenderer whose workers draw the heatmap (waited for, so
+                the image comes with the results); without one it is drawn in-process
             
         Returns:
             Dictionary containing:
             - cross_correlations: Correlations between similar columns across files
             - file_correlations: Individual file correlation matrices
             - similar_columns: List of similar columns found between files
+            - cross_correlation_matrix_path: Heatmap image, or None if there is
+              nothing to plot or rendering failed
         """
         if len(files) < 2:
             return {"error": "Need at least 2 files for cross-file correlation analysis"}
@@ -102,8 +105,6 @@ class MultiFileCorrelationAnalyzer:
             
             # Generate cross-file correlation heatmap
             if cross_correlations:
-                plt.figure(figsize=(12, 8))
-                
                 # Create a matrix for the heatmap
                 unique_columns = set()
                 for corr in cross_correlations:
@@ -120,34 +121,41 @@ class MultiFileCorrelationAnalyzer:
                     idx2 = unique_columns.index(f"{corr['file2']}:{corr['column2']}")
                     correlation_matrix[idx1][idx2] = corr['correlation']
                     correlation_matrix[idx2][idx1] = corr['correlation']  # Mirror the correlation
-                
-                # Create heatmap
-                sns.heatmap(correlation_matrix, 
-                           xticklabels=unique_columns,
-                           yticklabels=unique_columns,
-                           cmap='coolwarm',
-                           center=0,
-                           annot=True)
-                plt.title('Cross-file Correlation Matrix')
-                plt.xticks(rotation=45, ha='right')
-                plt.yticks(rotation=0)
-                plt.tight_layout()
-                
-                # Save plot
-                os.makedirs('static/plots', exist_ok=True)
-                plot_path = 'static/plots/cross_file_correlation_matrix.png'
-                plt.savefig(plot_path)
-                plt.close()
+
+                matrix = pd.DataFrame(correlation_matrix, index=unique_columns, columns=unique_columns)
             else:
-                plot_path = None
-            
-            return {
+                matrix = None
+
+            results = {
                 'cross_correlations': cross_correlations,
                 'file_correlations': file_correlations,
                 'similar_columns': similar_columns,
-                'cross_correlation_matrix_path': plot_path
+                'cross_correlation_matrix_path': None
             }
+            if matrix is not None:
+                results['cross_correlation_matrix_path'] = self._plot_heatmap(matrix, renderer)
+            return results
             
         except Exception as e:
             self.logger.error(f"Error in cross-file correlation analysis: {str(e)}")
             return {"error": str(e)}
+
+    def _plot_heatmap(self, matrix, renderer):
+        """Path of the cross-file heatmap, reusing the image of an identical matrix."""
+        plot_cache = self.correlation_analyzer.plot_cache
+        style = {'title': 'Cross-file Correlation Matrix', 'figsize': (12, 8), 'rotate_labels': True}
+        params = {'annotate': True, 'dpi': 100} if renderer is None else renderer.heatmap_params(matrix)
+        plot_path = plot_cache.path('cross_file_correlation_matrix', matrix, {**params, **style})
+        if plot_cache.lookup(plot_path):
+            return plot_path
+        try:
+            if renderer is None:
+                render_heatmap(matrix, plot_path, **params, **style)
+            else:
+                # Drawn by a warm worker rather than with pyplot in this thread
+                renderer.submit_heatmap(matrix, plot_path, **style).result()
+        except Exception as e:
+            self.logger.error(f"Could not render cross-file heatmap: {str(e)}")
+            return None
+        plot_cache.maybe_collect()
+        return plot_path
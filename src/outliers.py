@@ -0,0 +1,196 @@
+import warnings
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+from scipy.stats import chi2
+from src.logger import setup_logger
+from src.violations import ViolationBitmap
+
+logger = setup_logger()
+
+DEFAULT_MULTIVARIATE_SETTINGS = {
+    'enabled': True,
+    'methods': ['mahalanobis', 'isolation_forest'],
+    'max_samples': 20000,      # Rows used to fit the robust covariance / forest
+    'mahalanobis_quantile': 0.975,
+    'n_estimators': 100,
+    'contamination': 'auto',
+    'n_jobs': -1,
+    'seed': 42
+}
+
+
+class OutlierDetector:
+    """Vectorized univariate and multivariate outlier detection.
+
+    Z-score, robust MAD and IQR bounds are computed for all numeric columns at
+    once as 2-D array operations; wide tables are split into column blocks that
+    run on a thread pool. Flagged rows are returned as ``ViolationBitmap``s.
+    """
+
+    def __init__(self, z_score_threshold: float = 3, iqr_threshold: float = 1.5,
+                 mad_threshold: float = 3.5, n_jobs: int = 1, block_columns: int = 64,
+                 multivariate_settings: Optional[Dict[str, Any]] = None):
+        """Initialize OutlierDetector.
+
+        Args:
+            z_score_threshold: Absolute z-score above which a value is an outlier
+            iqr_threshold: IQR multiplier for the Tukey fences
+            mad_threshold: Absolute robust (MAD-based) z-score threshold
+            n_jobs: Threads used for column blocks (-1 for all cores)
+            block_columns: Number of columns per block
+            multivariate_settings: Overrides for ``DEFAULT_MULTIVARIATE_SETTINGS``
+        """
+        self.logger = logger
+        self.z_score_threshold = z_score_threshold
+        self.iqr_threshold = iqr_threshold
+        self.mad_threshold = mad_threshold
+        self.n_jobs = n_jobs
+        self.block_columns = block_columns
+        self.multivariate_settings = {**DEFAULT_MULTIVARIATE_SETTINGS, **(multivariate_settings or {})}
+
+    def detect(self, df: pd.DataFrame) -> Tuple[Dict[str, Any], Dict[str, Dict[str, ViolationBitmap]]]:
+        """Detect univariate outliers in every numeric column.
+
+        Args:
+            df: DataFrame to analyze
+
+        Returns:
+            Tuple of (per-column outlier summary, per-column {method: bitmap})
+        """
+        numeric = df.select_dtypes(include=[np.number])
+        columns = list(numeric.columns)
+        if not columns:
+            return {}, {}
+
+        blocks = [columns[i:i + self.block_columns] for i in range(0, len(columns), self.block_columns)]
+        workers = None if self.n_jobs == -1 else max(self.n_jobs, 1)
+        if len(blocks) == 1 or workers == 1:
+            block_results = [self._detect_block(numeric[block]) for block in blocks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                block_results = list(pool.map(lambda block: self._detect_block(numeric[block]), blocks))
+
+        summaries, bitmaps = {}, {}
+        for block_summary, block_bitmaps in block_results:
+            summaries.update(block_summary)
+            bitmaps.update(block_bitmaps)
+        return summaries, bitmaps
+
+    def _detect_block(self, block: pd.DataFrame):
+        values = block.to_numpy(dtype=float, na_value=np.nan)
+
+        with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)  # All-NaN columns
+            # Z-score (population std, as scipy.stats.zscore)
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0)
+            z_mask = np.abs(values - mean) / std > self.z_score_threshold
+
+            # Robust z-score from the median absolute deviation; when over half the
+            # values equal the median the MAD is 0, so the mean absolute deviation is used
+            median = np.nanmedian(values, axis=0)
+            deviation = np.abs(values - median)
+            mad = np.nanmedian(deviation, axis=0)
+            scale = np.where(mad > 0, mad / 0.6745, 1.2533 * np.nanmean(deviation, axis=0))
+            mad_mask = deviation / scale > self.mad_threshold
+
+            # Tukey fences
+            q1, q3 = np.nanpercentile(values, [25, 75], axis=0)
+            iqr = q3 - q1
+            lower, upper = q1 - self.iqr_threshold * iqr, q3 + self.iqr_threshold * iqr
+            iqr_mask = (values < lower) | (values > upper)
+
+        z_counts, mad_counts, iqr_counts = z_mask.sum(axis=0), mad_mask.sum(axis=0), iqr_mask.sum(axis=0)
+
+        summaries, bitmaps = {}, {}
+        for i, col in enumerate(block.columns):
+            summaries[col] = {
+                'z_score_outliers': int(z_counts[i]),
+                'iqr_outliers': int(iqr_counts[i]),
+                'mad_outliers': int(mad_counts[i]),
+                'iqr_bounds': [_finite(lower[i]), _finite(upper[i])]
+            }
+            bitmaps[col] = {
+                method: ViolationBitmap.from_mask(mask[:, i])
+                for method, mask in (('z_score', z_mask), ('iqr', iqr_mask), ('mad', mad_mask))
+                if mask[:, i].any()
+            }
+        return summaries, bitmaps
+
+    def detect_multivariate(self, df: pd.DataFrame) -> Tuple[Dict[str, Any], Dict[str, ViolationBitmap]]:
+        """Detect multivariate outliers across all numeric columns.
+
+        Rows with missing values are not scored. Models are fitted on a seeded
+        subsample of at most ``max_samples`` complete rows and then applied to all
+        complete rows.
+
+        Returns:
+            Tuple of (per-method summary, per-method bitmap over all rows)
+        """
+        settings = self.multivariate_settings
+        numeric = df.select_dtypes(include=[np.number])
+        numeric = numeric.loc[:, numeric.std() > 0]
+        complete = numeric.notna().all(axis=1).to_numpy()
+        values = numeric.to_numpy(dtype=float, na_value=np.nan)[complete]
+
+        if numeric.shape[1] < 2 or len(values) <= numeric.shape[1] * 2:
+            return {'message': 'Not enough complete numeric data for multivariate outlier detection'}, {}
+
+        rng = np.random.default_rng(settings['seed'])
+        if len(values) > settings['max_samples']:
+            fit_values = values[rng.choice(len(values), settings['max_samples'], replace=False)]
+        else:
+            fit_values = values
+
+        summaries, bitmaps = {}, {}
+        for method in settings['methods']:
+            try:
+                if method == 'mahalanobis':
+                    flagged, details = self._mahalanobis(fit_values, values)
+                elif method == 'isolation_forest':
+                    flagged, details = self._isolation_forest(fit_values, values)
+                else:
+                    summaries[method] = f"Unknown multivariate method: {method}"
+                    continue
+            except Exception as e:
+                self.logger.error(f"Error in {method} outlier detection: {str(e)}")
+                summaries[method] = f"Could not run {method}: {str(e)}"
+                continue
+
+            mask = np.zeros(len(df), dtype=bool)
+            mask[np.flatnonzero(complete)[flagged]] = True
+            bitmaps[method] = ViolationBitmap.from_mask(mask)
+            summaries[method] = {
+                'outlier_count': int(flagged.sum()),
+                'rows_scored': int(len(values)),
+                'rows_fitted': int(len(fit_values)),
+                'features': list(numeric.columns),
+                **details
+            }
+        return summaries, bitmaps
+
+    def _mahalanobis(self, fit_values: np.ndarray, values: np.ndarray):
+        from sklearn.covariance import MinCovDet
+
+        estimator = MinCovDet(random_state=self.multivariate_settings['seed']).fit(fit_values)
+        distances = estimator.mahalanobis(values)  # Squared distances
+        threshold = chi2.ppf(self.multivariate_settings['mahalanobis_quantile'], values.shape[1])
+        return distances > threshold, {'threshold': float(threshold)}
+
+    def _isolation_forest(self, fit_values: np.ndarray, values: np.ndarray):
+        from sklearn.ensemble import IsolationForest
+
+        settings = self.multivariate_settings
+        forest = IsolationForest(
+            n_estimators=settings['n_estimators'],
+            contamination=settings['contamination'],
+            n_jobs=settings['n_jobs'],
+            random_state=settings['seed']
+        ).fit(fit_values)
+        return forest.predict(values) == -1, {'contamination': settings['contamination']}
+
+
+def _finite(value: float) -> Optional[float]:
+    return float(value) if np.isfinite(value) else None
@@ -0,0 +1,126 @@
+import os
+import json
+import time
+import hashlib
+from threading import Lock
+from typing import Any, Dict, Optional
+import numpy as np
+import pandas as pd
+from src.logger import setup_logger
+
+logger = setup_logger()
+
+DEFAULT_PLOT_CACHE_SETTINGS = {
+    'directory': 'static/plots',
+    'max_bytes': 200 * 1024 * 1024,  # Least recently used plots are removed beyond this
+    'max_age_days': 7,               # Plots unused for longer are removed
+    'collect_interval_seconds': 300  # Minimum time between collections triggered by new plots
+}
+
+# Bump when a change alters how plots are drawn, so cached images are redrawn
+RENDER_VERSION = '1'
+
+
+class PlotCache:
+    """Content-addressed plot files with LRU garbage collection.
+
+    A plot's file name is a hash of the plotted matrix (values and labels), the
+    render parameters and ``RENDER_VERSION``. Identical plots therefore share
+    one file across tasks and restarts, and different data never overwrites
+    another plot. A file's modification time records its last use; the
+    collector removes plots unused for ``max_age_days`` and then the least
+    recently used ones until the directory fits in ``max_bytes``. Files whose
+    names share the part before the first dot are kept or removed together.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """Initialize PlotCache.
+
+        Args:
+            settings: Overrides for ``DEFAULT_PLOT_CACHE_SETTINGS``
+        """
+        self.logger = logger
+        self.settings = {**DEFAULT_PLOT_CACHE_SETTINGS, **(settings or {})}
+        self.directory = self.settings['directory']
+        self._lock = Lock()
+        self._last_collect = 0.0
+
+    @staticmethod
+    def key(matrix: pd.DataFrame, params: Optional[Dict[str, Any]] = None) -> str:
+        """Hash of a matrix's values (to 10 decimals) and labels and the render parameters."""
+        digest = hashlib.blake2b(digest_size=16)
+        # Rounded so last-bit differences between equivalent computations share a plot
+        digest.update(np.ascontiguousarray(np.round(matrix.to_numpy(dtype=float), 10)).tobytes())
+        labels = [[str(label) for label in matrix.index], [str(label) for label in matrix.columns]]
+        digest.update(json.dumps([labels, params or {}, RENDER_VERSION], sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def path(self, kind: str, matrix: pd.DataFrame, params: Optional[Dict[str, Any]] = None) -> str:
+        """File a plot of ``matrix`` is cached at."""
+        return os.path.join(self.directory, f"{kind}_{self.key(matrix, params)}.png")
+
+    def lookup(self, path: str) -> bool:
+        """Whether a plot is cached; a hit counts as a use for LRU purposes."""
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        self.logger.info(f"Reusing cached plot {path}")
+        return True
+
+    def collect(self) -> Dict[str, int]:
+        """Remove expired plots, then least recently used ones over the size limit.
+
+        Returns:
+            Dictionary with the number of files and bytes removed and kept
+        """
+        with self._lock:
+            self._last_collect = time.time()
+            try:
+                names = os.listdir(self.directory)
+            except FileNotFoundError:
+                return {'removed': 0, 'removed_bytes': 0, 'kept': 0, 'kept_bytes': 0}
+
+            groups = {}
+            for name in names:
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                if not os.path.isfile(path):
+                    continue
+                in_progress = '.tmp.' in name
+                # Files sharing a name up to the first dot (a matrix and its metadata) are one entry
+                group = groups.setdefault(name if in_progress else name.split('.', 1)[0], [0.0, 0, [], in_progress])
+                group[0] = max(group[0], stat.st_mtime)  # Last use of any of its files
+                group[1] += stat.st_size
+                group[2].append(path)
+            entries = sorted(tuple(group) for group in groups.values())  # Least recently used first
+
+            cutoff = self._last_collect - self.settings['max_age_days'] * 86400
+            total = sum(size for _, size, _, _ in entries)
+            removed = removed_bytes = 0
+            for mtime, size, paths, in_progress in entries:
+                expired = mtime < cutoff
+                # Files still being written are only removed once they are stale
+                if not expired and (in_progress or total <= self.settings['max_bytes']):
+                    continue
+                for path in paths:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                total -= size
+                removed += len(paths)
+                removed_bytes += size
+
+            if removed:
+                self.logger.info(f"Removed {removed} cached plots ({removed_bytes} bytes)")
+            return {'removed': removed, 'removed_bytes': removed_bytes,
+                    'kept': sum(len(paths) for _, _, paths, _ in entries) - removed, 'kept_bytes': total}
+
+    def maybe_collect(self) -> None:
+        """Collect if the last collection is older than ``collect_interval_seconds``."""
+        if time.time() - self._last_collect >= self.settings['collect_interval_seconds']:
+            self.collect()
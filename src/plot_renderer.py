@@ -0,0 +1,158 @@
+import os
+import signal
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple
+import pandas as pd
+from src.logger import setup_logger
+
+logger = setup_logger()
+
+DEFAULT_PLOT_SETTINGS = {
+    'workers': 2,                 # Rendering processes kept warm for the life of the app
+    'start_method': 'spawn',      # Workers never inherit the app's threads or pyplot state
+    'timeout_seconds': 60,        # A render running longer than this is abandoned
+    'annotate_max_columns': 20,   # Heatmaps of wider matrices are drawn without cell labels
+    'dpi': 100
+}
+
+
+def _warm_up() -> None:
+    """Worker initializer: import the plotting stack once per process."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot  # noqa: F401
+    import seaborn  # noqa: F401
+
+
+class _RenderTimeout(BaseException):
+    """Raised by the alarm; a BaseException so library ``except Exception`` blocks cannot swallow it."""
+
+
+def _on_alarm(signum, frame):
+    raise _RenderTimeout()
+
+
+def render_heatmap(matrix: pd.DataFrame, path: str, annotate: bool = True, dpi: int = 100,
+                   timeout_seconds: Optional[float] = None, title: str = 'Correlation Matrix',
+                   figsize: Tuple[float, float] = (10, 8), rotate_labels: bool = False) -> str:
+    """Draw a correlation heatmap and save it to ``path``.
+
+    Runs inside a rendering worker, where pyplot's global state belongs to a
+    single job at a time. ``rotate_labels`` slants the column labels and
+    tightens the layout, for long labels.
+
+    Returns:
+        The path the image was written to
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    if timeout_seconds and hasattr(signal, 'SIGALRM'):
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+    try:
+        plt.figure(figsize=figsize)
+        sns.heatmap(matrix, annot=annotate, cmap='coolwarm', center=0)
+        plt.title(title)
+        if rotate_labels:
+            plt.xticks(rotation=45, ha='right')
+            plt.yticks(rotation=0)
+            plt.tight_layout()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # Write beside the target and rename so a reader never sees a partial image
+        temp_path = f"{path}.{os.getpid()}.tmp.png"
+        plt.savefig(temp_path, dpi=dpi)
+        os.replace(temp_path, path)
+        return path
+    except _RenderTimeout:
+        raise TimeoutError(f"Plot rendering timed out after {timeout_seconds}s") from None
+    finally:
+        if timeout_seconds and hasattr(signal, 'SIGALRM'):
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        plt.close('all')
+
+
+class PlotRenderer:
+    """Pool of warm rendering processes that draw plots off the task thread.
+
+    Jobs are queued on a process pool whose workers import matplotlib and
+    seaborn once and then stay alive, so a job pays only for drawing. Each job
+    runs under a timeout enforced inside the worker, and its callback receives
+    either the image path or the error.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """Initialize PlotRenderer.
+
+        Args:
+            settings: Overrides for ``DEFAULT_PLOT_SETTINGS``
+        """
+        self.logger = logger
+        self.settings = {**DEFAULT_PLOT_SETTINGS, **(settings or {})}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.settings['workers'],
+                    mp_context=multiprocessing.get_context(self.settings['start_method']),
+                    initializer=_warm_up
+                )
+                self.logger.info(f"Started {self.settings['workers']} plot rendering workers")
+            return self._executor
+
+    def start(self) -> None:
+        """Start and warm up every worker ahead of the first job."""
+        pool = self._pool()
+        for _ in range(self.settings['workers']):
+            pool.submit(_warm_up)
+
+    def heatmap_params(self, matrix: pd.DataFrame) -> Dict[str, Any]:
+        """Render parameters ``submit_heatmap`` uses for ``matrix``."""
+        return {'annotate': len(matrix.columns) <= self.settings['annotate_max_columns'], 'dpi': self.settings['dpi']}
+
+    def submit_heatmap(self, matrix: pd.DataFrame, path: str,
+                       callback: Optional[Callable[[Optional[str], Optional[BaseException]], None]] = None,
+                       **style: Any) -> Future:
+        """Queue a correlation heatmap.
+
+        Args:
+            matrix: Correlation matrix to draw
+            path: Where to save the image
+            callback: Called with (path, None) on success or (None, error) on
+                failure or timeout, from a pool thread
+            style: ``render_heatmap`` options (title, figsize, rotate_labels)
+
+        Returns:
+            Future resolving to the image path
+        """
+        params = self.heatmap_params(matrix)
+        future = self._pool().submit(
+            render_heatmap, matrix, path, params['annotate'], params['dpi'], self.settings['timeout_seconds'], **style
+        )
+
+        def done(future: Future) -> None:
+            error = future.exception()
+            if error is not None:
+                self.logger.error(f"Rendering {path} failed: {error}")
+            if callback is not None:
+                try:
+                    callback(None if error else future.result(), error)
+                except Exception as e:
+                    self.logger.error(f"Plot callback failed: {str(e)}")
+
+        future.add_done_callback(done)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers; queued jobs that have not started are cancelled."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
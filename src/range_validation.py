@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Tuple
+from src.logger import setup_logger
+from src.violations import ViolationBitmap
+
+logger = setup_logger()
+
+
+class RangeValidator:
+    """Range validation for all configured columns in one broadcasted comparison.
+
+    Configured bounds are stacked into min/max vectors (missing bounds become
+    -inf/+inf) and compared against the 2-D numeric block of the checked
+    columns, giving per-column violation counts and row bitmaps without
+    building per-column sub-frames. Chunks can be fed one at a time with
+    ``update`` for out-of-core inputs.
+    """
+
+    def __init__(self, range_config: Dict[str, Dict[str, Any]], track_rows: bool = True):
+        """Initialize RangeValidator.
+
+        Args:
+            range_config: Dictionary of column names and their valid ranges
+                (e.g., {'column_name': {'min': 0, 'max': 100}})
+            track_rows: Keep violating row positions for bitmaps (counts only if False)
+        """
+        self.logger = logger
+        self.range_config = range_config or {}
+        self.track_rows = track_rows
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all chunks seen so far."""
+        self.rows = 0
+        self.columns = None     # Checked columns, fixed by the first chunk
+        self.messages = {}      # column -> reason it cannot be checked
+        self.mins = np.zeros(0)
+        self.maxs = np.zeros(0)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self._positions = []    # Per checked column: list of violating row positions per chunk
+
+    def validate(self, df: pd.DataFrame) -> Tuple[Dict[str, Any], Dict[str, ViolationBitmap]]:
+        """Validate a whole DataFrame; see ``results`` for the return value."""
+        self.reset()
+        self.update(df)
+        return self.results()
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Check one chunk of rows."""
+        if self.columns is None:
+            self._resolve_columns(chunk)
+
+        if self.columns:
+            values = chunk[self.columns].to_numpy(dtype=float, na_value=np.nan)
+            mask = (values < self.mins) | (values > self.maxs)  # NaN compares False
+            counts = mask.sum(axis=0)
+            self.counts += counts
+            if self.track_rows:
+                for i in np.flatnonzero(counts):
+                    self._positions[i].append(self.rows + np.flatnonzero(mask[:, i]))
+        self.rows += len(chunk)
+
+    def results(self) -> Tuple[Dict[str, Any], Dict[str, ViolationBitmap]]:
+        """Per-column results and bitmaps for columns with violations.
+
+        Returns:
+            Tuple of ({column: result entry or message}, {violation check: bitmap});
+            bitmaps are empty when ``track_rows`` is False
+        """
+        summary = dict(self.messages)
+        bitmaps = {}
+        for i, column in enumerate(self.columns or []):
+            if self.counts[i] == 0:
+                continue
+            ranges = self.range_config[column]
+            summary[column] = {
+                'min_range': ranges.get('min'),
+                'max_range': ranges.get('max'),
+                'out_of_range_count': int(self.counts[i])
+            }
+            if self.track_rows:
+                check_name = f"range_validation.{column}"
+                bitmaps[check_name] = ViolationBitmap.from_positions(np.concatenate(self._positions[i]), self.rows)
+                summary[column]['violation_check'] = check_name
+        return summary, bitmaps
+
+    def _resolve_columns(self, chunk: pd.DataFrame) -> None:
+        columns, mins, maxs = [], [], []
+        for column, ranges in self.range_config.items():
+            if column not in chunk.columns:
+                self.messages[column] = "Column not found"
+            elif not pd.api.types.is_numeric_dtype(chunk[column]):
+                self.messages[column] = "Column is not numeric"
+            elif ranges.get('min') is not None or ranges.get('max') is not None:
+                columns.append(column)
+                mins.append(-np.inf if ranges.get('min') is None else ranges['min'])
+                maxs.append(np.inf if ranges.get('max') is None else ranges['max'])
+
+        self.columns = columns
+        self.mins = np.array(mins, dtype=float)
+        self.maxs = np.array(maxs, dtype=float)
+        self.counts = np.zeros(len(columns), dtype=np.int64)
+        self._positions = [[] for _ in columns]
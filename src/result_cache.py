@@ -0,0 +1,215 @@
+import os
+import json
+import time
+import pickle
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional
+import pandas as pd
+from src.logger import setup_logger
+from src.results_store import PIPELINE_VERSION
+
+logger = setup_logger()
+
+DEFAULT_RESULT_CACHE_SETTINGS = {
+    'max_bytes': 512 * 1024 * 1024,  # Least recently used entries are removed from disk beyond this
+    'max_age_days': 30,              # Entries unused for longer are removed from disk
+    'collect_interval_seconds': 300  # Minimum time between collections triggered by writes
+}
+
+_MISSING = object()
+
+
+class ResultCache:
+    """Two-level cache for per-column check results.
+
+    Entries are keyed by (column content hash, check name, config slice,
+    ``PIPELINE_VERSION``). Recent entries live in an in-memory LRU; every entry
+    is also written to a local on-disk store so re-runs after a restart can
+    reuse it. The store keeps each pipeline version in its own subdirectory, so
+    entries of earlier versions are never read again and age out; a read
+    counts as a use, and the collector removes entries unused for
+    ``max_age_days`` and then the least recently used ones over ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: str = 'data/cache/validation', max_entries: int = 4096,
+                 settings: Optional[Dict[str, Any]] = None):
+        """Initialize ResultCache.
+
+        Args:
+            cache_dir: Directory for the on-disk store (None for memory only)
+            max_entries: Maximum number of entries kept in memory
+            settings: Overrides for ``DEFAULT_RESULT_CACHE_SETTINGS``
+        """
+        self.logger = logger
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.settings = {**DEFAULT_RESULT_CACHE_SETTINGS, **(settings or {})}
+        self.store_dir = os.path.join(cache_dir, f"v{PIPELINE_VERSION}") if cache_dir else None
+        self._memory = OrderedDict()
+        self._lock = Lock()
+        self._collect_lock = Lock()
+        self._last_collect = 0.0
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_dir:
+            os.makedirs(self.store_dir, exist_ok=True)
+
+    @staticmethod
+    def column_hash(series: pd.Series) -> str:
+        """Hash a column's name, dtype and values."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{series.name}|{series.dtype}|{len(series)}".encode())
+        digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def frame_hash(df: pd.DataFrame) -> str:
+        """Hash a DataFrame's columns (names, dtypes and values)."""
+        digest = hashlib.blake2b(digest_size=16)
+        for column in df.columns:
+            digest.update(ResultCache.column_hash(df[column]).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(content_hash: str, check_name: str, config_slice: Any = None) -> str:
+        """Build a cache key from a content hash, check name, config slice and pipeline version."""
+        config_json = json.dumps(config_slice, sort_keys=True, default=str)
+        raw = f"{content_hash}|{check_name}|{config_json}|{PIPELINE_VERSION}"
+        return hashlib.blake2b(raw.encode(), digest_size=20).hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Look up a cached result, falling back to the on-disk store."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+        value = self._read_disk(key)
+        with self._lock:
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._remember(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result in memory and on disk."""
+        with self._lock:
+            self._remember(key, value)
+        self._write_disk(key, value)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the on-disk store is kept)."""
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters."""
+        return {'hits': self.hits, 'misses': self.misses, 'memory_entries': len(self._memory)}
+
+    def collect(self) -> Dict[str, int]:
+        """Remove expired entries from disk, then least recently used ones over the size limit.
+
+        Every version subdirectory is collected, so entries of earlier pipeline
+        versions are removed once they expire or the store is over its limit.
+
+        Returns:
+            Dictionary with the number of files and bytes removed and kept
+        """
+        with self._collect_lock:
+            self._last_collect = time.time()
+            if not self.cache_dir:
+                return {'removed': 0, 'removed_bytes': 0, 'kept': 0, 'kept_bytes': 0}
+
+            entries = []
+            for root, _, names in os.walk(self.cache_dir):
+                for name in names:
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path, '.tmp' in name))
+            entries.sort()  # Least recently used first
+
+            cutoff = self._last_collect - self.settings['max_age_days'] * 86400
+            total = sum(size for _, size, _, _ in entries)
+            removed = removed_bytes = 0
+            for mtime, size, path, in_progress in entries:
+                expired = mtime < cutoff
+                # Files still being written are only removed once they are stale
+                if not expired and (in_progress or total <= self.settings['max_bytes']):
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+                removed_bytes += size
+
+            if removed:
+                self.logger.info(f"Removed {removed} cached results ({removed_bytes} bytes)")
+            return {'removed': removed, 'removed_bytes': removed_bytes,
+                    'kept': len(entries) - removed, 'kept_bytes': total}
+
+    def maybe_collect(self) -> None:
+        """Collect if the last collection is older than ``collect_interval_seconds``."""
+        if time.time() - self._last_collect >= self.settings['collect_interval_seconds']:
+            self.collect()
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.store_dir, key[:2], f"{key}.pkl")
+
+    def _read_disk(self, key: str) -> Any:
+        if not self.cache_dir:
+            return _MISSING
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            os.utime(path)  # A hit counts as a use for LRU purposes
+            return value
+        except FileNotFoundError:
+            return _MISSING
+        except Exception as e:
+            self.logger.warning(f"Discarding unreadable cache entry {path}: {str(e)}")
+            return _MISSING
+
+    def _write_disk(self, key: str, value: Any) -> None:
+        if not self.cache_dir:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.warning(f"Could not write cache entry {path}: {str(e)}")
+        self.maybe_collect()
+
+
+_caches: Dict[Optional[str], ResultCache] = {}
+_caches_lock = Lock()
+
+
+def get_result_cache(cache_dir: Optional[str] = 'data/cache/validation', max_entries: int = 4096,
+                     settings: Optional[Dict[str, Any]] = None) -> ResultCache:
+    """Return the process-wide ResultCache for a cache directory."""
+    with _caches_lock:
+        if cache_dir not in _caches:
+            _caches[cache_dir] = ResultCache(cache_dir, max_entries, settings)
+        return _caches[cache_dir]
@@ -0,0 +1,219 @@
+import os
+import re
+import gzip
+import shutil
+import json
+import sqlite3
+import hashlib
+from contextlib import contextmanager
+import pyarrow as pa
+import pyarrow.parquet as pq
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from src.logger import setup_logger
+from src.violations import ViolationBitmap
+
+logger = setup_logger()
+
+# Bump when a change alters the results produced for the same input and config
+PIPELINE_VERSION = '1'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    task_id TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    dataset TEXT,
+    content_hash TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    pipeline_version TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    violation_checks INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_results_key ON results (content_hash, config_hash, pipeline_version);
+CREATE INDEX IF NOT EXISTS idx_results_filename ON results (filename, created_at);
+CREATE INDEX IF NOT EXISTS idx_results_created_at ON results (created_at);
+"""
+
+
+class ResultsStore:
+    """Embedded, file-based store of completed task results.
+
+    Task metadata lives in a SQLite table indexed by (content hash, config hash,
+    pipeline version), file name, creation date and task id. The results of a
+    task are a gzip-compressed JSON blob and its violation bitmaps a Parquet
+    file with one row per check, so both are read only when asked for and a
+    single check's bitmap can be read without the others.
+    """
+
+    def __init__(self, directory: str = 'data/results/store'):
+        """Initialize ResultsStore.
+
+        Args:
+            directory: Directory holding ``results.sqlite`` and the per-task blobs
+        """
+        self.logger = logger
+        self.directory = directory
+        self.db_path = os.path.join(directory, 'results.sqlite')
+        os.makedirs(os.path.join(directory, 'blobs'), exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Connection that commits on success and is always closed."""
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _blob_path(self, task_id: str, name: str) -> str:
+        if not re.fullmatch(r'[\w-]+', task_id):
+            raise ValueError(f"Invalid task id: {task_id}")
+        return os.path.join(self.directory, 'blobs', f"{task_id}.{name}")
+
+    @staticmethod
+    def file_hash(path: str, block_size: int = 1 << 20) -> str:
+        """Content hash of a file, read in blocks."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def config_hash(*configs: Any) -> str:
+        """Hash of the configuration that determines a task's results."""
+        raw = json.dumps(configs, sort_keys=True, default=str)
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def find(self, content_hash: str, config_hash: str,
+             pipeline_version: str = PIPELINE_VERSION) -> Optional[Dict[str, Any]]:
+        """Most recent stored task for the same content, config and pipeline version."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM results WHERE content_hash = ? AND config_hash = ? AND pipeline_version = ? "
+                "ORDER BY created_at DESC LIMIT 1",
+                (content_hash, config_hash, pipeline_version)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Metadata of a stored task, or None."""
+        with self._connect() as connection:
+            row = connection.execute("SELECT * FROM results WHERE task_id = ?", (task_id,)).fetchone()
+        return dict(row) if row else None
+
+    def query(self, filename: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Stored tasks filtered by file name and creation date (ISO format), newest first."""
+        clauses, params = [], []
+        if filename:
+            clauses.append("filename = ?")
+            params.append(filename)
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until:
+            clauses.append("created_at < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT * FROM results {where} ORDER BY created_at DESC LIMIT ?", (*params, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def save(self, task_id: str, filename: str, content_hash: str, config_hash: str,
+             results: Dict[str, Any], violations: Optional[Dict[str, ViolationBitmap]] = None,
+             dataset: Optional[str] = None, files: Optional[Dict[str, str]] = None) -> None:
+        """Store the results and violation bitmaps of a completed task.
+
+        Args:
+            task_id: Task the results belong to
+            filename: Name of the processed file
+            content_hash: ``file_hash`` of the processed file
+            config_hash: ``config_hash`` of the configuration used
+            results: JSON-serializable task results
+            violations: Violation bitmaps by check name
+            dataset: Dataset the file is a snapshot of
+            files: Files the results refer to that live in expiring caches
+                (e.g. a tiled correlation matrix), copied in by name
+        """
+        results_path = self._blob_path(task_id, 'json.gz')
+        with gzip.open(f"{results_path}.tmp", 'wt', encoding='utf-8') as f:
+            json.dump(results, f, default=str)
+        os.replace(f"{results_path}.tmp", results_path)
+
+        violations = violations or {}
+        if violations:
+            table = pa.table({
+                'check': pa.array(list(violations), pa.string()),
+                'length': pa.array([bitmap.length for bitmap in violations.values()], pa.int64()),
+                'bitmap': pa.array([bitmap.to_bytes() for bitmap in violations.values()], pa.binary())
+            })
+            violations_path = self._blob_path(task_id, 'violations.parquet')
+            pq.write_table(table, f"{violations_path}.tmp", compression='zstd')
+            os.replace(f"{violations_path}.tmp", violations_path)
+
+        for name, source in (files or {}).items():
+            path = self._blob_path(task_id, f"file.{name}")
+            shutil.copyfile(source, f"{path}.tmp")
+            os.replace(f"{path}.tmp", path)
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (task_id, filename, dataset, content_hash, config_hash, PIPELINE_VERSION,
+                 datetime.now().isoformat(), len(violations))
+            )
+        self.logger.info(f"Stored results for task {task_id}")
+
+    def update_results(self, task_id: str, results: Dict[str, Any]) -> bool:
+        """Replace the results of a stored task, e.g. once a background plot is attached.
+
+        Returns:
+            False if the task is not stored
+        """
+        results_path = self._blob_path(task_id, 'json.gz')
+        if self.get(task_id) is None:
+            return False
+        with gzip.open(f"{results_path}.tmp", 'wt', encoding='utf-8') as f:
+            json.dump(results, f, default=str)
+        os.replace(f"{results_path}.tmp", results_path)
+        return True
+
+    def load_results(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Read a stored task's results, or None if the task is not stored."""
+        path = self._blob_path(task_id, 'json.gz')
+        if not os.path.exists(path):
+            return None
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load_violation(self, task_id: str, check: str) -> Optional[ViolationBitmap]:
+        """Read the violation bitmap of one check, or None."""
+        path = self._blob_path(task_id, 'violations.parquet')
+        if not os.path.exists(path):
+            return None
+        table = pq.read_table(path, filters=[('check', '=', check)])
+        if table.num_rows == 0:
+            return None
+        return ViolationBitmap.from_bytes(table['bitmap'][0].as_py(), table['length'][0].as_py())
+
+    def file_path(self, task_id: str, name: str) -> Optional[str]:
+        """Path of a file stored with a task's results (see ``save``), or None."""
+        path = self._blob_path(task_id, f"file.{name}")
+        return path if os.path.exists(path) else None
+
+    def delete(self, task_id: str) -> None:
+        """Remove a stored task and its blobs."""
+        self._blob_path(task_id, 'json.gz')  # Validates the task id
+        prefix = f"{task_id}."
+        for name in os.listdir(os.path.join(self.directory, 'blobs')):
+            if name.startswith(prefix):
+                os.remove(os.path.join(self.directory, 'blobs', name))
+        with self._connect() as connection:
+            connection.execute("DELETE FROM results WHERE task_id = ?", (task_id,))
@@ -0,0 +1,231 @@
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional
+from src.logger import setup_logger
+from src.violations import ViolationBitmap
+from src.categorical_profile import categorical_columns
+
+logger = setup_logger()
+
+DEFAULT_PROFILES = {
+    'fast': {
+        'deadline_seconds': 10,
+        'max_sample_rows': 50000,     # Expensive checks never see more rows than this
+        'skip': ['multivariate_outliers']
+    },
+    'standard': {
+        'deadline_seconds': 60,
+        'max_sample_rows': 500000,
+        'skip': []
+    },
+    'full': {
+        'deadline_seconds': None,     # No deadline: every check runs exactly
+        'max_sample_rows': None,
+        'skip': []
+    }
+}
+
+SKIPPED_MESSAGE = 'Skipped - validation time budget exhausted'
+ASSUMED_UNITS_PER_SECOND = 5e7  # Throughput guess until the first checks are timed
+MIN_SAMPLE_ROWS = 1000
+
+
+class ValidationCheck:
+    """A single validation check with its relative cost.
+
+    Cost is expressed in units per value: ``cost_per_value`` times the number of
+    values the check reads (rows times ``columns(df)``). Cheap checks always run
+    exactly; ``sampleable`` checks may run on a row sample.
+    """
+
+    def __init__(self, section: str, name: str, cost_per_value: float,
+                 columns: Callable[[Any, pd.DataFrame], int],
+                 run: Callable[..., Any], sampleable: bool = True):
+        self.section = section
+        self.name = name
+        self.cost_per_value = cost_per_value
+        self.columns = columns
+        self.run = run
+        self.sampleable = sampleable
+
+    def cost(self, validator, df: pd.DataFrame) -> float:
+        return self.cost_per_value * len(df) * max(self.columns(validator, df), 1)
+
+
+def _numeric_width(validator, df):
+    return df.select_dtypes(include=[np.number]).shape[1]
+
+
+def _categorical_width(validator, df):
+    return len(categorical_columns(df))
+
+
+def _validation_checks(expected_dtypes) -> List[ValidationCheck]:
+    """Checks in the layout of ``DataValidation.validate_data``."""
+    def data_type_validation(validator, df, **kwargs):
+        if not expected_dtypes:
+            return "No expected data types provided"
+        return validator.check_data_types(df, expected_dtypes)
+
+    return [
+        ValidationCheck('basic_validation', 'missing_values', 1, lambda v, df: df.shape[1],
+                        lambda v, df, **kw: v.check_missing_values(df), sampleable=False),
+        ValidationCheck('basic_validation', 'negative_values', 1, _numeric_width,
+                        lambda v, df, **kw: v.check_negative_values(df), sampleable=False),
+        ValidationCheck('basic_validation', 'duplicates', 5, lambda v, df: df.shape[1],
+                        lambda v, df, **kw: v.check_duplicates(df), sampleable=False),
+        ValidationCheck('basic_validation', 'data_types', 0, lambda v, df: 0,
+                        lambda v, df, **kw: v.get_data_types(df), sampleable=False),
+        ValidationCheck('basic_validation', 'data_type_validation', 1, lambda v, df: len(expected_dtypes or {}),
+                        data_type_validation, sampleable=False),
+        ValidationCheck('basic_validation', 'range_validation', 1, lambda v, df: len(v.range_validation_config),
+                        lambda v, df, **kw: v.check_range_validation(df, v.range_validation_config), sampleable=False),
+        ValidationCheck('basic_validation', 'custom_rule_validation', 3, lambda v, df: len(v.custom_rules_config),
+                        lambda v, df, **kw: v.check_custom_validation_rules(df, v.custom_rules_config)),
+        ValidationCheck('advanced_validation', 'outliers', 20, _numeric_width,
+                        lambda v, df, **kw: v.detect_outliers(df)),
+        ValidationCheck('advanced_validation', 'multivariate_outliers', 200, _numeric_width,
+                        lambda v, df, **kw: v.detect_multivariate_outliers(df)),
+        ValidationCheck('advanced_validation', 'quality_scores', 10, lambda v, df: df.shape[1],
+                        lambda v, df, **kw: v.calculate_quality_scores(df)),
+        ValidationCheck('advanced_validation', 'distribution_analysis', 30, _numeric_width,
+                        lambda v, df, time_budget=None: v.analyze_distributions(df, time_budget=time_budget)),
+        ValidationCheck('advanced_validation', 'categorical_profile', 3, _categorical_width,
+                        lambda v, df, **kw: v.profile_categorical_columns(df), sampleable=False),
+        ValidationCheck('advanced_validation', 'multicollinearity', 5, lambda v, df: _numeric_width(v, df) ** 2,
+                        lambda v, df, **kw: v.detect_multicollinearity(df)),
+    ]
+
+
+class ValidationScheduler:
+    """Deadline-aware execution of the validation checks.
+
+    Checks run in order of estimated cost (cost per value times values read),
+    so the cheap exact checks finish first. Throughput is measured as checks
+    complete; when an expensive check would overrun the deadline it runs on a
+    seeded row sample sized to the remaining time, or is skipped when even a
+    minimal sample would not fit. Every check is reported as exact, sampled or
+    skipped.
+    """
+
+    def __init__(self, profile: str = 'full', deadline_seconds: Optional[float] = None,
+                 profiles: Optional[Dict[str, Dict[str, Any]]] = None, seed: int = 42):
+        """Initialize ValidationScheduler.
+
+        Args:
+            profile: 'fast', 'standard' or 'full'
+            deadline_seconds: Overrides the profile's deadline
+            profiles: Overrides for ``DEFAULT_PROFILES``
+            seed: Seed for row sampling
+        """
+        self.logger = logger
+        available = {**DEFAULT_PROFILES, **(profiles or {})}
+        if profile not in available:
+            raise ValueError(f"Unknown validation profile: {profile}")
+        self.profile = profile
+        self.settings = {**DEFAULT_PROFILES.get(profile, {}), **available[profile]}
+        self.deadline_seconds = deadline_seconds if deadline_seconds is not None else self.settings.get('deadline_seconds')
+        self.max_sample_rows = self.settings.get('max_sample_rows')
+        self.skip = set(self.settings.get('skip') or [])
+        self.seed = seed
+
+    def run(self, validator, df: pd.DataFrame, expected_dtypes=None,
+            on_result: Optional[Callable[[str, str, Any], None]] = None) -> Dict[str, Any]:
+        """Run all checks and return results in the ``validate_data`` layout.
+
+        Args:
+            validator: DataValidation instance whose check methods are used
+            df: DataFrame to validate
+            expected_dtypes: Expected data types for data type validation
+            on_result: Called with (section, check name, result) as each check finishes
+
+        Returns:
+            Dictionary with basic_validation, advanced_validation and a ``schedule``
+            entry describing how each check was run
+        """
+        started = time.monotonic()
+        deadline = None if self.deadline_seconds is None else started + self.deadline_seconds
+        checks = _validation_checks(expected_dtypes)
+        order = sorted(checks, key=lambda check: check.cost(validator, df))
+
+        results = {'basic_validation': {}, 'advanced_validation': {}}
+        statuses = {}
+        units_done, seconds_spent = 0.0, 0.0
+        samples = {}
+
+        for check in order:
+            units = check.cost(validator, df)
+            throughput = units_done / seconds_spent if seconds_spent > 0.01 else ASSUMED_UNITS_PER_SECOND
+            remaining = None if deadline is None else deadline - time.monotonic()
+
+            rows = len(df)
+            if check.sampleable and self.max_sample_rows:
+                rows = min(rows, self.max_sample_rows)
+            if check.sampleable and remaining is not None and len(df) and units / len(df) * rows / throughput > remaining:
+                # Shrink the sample so the estimated time fits what is left of the budget
+                rows = min(rows, int(max(remaining, 0) * throughput / (units / len(df))))
+
+            if check.name in self.skip:
+                result = f"Skipped by the {self.profile} validation profile"
+                statuses[check.name] = {'status': 'skipped', 'rows': 0, 'elapsed_seconds': 0.0}
+            elif check.sampleable and rows < min(MIN_SAMPLE_ROWS, len(df)):
+                result = SKIPPED_MESSAGE
+                statuses[check.name] = {'status': 'skipped', 'rows': 0, 'elapsed_seconds': 0.0}
+            else:
+                data, positions = df, None
+                if rows < len(df):
+                    if rows not in samples:
+                        samples[rows] = self._sample(df, rows)
+                    data, positions = samples[rows]
+
+                check_started = time.monotonic()
+                before = set(validator.violations)
+                time_budget = None if remaining is None else max(remaining, 0)
+                result = check.run(validator, data, time_budget=time_budget)
+                elapsed = time.monotonic() - check_started
+                if positions is not None:
+                    self._remap_violations(validator, before, positions, len(df))
+
+                units_done += units * len(data) / max(len(df), 1)
+                seconds_spent += elapsed
+                statuses[check.name] = {
+                    'status': 'exact' if positions is None else 'sampled',
+                    'rows': len(data),
+                    'elapsed_seconds': round(elapsed, 4)
+                }
+
+            results[check.section][check.name] = result
+            if on_result is not None:
+                on_result(check.section, check.name, result)
+
+        # Report in the usual check order rather than execution order
+        results = {
+            section: {check.name: results[section][check.name] for check in checks if check.section == section}
+            for section in ('basic_validation', 'advanced_validation')
+        }
+        results['schedule'] = {
+            'profile': self.profile,
+            'deadline_seconds': self.deadline_seconds,
+            'total_rows': len(df),
+            'elapsed_seconds': round(time.monotonic() - started, 4),
+            'checks': {check.name: statuses[check.name] for check in checks}
+        }
+        self.logger.info(
+            f"Validation ({self.profile}) finished in {results['schedule']['elapsed_seconds']}s: "
+            + ", ".join(f"{name}={entry['status']}" for name, entry in statuses.items())
+        )
+        return results
+
+    def _sample(self, df: pd.DataFrame, rows: int):
+        """Seeded row sample and the sampled row positions (sorted)."""
+        rng = np.random.default_rng(self.seed)
+        positions = np.sort(rng.choice(len(df), size=rows, replace=False))
+        return df.iloc[positions], positions
+
+    @staticmethod
+    def _remap_violations(validator, before, positions: np.ndarray, length: int) -> None:
+        """Map bitmaps recorded on a sample back to row positions of the full frame."""
+        for check_name in set(validator.violations) - before:
+            sampled_rows = positions[validator.violations[check_name].to_mask()]
+            validator.violations[check_name] = ViolationBitmap.from_positions(sampled_rows, length)
@@ -0,0 +1,311 @@
+"""Mergeable streaming sketches used for approximate validation and profiling.
+
+Every sketch accepts data one chunk at a time (``update``), can be combined
+with another sketch of the same configuration (``merge``) and reports its
+estimates together with an error bound.
+"""
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Optional
+
+
+def hash_values(values) -> np.ndarray:
+    """Hash a Series, array or DataFrame (row-wise) to uint64."""
+    if isinstance(values, (pd.Series, pd.DataFrame)):
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+    return pd.util.hash_array(np.asarray(values))
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch with 2**precision registers."""
+
+    def __init__(self, precision: int = 14):
+        """Initialize HyperLogLog.
+
+        Args:
+            precision: Number of index bits; memory is 2**precision bytes
+        """
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def update(self, values) -> 'HyperLogLog':
+        """Add values (Series, array or DataFrame rows) to the sketch."""
+        return self.update_hashes(hash_values(values))
+
+    def update_hashes(self, hashes: np.ndarray) -> 'HyperLogLog':
+        """Add pre-computed uint64 hashes to the sketch."""
+        if len(hashes) == 0:
+            return self
+        hashes = hashes.astype(np.uint64, copy=False)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        rest = hashes << np.uint64(self.precision)
+
+        # Leading zeros of the remaining bits, computed on exact 32-bit halves
+        high = (rest >> np.uint64(32)).astype(np.float64)
+        low = (rest & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        with np.errstate(divide='ignore'):
+            leading = np.where(
+                high > 0,
+                31 - np.floor(np.log2(high)),
+                63 - np.floor(np.log2(np.where(low > 0, low, 1)))
+            )
+        rank = np.minimum(leading + 1, 64 - self.precision + 1)
+        rank = np.where((high == 0) & (low == 0), 64 - self.precision + 1, rank).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """Merge another sketch with the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of the estimate."""
+        return 1.04 / np.sqrt(self.m)
+
+    def estimate(self) -> float:
+        """Estimated number of distinct values."""
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        raw = alpha * self.m ** 2 / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * self.m and zeros > 0:
+            return float(self.m * np.log(self.m / zeros))  # Linear counting for small cardinalities
+        return float(raw)
+
+    def result(self) -> Dict[str, float]:
+        """Estimate with an error bound of three standard errors."""
+        estimate = self.estimate()
+        return {'estimate': estimate, 'error_bound': 3 * self.relative_error * estimate}
+
+
+class TDigest:
+    """Merging t-digest for streaming quantile and CDF estimates."""
+
+    def __init__(self, compression: float = 200):
+        """Initialize TDigest.
+
+        Args:
+            compression: Controls the number of centroids (roughly compression / 2)
+        """
+        self.compression = compression
+        self.means = np.zeros(0)
+        self.weights = np.zeros(0)
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def update(self, values) -> 'TDigest':
+        """Add a chunk of values; NaNs are ignored."""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._compress(np.concatenate([self.means, values]),
+                       np.concatenate([self.weights, np.ones(len(values))]))
+        return self
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        """Merge another digest into this one."""
+        if other.count == 0:
+            return self
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(np.concatenate([self.means, other.means]),
+                       np.concatenate([self.weights, other.weights]))
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable state of the digest."""
+        return {
+            'compression': self.compression,
+            'means': self.means.tolist(),
+            'weights': self.weights.tolist(),
+            'min': float(self.min) if self.count else None,
+            'max': float(self.max) if self.count else None
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'TDigest':
+        """Rebuild a digest saved with ``to_dict``."""
+        digest = cls(state['compression'])
+        digest.means = np.asarray(state['means'], dtype=float)
+        digest.weights = np.asarray(state['weights'], dtype=float)
+        if len(digest.weights):
+            digest.min, digest.max = state['min'], state['max']
+        return digest
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        # Group centroids whose starting quantiles fall in the same unit of the
+        # k1 scale function, so groups are small in the tails and large in the middle
+        order = np.argsort(means, kind='mergesort')
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        q_start = (np.cumsum(weights) - weights) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q_start - 1)
+        group = np.floor(k - k[0]).astype(np.int64)
+        group = np.concatenate(([0], np.cumsum(np.diff(group) != 0)))
+
+        merged_weights = np.bincount(group, weights=weights)
+        self.means = np.bincount(group, weights=means * weights) / merged_weights
+        self.weights = merged_weights
+
+    def _positions(self):
+        centers = np.cumsum(self.weights) - self.weights / 2
+        positions = np.concatenate(([0.0], centers, [self.count]))
+        values = np.concatenate(([self.min], self.means, [self.max]))
+        return positions, values
+
+    def quantile(self, q: float) -> float:
+        """Estimated value at quantile ``q``."""
+        if self.count == 0:
+            return float('nan')
+        positions, values = self._positions()
+        return float(np.interp(q * self.count, positions, values))
+
+    def cdf(self, x) -> np.ndarray:
+        """Estimated fraction of values <= ``x``."""
+        if self.count == 0:
+            return np.full(np.shape(x), np.nan)
+        positions, values = self._positions()
+        return np.interp(x, values, positions) / self.count
+
+    def rank_error(self, q: float) -> float:
+        """Rank uncertainty (as a fraction) of the centroid covering quantile ``q``."""
+        if self.count == 0:
+            return float('nan')
+        index = min(int(np.searchsorted(np.cumsum(self.weights), q * self.count)), len(self.weights) - 1)
+        return float(self.weights[index] / (2 * self.count))
+
+    def quantile_result(self, q: float) -> Dict[str, float]:
+        """Quantile estimate with a value error bound derived from the rank error."""
+        estimate = self.quantile(q)
+        error = self.rank_error(q)
+        bound = max(abs(self.quantile(min(q + error, 1)) - estimate),
+                    abs(estimate - self.quantile(max(q - error, 0))))
+        return {'estimate': estimate, 'error_bound': float(bound), 'rank_error': error}
+
+
+class MisraGries:
+    """Mergeable Misra-Gries heavy-hitter summary with at most ``k`` counters."""
+
+    def __init__(self, k: int = 20):
+        self.k = k
+        self.counts = pd.Series(dtype='int64')
+        self.total = 0
+        self.error = 0  # Upper bound on the undercount of any item
+
+    def update(self, values) -> 'MisraGries':
+        """Add a chunk of values; missing values are ignored."""
+        values = pd.Series(values)
+        return self.update_counts(values.value_counts(dropna=True))
+
+    def update_counts(self, counts: pd.Series) -> 'MisraGries':
+        """Add a chunk already reduced to exact counts (value -> count)."""
+        self.total += int(counts.sum())
+        return self._absorb(counts)
+
+    def merge(self, other: 'MisraGries') -> 'MisraGries':
+        """Merge another summary into this one."""
+        self.total += other.total
+        self.error += other.error
+        return self._absorb(other.counts)
+
+    def _absorb(self, counts: pd.Series) -> 'MisraGries':
+        # Summarise the incoming counts on their own first so the merge only aligns k + k counters
+        counts = self._prune(counts.astype('int64'))
+        combined = self.counts.add(counts, fill_value=0) if len(self.counts) else counts
+        self.counts = self._prune(combined).astype('int64').sort_values(ascending=False)
+        return self
+
+    def _prune(self, counts: pd.Series) -> pd.Series:
+        """Subtract the (k+1)-th largest count and drop counters that reach zero."""
+        if len(counts) <= self.k:
+            return counts
+        threshold = int(np.partition(counts.to_numpy(), -(self.k + 1))[-(self.k + 1)])
+        self.error += threshold
+        counts = counts - threshold
+        return counts[counts > 0]
+
+    def top(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Most frequent items with their count lower bounds and error bound."""
+        items = self.counts.head(n or self.k)
+        return [
+            {'value': value, 'count': int(count), 'error_bound': int(self.error)}
+            for value, count in items.items()
+        ]
+
+
+class StreamingMoments:
+    """Exact streaming mean/variance plus a seeded reservoir sample for higher moments."""
+
+    def __init__(self, sample_size: int = 10000, seed: int = 42):
+        self.sample_size = sample_size
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.sample = np.zeros(0)
+        self._keys = np.zeros(0)
+
+    def update(self, values) -> 'StreamingMoments':
+        """Add a chunk of values; NaNs are ignored."""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        chunk = StreamingMoments(self.sample_size)
+        chunk.count = len(values)
+        chunk.mean = float(values.mean())
+        chunk.m2 = float(((values - chunk.mean) ** 2).sum())
+        chunk.sample = values
+        chunk._keys = self.rng.random(len(values))
+        return self.merge(chunk)
+
+    def merge(self, other: 'StreamingMoments') -> 'StreamingMoments':
+        """Merge another accumulator (Chan et al. parallel update)."""
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+
+        # Keep the values with the smallest random keys: a uniform sample of the stream
+        sample = np.concatenate([self.sample, other.sample])
+        keys = np.concatenate([self._keys, other._keys])
+        if len(keys) > self.sample_size:
+            keep = np.argpartition(keys, self.sample_size)[:self.sample_size]
+            sample, keys = sample[keep], keys[keep]
+        self.sample, self._keys = sample, keys
+        return self
+
+    def result(self) -> Dict[str, Any]:
+        """Moments with bounds of three normal-theory standard errors for the sampled moments."""
+        std = float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else float('nan')
+        n_sample = len(self.sample)
+        sample = pd.Series(self.sample)
+        return {
+            'count': self.count,
+            'mean': {'estimate': self.mean, 'error_bound': 0.0},
+            'std': {'estimate': std, 'error_bound': 0.0},
+            'skewness': {
+                'estimate': float(sample.skew()) if n_sample > 2 else float('nan'),
+                'error_bound': 3 * float(np.sqrt(6 / n_sample)) if n_sample < self.count and n_sample else 0.0
+            },
+            'kurtosis': {
+                'estimate': float(sample.kurtosis()) if n_sample > 3 else float('nan'),
+                'error_bound': 3 * float(np.sqrt(24 / n_sample)) if n_sample < self.count and n_sample else 0.0
+            },
+            'sample_size': n_sample
+        }
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from src.logger import setup_logger
+from src.correlation_engine import correlation_matrix, correlation_significance, pairwise_counts, tie_sums
+
+logger = setup_logger()
+
+
+class StatsContext:
+    """Per-task memo of statistics shared between pipeline stages.
+
+    A context is bound to one DataFrame. Stages that need the same intermediate
+    (the numeric correlation matrix, its dict form, the numeric columns) ask the
+    context for it and the first request computes it; later requests, from the
+    same or another stage, get the stored object. Rebinding to another frame
+    drops everything computed so far.
+    """
+
+    def __init__(self, frame: Optional[pd.DataFrame] = None, settings: Optional[Dict[str, Any]] = None):
+        """Initialize StatsContext.
+
+        Args:
+            frame: DataFrame the statistics are computed on
+            settings: Overrides for ``DEFAULT_CORRELATION_SETTINGS``
+        """
+        self.logger = logger
+        self.frame = frame
+        self.settings = settings or {}
+        self._memo: Dict[Hashable, Any] = {}
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def covers(self, df: pd.DataFrame) -> bool:
+        """Whether statistics of ``df`` can be taken from this context."""
+        return df is self.frame
+
+    def replace_frame(self, frame: pd.DataFrame) -> None:
+        """Bind the context to another frame (e.g. after type coercion)."""
+        with self._lock:
+            if frame is not self.frame:
+                self.frame = frame
+                self._memo.clear()
+
+    def memo(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the value stored under ``key``, computing it on first use."""
+        with self._lock:
+            if key in self._memo:
+                self.hits += 1
+                return self._memo[key]
+            self.misses += 1
+            value = compute()
+            self._memo[key] = value
+            return value
+
+    def numeric_columns(self) -> List[str]:
+        """Numeric columns of the frame."""
+        return self.memo('numeric_columns', lambda: list(self.frame.select_dtypes(include=[np.number]).columns))
+
+    def correlation_matrix(self, method: str = 'pearson') -> pd.DataFrame:
+        """Correlation matrix of the numeric columns (treat as read-only)."""
+        def compute():
+            self.logger.info(f"Computing {method} correlation matrix of {len(self.numeric_columns())} columns")
+            return correlation_matrix(self.frame[self.numeric_columns()], method, self.settings)
+        return self.memo(('correlation_matrix', method), compute)
+
+    def pairwise_counts(self) -> np.ndarray:
+        """Rows shared by each pair of numeric columns."""
+        return self.memo('pairwise_counts', lambda: pairwise_counts(
+            self.frame[self.numeric_columns()].to_numpy(dtype=float), self.settings
+        ))
+
+    def correlation_significance(self, method: str = 'pearson') -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """P-values and Benjamini-Hochberg q-values of ``correlation_matrix(method)``."""
+        def compute():
+            matrix = self.correlation_matrix(method)
+            ties = None
+            if method == 'kendall':
+                ties = tie_sums(self.frame[self.numeric_columns()].to_numpy(dtype=float))
+            pvalues, qvalues = correlation_significance(matrix.to_numpy(), self.pairwise_counts(), method, ties)
+            return (pd.DataFrame(pvalues, index=matrix.index, columns=matrix.columns),
+                    pd.DataFrame(qvalues, index=matrix.index, columns=matrix.columns))
+        return self.memo(('correlation_significance', method), compute)
+
+    def correlation_dict(self, method: str = 'pearson') -> Dict[str, Dict[str, float]]:
+        """``correlation_matrix(method).to_dict()``, shared by every stage that reports it."""
+        return self.memo(('correlation_dict', method), lambda: self.correlation_matrix(method).to_dict())
+
+
+def stats_for(df: pd.DataFrame, context: Optional[StatsContext] = None,
+              settings: Optional[Dict[str, Any]] = None) -> StatsContext:
+    """The shared context if it covers ``df``, otherwise a private one for this call."""
+    if context is not None and context.covers(df):
+        return context
+    return StatsContext(df, settings)
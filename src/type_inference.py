@@ -0,0 +1,170 @@
+import pandas as pd
+from threading import Lock
+from typing import Dict, Any, List, Optional, Tuple
+from src.logger import setup_logger
+
+logger = setup_logger()
+
+DEFAULT_TYPE_INFERENCE_SETTINGS = {
+    'enabled': True,
+    'sample_size': 1000,        # Non-null values tried before touching the full column
+    'min_success_rate': 0.95,   # Share of sampled values that must parse
+    'seed': 42,
+    'max_datetime_formats': 3,  # Columns may mix a few formats (e.g. 3/9/2016 and 17-03-2018)
+    'datetime_formats': [
+        'ISO8601', '%d/%m/%Y', '%m/%d/%Y', '%d/%m/%Y %H:%M', '%m/%d/%Y %H:%M',
+        '%Y/%m/%d', '%d-%m-%Y', '%d.%m.%Y', '%d %b %Y', '%b %d, %Y'
+    ]
+}
+
+# Column name -> datetime formats that worked last time, tried first on later files
+_format_cache: Dict[str, List[str]] = {}
+_format_cache_lock = Lock()
+
+
+def _day_order(fmt: str) -> Optional[str]:
+    """'day' or 'month' for formats with a numeric day and month, by which comes first."""
+    if '%d' in fmt and '%m' in fmt:
+        return 'day' if fmt.index('%d') < fmt.index('%m') else 'month'
+    return None
+
+
+class TypeInferencer:
+    """Vectorized type inference and coercion for object columns.
+
+    Each object column is tried as numeric and then against a list of explicit
+    datetime formats (the formats that last worked for a column of the same name
+    go first) on a seeded sample of its non-null values. Values the best format
+    cannot parse are retried with the next best one, so columns mixing a few
+    formats are still recognised; day-first and month-first formats are never
+    mixed, and a column that only parses with both is reported as
+    'ambiguous_datetime'. Only when the sample parses well enough is the
+    full column converted, with the same explicit formats, and the failure rate
+    on the full column reported.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """Initialize TypeInferencer.
+
+        Args:
+            settings: Overrides for ``DEFAULT_TYPE_INFERENCE_SETTINGS``
+        """
+        self.logger = logger
+        self.settings = {**DEFAULT_TYPE_INFERENCE_SETTINGS, **(settings or {})}
+
+    def infer(self, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """Infer types of object columns from samples only (nothing is converted).
+
+        Returns:
+            Dictionary of {column: {'inferred_type', 'format', 'sample_failure_rate'}}
+        """
+        report = {}
+        for column in self._candidate_columns(df):
+            non_null = df[column].dropna()
+            if len(non_null):
+                report[column] = self._infer_column(column, self._sample(non_null))
+        return report
+
+    def coerce(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Dict[str, Any]]]:
+        """Convert object columns whose sample parses as numeric or datetime.
+
+        Returns:
+            Tuple of (DataFrame with converted columns, per-column report that adds
+            'failure_rate' on the full column and whether it was 'coerced')
+        """
+        report = self.infer(df)
+        converted = {}
+        for column, entry in report.items():
+            entry['coerced'] = False
+            if entry['inferred_type'] not in ('numeric', 'datetime'):
+                continue
+
+            values = df[column]
+            parsed = self._parse(values, entry['inferred_type'], entry['format'])
+            non_null = int(values.notna().sum())
+            failures = int(parsed.isna().sum()) - (len(values) - non_null)
+            entry['failure_rate'] = failures / non_null if non_null else 0.0
+
+            if 1 - entry['failure_rate'] >= self.settings['min_success_rate']:
+                converted[column] = parsed
+                entry['coerced'] = True
+                if entry['format']:
+                    with _format_cache_lock:
+                        _format_cache[column] = entry['format']
+            else:
+                self.logger.warning(
+                    f"Not coercing column {column}: {entry['failure_rate']:.1%} of values failed to parse as "
+                    f"{entry['inferred_type']} although the sample succeeded"
+                )
+
+        if not converted:
+            return df, report
+        self.logger.info(f"Coerced {len(converted)} columns: "
+                         + ", ".join(f"{column} -> {report[column]['inferred_type']}" for column in converted))
+        return df.assign(**converted), report
+
+    def _candidate_columns(self, df: pd.DataFrame):
+        return [
+            column for column in df.columns
+            if pd.api.types.is_object_dtype(df[column]) or pd.api.types.is_string_dtype(df[column])
+        ]
+
+    def _sample(self, non_null: pd.Series) -> pd.Series:
+        size = self.settings['sample_size']
+        if len(non_null) <= size:
+            return non_null
+        return non_null.sample(n=size, random_state=self.settings['seed'])
+
+    def _infer_column(self, column: str, sample: pd.Series) -> Dict[str, Any]:
+        min_success = self.settings['min_success_rate']
+
+        numeric_failures = self._parse(sample, 'numeric', None).isna().mean()
+        if 1 - numeric_failures >= min_success:
+            return {'inferred_type': 'numeric', 'format': None, 'sample_failure_rate': float(numeric_failures)}
+
+        formats, remaining = [], sample
+        candidates = self._formats_for(column)
+        while len(remaining) and len(formats) < self.settings['max_datetime_formats']:
+            # 03/04/2020 parses both ways, so a column gets either day-first or month-first formats
+            orders = {_day_order(fmt) for fmt in formats} - {None}
+            parsed = {
+                fmt: self._parse(remaining, 'datetime', [fmt]).notna() for fmt in candidates
+                if fmt not in formats and (not orders or _day_order(fmt) in orders | {None})
+            }
+            best = max(parsed, key=lambda fmt: parsed[fmt].sum(), default=None)
+            if best is None or not parsed[best].any():
+                break
+            formats.append(best)
+            remaining = remaining[~parsed[best]]
+
+        failures = len(remaining) / len(sample)
+        if formats and 1 - failures >= min_success:
+            return {'inferred_type': 'datetime', 'format': formats, 'sample_failure_rate': float(failures)}
+
+        orders = {_day_order(fmt) for fmt in formats} - {None}
+        conflicting = [fmt for fmt in candidates if _day_order(fmt) not in orders | {None}]
+        if orders and len(remaining) and any(self._parse(remaining, 'datetime', [fmt]).notna().any()
+                                             for fmt in conflicting):
+            self.logger.warning(f"Column {column} mixes day-first and month-first dates; not parsing it")
+            return {'inferred_type': 'ambiguous_datetime', 'format': None, 'sample_failure_rate': float(failures)}
+
+        return {'inferred_type': 'string', 'format': None, 'sample_failure_rate': None}
+
+    def _formats_for(self, column: str) -> List[str]:
+        with _format_cache_lock:
+            cached = _format_cache.get(column, [])
+        return list(cached) + [fmt for fmt in self.settings['datetime_formats'] if fmt not in cached]
+
+    @staticmethod
+    def _parse(values: pd.Series, inferred_type: str, formats: Optional[List[str]]) -> pd.Series:
+        """Parse values as numbers, or as datetimes trying ``formats`` in order."""
+        if inferred_type == 'numeric':
+            return pd.to_numeric(values, errors='coerce')
+
+        parsed = pd.to_datetime(values, format=formats[0], errors='coerce')
+        for fmt in formats[1:]:
+            retry = parsed.isna() & values.notna()
+            if not retry.any():
+                break
+            parsed[retry] = pd.to_datetime(values[retry], format=fmt, errors='coerce')
+        return parsed
@@ -1,48 +1,149 @@
 import pandas as pd
 import numpy as np
 from src.logger import setup_logger
-import yaml
 from scipy import stats
-from scipy.stats import shapiro, anderson
+from src.violations import ViolationBitmap
+from src.distribution import DistributionAnalyzer, BUDGET_EXHAUSTED_MESSAGE
+from src.result_cache import ResultCache, get_result_cache
+from src.approximate_validation import ApproximateValidator
+from src.outliers import OutlierDetector
+from src.imputation import ImputationPlanner, KNNImputation, IterativeImputation
+from src.validation_plan import CompiledRule, get_validation_plan
+from src.scheduler import ValidationScheduler
+from src.range_validation import RangeValidator
+from src.type_inference import TypeInferencer
+from src.categorical_profile import CategoricalProfiler, categorical_columns
+from src.stats_context import stats_for
+from src.correlation_pairs import correlated_pairs
+from src.matrix_tiles import DEFAULT_TILE_SETTINGS
 
 logger = setup_logger()
 
+_NOT_CACHED = object()
+
 class DataValidation:
-    def __init__(self):
+    def __init__(self, mode=None, plan=None):
+        """Initialize DataValidation.
+
+        Args:
+            mode: 'exact' or 'approximate'; defaults to validation.mode in config.yaml
+            plan: Compiled ValidationPlan; defaults to the shared plan for config.yaml
+        """
         self.logger = logger
-        with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
-        self.missing_threshold = config['validation']['missing_threshold']
+        self.plan = plan or get_validation_plan('config.yaml')
+        self.missing_threshold = self.plan.missing_threshold
         self.correlation_threshold = 0.8  # Configurable threshold for multicollinearity
-        self.outlier_sensitivity = config['validation']['outlier_sensitivity']
-        self.z_score_threshold = self.outlier_sensitivity['z_score']
-        self.iqr_threshold = self.outlier_sensitivity['iqr']
-        self.range_validation_config = config['validation']['range_validation']
-        self.custom_rules_config = config['validation']['custom_validation_rules']
-        self.range_validation_config = config['validation']['range_validation']
-    def validate_data(self, df, expected_dtypes=None):
-        """Perform comprehensive data validation."""
-        basic_validation = {
-            'missing_values': self.check_missing_values(df),
-            'negative_values': self.check_negative_values(df),
-            'duplicates': self.check_duplicates(df),
-            'data_types': self.get_data_types(df),
-            'data_type_validation': self.check_data_types(df, expected_dtypes) if expected_dtypes else "No expected data types provided", # Add data type validation
-            'range_validation': self.check_range_validation(df, self.range_validation_config), # Add range validation
-            'custom_rule_validation': self.check_custom_validation_rules(df, self.custom_rules_config) # Add custom rule validation
-        }
+        self.outlier_sensitivity = self.plan.outlier_sensitivity
+        self.z_score_threshold = self.plan.z_score_threshold
+        self.iqr_threshold = self.plan.iqr_threshold
+        self.mad_threshold = self.plan.mad_threshold
+        self.multivariate_settings = self.plan.multivariate_settings
+        self.imputation_settings = self.plan.imputation_settings
+        self.imputation_plan = None
+        self.range_validation_config = self.plan.range_validation_config
+        self.custom_rules_config = self.plan.custom_rules_config
+        self.distribution_settings = self.plan.distribution_settings
+        self.type_inference_settings = self.plan.type_inference_settings
+        self.type_report = {}
+        self.categorical_settings = self.plan.categorical_settings
+        self.approximate_settings = self.plan.approximate_settings
+        self.tile_settings = {**DEFAULT_TILE_SETTINGS, **self.plan.tile_settings}
+        self.mode = mode or self.plan.mode
+        if self.mode not in ('exact', 'approximate'):
+            raise ValueError(f"Unknown validation mode: {self.mode}")
+        self.violations = {}  # check name -> ViolationBitmap of violating rows
+
+        cache_config = self.plan.cache_config
+        if cache_config.get('enabled', True):
+            self.result_cache = get_result_cache(
+                cache_config.get('directory', 'data/cache/validation'),
+                cache_config.get('max_memory_entries', 4096),
+                {key: cache_config[key] for key in ('max_bytes', 'max_age_days', 'collect_interval_seconds')
+                 if key in cache_config}
+            )
+        else:
+            self.result_cache = None
+        self._hash_frame = None
+        self._column_hashes = {}
+        self.stats = None  # StatsContext shared with later stages while validating
 
-        advanced_validation = {
-            'outliers': self.detect_outliers(df),
-            'quality_scores': self.calculate_quality_scores(df),
-            'distribution_analysis': self.analyze_distributions(df),
-            'multicollinearity': self.detect_multicollinearity(df)
-        }
+    def validate_data(self, df, expected_dtypes=None, profile=None, deadline_seconds=None, on_result=None,
+                      stats=None):
+        """Perform comprehensive data validation.
 
-        return {
-            'basic_validation': basic_validation,
-            'advanced_validation': advanced_validation
-        }
+        Args:
+            df: DataFrame to validate
+            expected_dtypes: Expected data types for data type validation
+            profile: 'fast', 'standard' or 'full'; defaults to validation.profile
+            deadline_seconds: Overrides the profile's deadline
+            on_result: Called with (section, check name, result) as each check finishes
+            stats: StatsContext shared with later stages; it is rebound to the
+                coerced frame so they can reuse what validation computed
+
+        Returns:
+            Dictionary with basic_validation and advanced_validation results and,
+            in exact mode, a ``schedule`` entry marking each check exact, sampled
+            or skipped. Object columns that parse as numbers or dates are coerced
+            first and reported under basic_validation['type_inference'].
+        """
+        self.violations = {}
+        if self.mode == 'approximate':
+            chunk_rows = self._approximate_validator().settings['chunk_rows']
+            return self.validate_stream(ApproximateValidator.iter_chunks(df, chunk_rows))
+
+        df = self.infer_types(df)
+        if on_result is not None and self.type_report:
+            on_result('basic_validation', 'type_inference', self.type_report)
+        if stats is not None:
+            stats.replace_frame(df)
+
+        self._hash_frame, self._column_hashes, self.stats = df, {}, stats
+        try:
+            scheduler = ValidationScheduler(
+                profile or self.plan.profile, deadline_seconds, profiles=self.plan.profiles
+            )
+            results = scheduler.run(self, df, expected_dtypes, on_result=on_result)
+        finally:
+            self._hash_frame, self._column_hashes, self.stats = None, {}, None
+
+        if self.type_report:
+            results['basic_validation']['type_inference'] = self.type_report
+        return results
+
+    def infer_types(self, df):
+        """Coerce object columns whose sampled values parse as numeric or datetime.
+
+        Later checks then work on native dtypes instead of object columns. The
+        per-column report (inferred type, format, failure rate, whether it was
+        coerced) is kept in ``self.type_report``.
+
+        Returns:
+            DataFrame with coerced columns (the input itself if nothing changed)
+        """
+        self.type_report = {}
+        if not self.type_inference_settings.get('enabled', True):
+            return df
+        df, self.type_report = TypeInferencer(self.type_inference_settings).coerce(df)
+        return df
+
+    def validate_stream(self, chunks):
+        """Validate an iterable of DataFrame chunks in one pass using sketches.
+
+        Results follow the layout of ``validate_data`` but estimated metrics carry
+        error bounds. Suitable for out-of-core inputs such as
+        ``pd.read_csv(path, chunksize=...)``.
+        """
+        return self._approximate_validator().validate(chunks)
+
+    def _approximate_validator(self):
+        return ApproximateValidator(
+            self.approximate_settings,
+            z_score_threshold=self.z_score_threshold,
+            iqr_threshold=self.iqr_threshold,
+            range_config=self.range_validation_config,
+            missing_threshold=self.missing_threshold,
+            categorical_settings=self.categorical_settings
+        )
 
     def check_missing_values(self, df):
         """Check for missing values in the dataset."""
@@ -110,6 +211,14 @@ class DataValidation:
                     inconsistent_columns[column] = f"Expected datetime, got {actual_dtype}"
             # Add more data type checks as needed
 
+            inferred = self.type_report.get(column)
+            if column in inconsistent_columns and inferred and inferred['inferred_type'] == expected_dtype:
+                formats = f" with format {', '.join(inferred['format'])}" if inferred['format'] else ""
+                failures = inferred.get('failure_rate', inferred['sample_failure_rate'])
+                inconsistent_columns[column] += f" (parses as {expected_dtype}{formats}, {failures:.1%} failures)"
+            elif column in inconsistent_columns and inferred and inferred['inferred_type'] == 'ambiguous_datetime':
+                inconsistent_columns[column] += " (mixes day-first and month-first dates)"
+
         return inconsistent_columns
 
     def check_range_validation(self, df, range_config):
@@ -122,37 +231,32 @@ class DataValidation:
             dict: Dictionary of columns with range validation issues.
         """
         out_of_range_columns = {}
+        checkable = {}
         for column, ranges in range_config.items():
             if column not in df.columns:
                 out_of_range_columns[column] = "Column not found"
-                continue
-
-            if pd.api.types.is_numeric_dtype(df[column]):
-                min_val = ranges.get('min')
-                max_val = ranges.get('max')
-
-                if min_val is not None and max_val is not None:
-                    out_of_range_values = df[(df[column] < min_val) | (df[column] > max_val)][column]
-                elif min_val is not None:
-                    out_of_range_values = df[df[column] < min_val][column]
-                elif max_val is not None:
-                    out_of_range_values = df[df[column] > max_val][column]
-                else:
-                    continue # No range specified
-
-                if not out_of_range_values.empty:
-                    out_of_range_columns[column] = {
-                        'min_range': min_val,
-                        'max_range': max_val,
-                        'out_of_range_count': int(out_of_range_values.count()),
-                        'out_of_range_values': out_of_range_values.tolist()
-                    }
-            else:
+            elif not pd.api.types.is_numeric_dtype(df[column]):
                 out_of_range_columns[column] = "Column is not numeric"
+            else:
+                checkable[column] = ([column], ranges)
+
+        def compute(columns):
+            # One broadcasted comparison over all stale columns
+            summary, bitmaps = RangeValidator({col: range_config[col] for col in columns}).validate(df)
+            return {
+                col: (summary[col], bitmaps[summary[col]['violation_check']]) if col in summary else None
+                for col in columns
+            }
+
+        results = self._run_cached(df, 'range_validation', checkable, compute)
+        for column, result in results.items():
+            if result is not None:
+                entry, bitmap = result
+                self.violations[entry['violation_check']] = bitmap
+                out_of_range_columns[column] = entry
 
         return out_of_range_columns
 
-    
     def check_custom_validation_rules(self, df, custom_rules_config):
         """
         Apply custom validation rules defined in the configuration.
@@ -163,221 +267,188 @@ class DataValidation:
             dict: Dictionary of columns with custom validation rule violations.
         """
         violated_rules = {}
+        expression_rules = {}
+        uncached_rules = []
         for rule_name, rule_details in custom_rules_config.items():
-            column = rule_details.get('column')
-            rule_type = rule_details.get('type')
-            expression = rule_details.get('expression')
-            script = rule_details.get('script')
+            rule = self._compiled_rule(rule_name, rule_details)
 
-            if column not in df.columns:
+            if rule.column not in df.columns:
                 violated_rules[rule_name] = "Column not found"
-                continue
-
-            if rule_type == 'expression' and expression:
-                try:
-                    # Evaluate expression using DataFrame.apply and convert result to boolean
-                    rule_result = df.apply(lambda row: pd.eval(expression, local_dict={'row': row}), axis=1) == False
-                    violated_data = df[rule_result]
-
-                    if not violated_data.empty:
-                        violated_rules[rule_name] = {
-                            'rule_description': rule_details.get('description', rule_name),
-                            'violated_count': len(violated_data),
-                            'violated_rows_indices': violated_data.index.tolist(),
-                            'expression': expression
-                        }
-
-                except Exception as e:
-                    violated_rules[rule_name] = f"Error evaluating expression: {e}"
-            elif rule_type == 'script' and script:
-                try:
-                    # Execute script (not implemented for security reasons, consider using expression instead)
-                    violated_rules[rule_name] = "Script execution is not supported for security reasons. Use 'expression' type instead."
-                except Exception as e:
-                    violated_rules[rule_name] = f"Error executing script: {e}"
+            elif rule.config_error:
+                violated_rules[rule_name] = rule.config_error
+            elif rule.cacheable:
+                expression_rules[rule_name] = (rule.input_columns(df.columns), rule_details)
             else:
-                violated_rules[rule_name] = "Invalid rule configuration: type or expression/script missing"
+                uncached_rules.append(rule_name)
+
+        evaluate = lambda rule_names: {name: self._evaluate_rule(df, self._compiled_rule(name, custom_rules_config[name]))
+                                       for name in rule_names}
+        results = self._run_cached(
+            df, 'custom_rule_validation', expression_rules, evaluate,
+            cacheable=lambda result: not isinstance(result, str)
+        )
+        # Rules whose inputs cannot be determined are always re-evaluated
+        results.update(evaluate(uncached_rules))
+        for rule_name, result in results.items():
+            if isinstance(result, str):
+                violated_rules[rule_name] = result
+            elif result is not None:
+                entry, bitmap = result
+                self.violations[entry['violation_check']] = bitmap
+                violated_rules[rule_name] = entry
 
         return violated_rules
 
-    def suggest_imputation_method(self, df, column):
-        """Suggest an appropriate imputation method for a column."""
-        if pd.api.types.is_numeric_dtype(df[column]):
-            return 'mean' if df[column].skew() < 1 else 'median'
-        else:
-            return 'mode'
-
-    def impute_missing_values(self, df, method='auto'):
-        """Impute missing values in the dataset."""
-        df_imputed = df.copy()
-
-        for column in df.columns:
-            if df[column].isnull().any():
-                impute_method = method if method != 'auto' else self.suggest_imputation_method(df, column)
-
-                if pd.api.types.is_numeric_dtype(df[column]):
-                    if impute_method == 'mean':
-                        df_imputed[column] = df_imputed[column].fillna(df_imputed[column].mean())
-                    elif impute_method == 'median':
-                        df_imputed[column] = df_imputed[column].fillna(df_imputed[column].median())
-                    else:
-                        df_imputed[column] = df_imputed[column].fillna(df_imputed[column].mode()[0])
-                else:
-                    # For non-numeric columns, always use mode
-                    mode_value = df_imputed[column].mode()[0] if not df_imputed[column].mode().empty else "Unknown"
-                    df_imputed[column] = df_imputed[column].fillna(mode_value)
-
-                self.logger.info(f"Imputed missing values in column '{column}' using {impute_method}")
-
-        return df_imputed
-
-    def detect_outliers(self, df):
-        """
-        Apply custom validation rules defined in the configuration.
-                Args:
-                    df (pd.DataFrame): DataFrame to validate.
-                    custom_rules_config (dict): Dictionary of custom validation rules.
-                Returns:
-                    dict: Dictionary of columns with custom validation rule violations.
-        """
-        violated_rules = {}
-        for rule_name, rule_details in custom_rules_config.items():
-            column = rule_details.get('column')
-            rule_type = rule_details.get('type')
-            expression = rule_details.get('expression')
-            script = rule_details.get('script')
+    def _compiled_rule(self, rule_name, rule_details):
+        """Use the plan's compiled rule when the config matches, otherwise compile it now."""
+        rule = self.plan.rules.get(rule_name)
+        if rule is not None and rule.details == rule_details:
+            return rule
+        return CompiledRule(rule_name, rule_details)
 
-            if column not in df.columns:
-                violated_rules[rule_name] = "Column not found"
-                continue
+    def _evaluate_rule(self, df, rule):
+        """Return (result entry, bitmap) for an expression rule, None if it passes, or an error message."""
+        try:
+            bitmap = ViolationBitmap.from_mask(rule.violations(df))
+        except Exception as e:
+            return f"Error evaluating expression: {e}"
 
-            if rule_type == 'expression' and expression:
-                try:
-                    # Evaluate expression using DataFrame.apply and convert result to boolean
-                    rule_result = df.apply(lambda row: pd.eval(expression, local_dict={'row': row}), axis=1) == False
-                    violated_data = df[rule_result]
-
-                    if not violated_data.empty:
-                        violated_rules[rule_name] = {
-                            'rule_description': rule_details.get('description', rule_name),
-                            'violated_count': len(violated_data),
-                            'violated_rows_indices': violated_data.index.tolist(),
-                            'expression': expression
-                        }
-
-                except Exception as e:
-                    violated_rules[rule_name] = f"Error evaluating expression: {e}"
-            elif rule_type == 'script' and script:
-                try:
-                    # Execute script (not implemented for security reasons, consider using expression instead)
-                    violated_rules[rule_name] = "Script execution is not supported for security reasons. Use 'expression' type instead."
-                except Exception as e:
-                    violated_rules[rule_name] = f"Error executing script: {e}"
-            else:
-                violated_rules[rule_name] = "Invalid rule configuration: type or expression/script missing"
+        if bitmap.count == 0:
+            return None
 
-        return violated_rules
+        check_name = f"custom_rule.{rule.name}"
+        return {
+            'rule_description': rule.description,
+            'violated_count': bitmap.count,
+            'violation_check': check_name,
+            'expression': rule.expression
+        }, bitmap
 
     def suggest_imputation_method(self, df, column):
         """Suggest an appropriate imputation method for a column."""
-        if pd.api.types.is_numeric_dtype(df[column]):
-            return 'mean' if df[column].skew() < 1 else 'median'
-        else:
-            return 'mode'
-
-    def impute_missing_values(self, df, method='auto'):
-        """Impute missing values in the dataset."""
-        df_imputed = df.copy()
-
-        for column in df.columns:
-            if df[column].isnull().any():
-                impute_method = method if method != 'auto' else self.suggest_imputation_method(df, column)
-
-                if pd.api.types.is_numeric_dtype(df[column]):
-                    if impute_method == 'mean':
-                        df_imputed[column] = df_imputed[column].fillna(df_imputed[column].mean())
-                    elif impute_method == 'median':
-                        df_imputed[column] = df_imputed[column].fillna(df_imputed[column].median())
-                    else:
-                        df_imputed[column] = df_imputed[column].fillna(df_imputed[column].mode()[0])
-                else:
-                    # For non-numeric columns, always use mode
-                    mode_value = df_imputed[column].mode()[0] if not df_imputed[column].mode().empty else "Unknown"
-                    df_imputed[column] = df_imputed[column].fillna(mode_value)
-
-                self.logger.info(f"Imputed missing values in column '{column}' using {impute_method}")
+        is_numeric = pd.api.types.is_numeric_dtype(df[column])
+        return ImputationPlanner.choose_method(is_numeric, df[column].skew() if is_numeric else np.nan)
+
+    def impute_missing_values(self, df, method='auto', plan=None, columns=None):
+        """Impute missing values in the dataset.
+
+        For 'auto', 'mean', 'median' and 'mode', fill statistics for every column
+        with missing values are computed in one pass and kept in
+        ``self.imputation_plan``; pass a previous plan to reuse it on another
+        chunk or file without recomputation. 'knn' and 'mice' impute numeric
+        columns (optionally only ``columns``) from the other numeric features;
+        any remaining gaps, such as non-numeric columns, are then filled as with 'auto'.
+        """
+        if method in ('knn', 'mice'):
+            if method == 'knn':
+                backend = KNNImputation(self.imputation_settings.get('knn'))
+            else:
+                backend = IterativeImputation(self.imputation_settings.get('mice'))
+            numeric_missing = [col for col in df.columns[df.isnull().any()] if pd.api.types.is_numeric_dtype(df[col])]
+            df = backend.impute(df, columns)
+            for column in numeric_missing:
+                if not df[column].isnull().any():
+                    self.logger.info(f"Imputed missing values in column '{column}' using {method}")
+            method = 'auto'
+            plan = None
+
+        planner = ImputationPlanner()
+        if plan is None:
+            missing_cols = df.columns[df.isnull().any()]
+            plan = planner.plan(df, method=method, columns=missing_cols)
+        self.imputation_plan = plan
+
+        df_imputed = planner.apply(df, plan)
+        for column, fill in plan['columns'].items():
+            if column in df.columns:
+                self.logger.info(f"Imputed missing values in column '{column}' using {fill['method']}")
 
         return df_imputed
 
     def detect_outliers(self, df):
-        """Detect outliers using Z-score and IQR methods."""
+        """Detect outliers using Z-score, robust MAD and IQR methods."""
         numeric_cols = df.select_dtypes(include=[np.number]).columns
-        outliers = {}
+        sensitivity = {'z_score': self.z_score_threshold, 'iqr': self.iqr_threshold, 'mad': self.mad_threshold}
+        detector = self._outlier_detector()
 
-        for col in numeric_cols:
-            # Z-score method
-            z_scores = np.abs(stats.zscore(df[col].dropna()))
-            z_outliers = len(z_scores[z_scores > self.z_score_threshold])
-
-            # IQR method
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            iqr_outliers = len(df[(df[col] < (Q1 - self.iqr_threshold * IQR)) | (df[col] > (Q3 + self.iqr_threshold * IQR))])
-
-            outliers[col] = {
-                'z_score_outliers': int(z_outliers),
-                'iqr_outliers': int(iqr_outliers)
-            }
+        def compute(columns):
+            summaries, bitmaps = detector.detect(df[columns])
+            return {col: (summaries[col], bitmaps[col]) for col in columns}
 
+        results = self._run_cached(df, 'outliers', {col: ([col], sensitivity) for col in numeric_cols}, compute)
+
+        outliers = {}
+        for col, (summary, bitmaps) in results.items():
+            for method, bitmap in bitmaps.items():
+                self.violations[f"outliers.{method}.{col}"] = bitmap
+            outliers[col] = summary
         return outliers
 
+    def detect_multivariate_outliers(self, df):
+        """Detect multivariate outliers (robust Mahalanobis distance, IsolationForest)."""
+        detector = self._outlier_detector()
+        if not detector.multivariate_settings['enabled']:
+            return {'message': 'Multivariate outlier detection is disabled'}
+
+        numeric_cols = list(df.select_dtypes(include=[np.number]).columns)
+        results = self._run_cached(
+            df, 'multivariate_outliers', {'all': (numeric_cols, detector.multivariate_settings)},
+            lambda items: {'all': detector.detect_multivariate(df[numeric_cols])}
+        )
+        summaries, bitmaps = results['all']
+        for method, bitmap in bitmaps.items():
+            self.violations[f"outliers.{method}"] = bitmap
+        return summaries
+
+    def _outlier_detector(self):
+        return OutlierDetector(
+            z_score_threshold=self.z_score_threshold,
+            iqr_threshold=self.iqr_threshold,
+            mad_threshold=self.mad_threshold,
+            n_jobs=self.multivariate_settings.get('n_jobs', 1),
+            multivariate_settings=self.multivariate_settings
+        )
+
     def calculate_quality_scores(self, df):
         """Calculate data quality scores for each column and overall."""
-        scores = {}
-        overall_score = 0
-
-        for col in df.columns:
-            # Initialize score at 100
-            score = 100
-
-            # Penalize for missing values
-            missing_pct = df[col].isnull().mean()
-            score -= missing_pct * 30
-
-            # Penalize for duplicates (if not index)
-            if not df[col].is_unique:
-                score -= 10
-
-            # Penalize for outliers if numeric
-            if pd.api.types.is_numeric_dtype(df[col]):
-                z_scores = np.abs(stats.zscore(df[col].dropna()))
-                outlier_pct = (z_scores > 3).mean()
-                score -= outlier_pct * 20
-
-            # Ensure score is between 0 and 100
-            score = max(0, min(100, score))
-
-            # Assign letter grade
-            if score >= 90: grade = 'A'
-            elif score >= 80: grade = 'B'
-            elif score >= 70: grade = 'C'
-            elif score >= 60: grade = 'D'
-            else: grade = 'F'
-
-            scores[col] = {
-                'score': round(score, 2),
-                'grade': grade
-            }
-            overall_score += score
-
-        overall_score = round(overall_score / len(df.columns), 2)
+        raw_scores = self._run_cached(
+            df, 'quality_scores', {col: ([col], None) for col in df.columns},
+            lambda columns: {col: self._column_quality_score(df[col]) for col in columns}
+        )
+
+        scores = {
+            col: {'score': round(score, 2), 'grade': self.get_grade(score)}
+            for col, score in raw_scores.items()
+        }
+        overall_score = round(sum(raw_scores.values()) / len(df.columns), 2)
         return {
             'column_scores': scores,
             'overall_score': overall_score,
             'overall_grade': self.get_grade(overall_score)
         }
 
+    def _column_quality_score(self, series):
+        """Score a single column between 0 and 100."""
+        # Initialize score at 100
+        score = 100
+
+        # Penalize for missing values
+        missing_pct = series.isnull().mean()
+        score -= missing_pct * 30
+
+        # Penalize for duplicates (if not index)
+        if not series.is_unique:
+            score -= 10
+
+        # Penalize for outliers if numeric
+        if pd.api.types.is_numeric_dtype(series):
+            z_scores = np.abs(stats.zscore(series.dropna()))
+            outlier_pct = (z_scores > 3).mean()
+            score -= outlier_pct * 20
+
+        # Ensure score is between 0 and 100
+        return float(max(0, min(100, score)))
+
     def get_grade(self, score):
         """Convert numeric score to letter grade."""
         if score >= 90: return 'A'
@@ -386,78 +457,88 @@ class DataValidation:
         elif score >= 60: return 'D'
         else: return 'F'
 
-    def analyze_distributions(self, df):
+    def analyze_distributions(self, df, time_budget=None):
         """Analyze distributions of numeric columns."""
+        analyzer = DistributionAnalyzer(self.distribution_settings)
         numeric_cols = df.select_dtypes(include=[np.number]).columns
-        distributions = {}
 
-        for col in numeric_cols:
-            data = df[col].dropna()
-            if len(data) < 3:  # Skip if too few samples
-                continue
+        results = self._run_cached(
+            df, 'distribution_analysis', {col: ([col], self.distribution_settings) for col in numeric_cols},
+            lambda columns: analyzer.analyze(df[columns], time_budget=time_budget),
+            cacheable=lambda result: result is None or result.get('normality_tests') != BUDGET_EXHAUSTED_MESSAGE
+        )
+        return {col: result for col, result in results.items() if result is not None}
+
+    def profile_categorical_columns(self, df):
+        """Profile string-like columns: cardinality, top values, string lengths and entropy."""
+        columns = categorical_columns(df)
+        return self._run_cached(
+            df, 'categorical_profile', {col: ([col], self.categorical_settings) for col in columns},
+            lambda stale: CategoricalProfiler(self.categorical_settings).profile(df, stale)
+        )
+
+    def _column_hash(self, df, column):
+        """Content hash of a column, memoized for the frame being validated."""
+        if df is not self._hash_frame:
+            return ResultCache.column_hash(df[column])
+        if column not in self._column_hashes:
+            self._column_hashes[column] = ResultCache.column_hash(df[column])
+        return self._column_hashes[column]
+
+    def _run_cached(self, df, check_name, items, compute, cacheable=None):
+        """Run a check item by item, recomputing only items whose inputs or config changed.
 
-            # Basic statistics
-            stats_dict = {
-                'mean': float(data.mean()),
-                'median': float(data.median()),
-                'std': float(data.std()),
-                'skewness': float(data.skew()),
-                'kurtosis': float(data.kurtosis())
-            }
+        Args:
+            df: DataFrame being validated
+            check_name: Name of the check, part of the cache key
+            items: Mapping of item name -> (input columns, config slice)
+            compute: Callable taking a list of item names and returning {item: result}
+            cacheable: Optional predicate deciding whether a computed result may be cached
 
-            # Normality tests
-            try:
-                # Check for zero variance
-                if data.var() == 0:
-                    stats_dict['normality_tests'] = 'Skipping normality tests - zero variance in data'
-                    self.logger.warning(f"Column {col} has zero variance, skipping normality tests")
-                else:
-                    shapiro_stat, shapiro_p = shapiro(data)
-                    anderson_result = anderson(data)
-
-                    stats_dict.update({
-                        'normality_tests': {
-                            'shapiro_wilk': {
-                                'statistic': float(shapiro_stat),
-                                'p_value': float(shapiro_p),
-                                'is_normal': int(shapiro_p > 0.05)  # Convert boolean to int
-                            },
-                            'anderson_darling': {
-                                'statistic': float(anderson_result.statistic),
-                                'critical_values': [float(x) for x in anderson_result.critical_values.tolist()],  # Ensure all values are float
-                                'significance_level': [float(x) for x in anderson_result.significance_level.tolist()]  # Ensure all values are float
-                            }
-                        }
-                    })
-            except Exception as e:
-                self.logger.error(f"Error in normality tests for column {col}: {str(e)}")
-                stats_dict['normality_tests'] = f'Could not perform normality tests: {str(e)}'
-
-            distributions[col] = stats_dict
-
-        return distributions
+        Returns:
+            dict: Results for every item, in the order of ``items``
+        """
+        if self.result_cache is None:
+            computed = compute(list(items)) if items else {}
+            return {item: computed.get(item) for item in items}
+
+        results, keys = {}, {}
+        for item, (columns, config_slice) in items.items():
+            content_hash = '|'.join(self._column_hash(df, col) for col in columns)
+            keys[item] = ResultCache.make_key(content_hash, check_name, config_slice)
+            cached = self.result_cache.get(keys[item], _NOT_CACHED)
+            if cached is not _NOT_CACHED:
+                results[item] = cached
+
+        stale = [item for item in items if item not in results]
+        if stale:
+            computed = compute(stale)
+            for item in stale:
+                results[item] = computed.get(item)
+                if cacheable is None or cacheable(results[item]):
+                    self.result_cache.set(keys[item], results[item])
+            self.logger.info(f"{check_name}: recomputed {len(stale)} of {len(items)} items")
+
+        return {item: results[item] for item in items}
 
     def detect_multicollinearity(self, df):
         """Detect multicollinearity between numeric features."""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        stats = stats_for(df, self.stats)
+        numeric_cols = stats.numeric_columns()
         if len(numeric_cols) < 2:
             return {'message': 'Not enough numeric columns for correlation analysis'}
 
-        corr_matrix = df[numeric_cols].corr()
-        high_correlations = []
-
-        for i in range(len(numeric_cols)):
-            for j in range(i+1, len(numeric_cols)):
-                correlation = abs(corr_matrix.iloc[i, j])
-                if correlation > self.correlation_threshold:
-                    high_correlations.append({
-                        'feature1': numeric_cols[i],
-                        'feature2': numeric_cols[j],
-                        'correlation': float(correlation)
-                    })
+        high_correlations = [
+            {'feature1': feature1, 'feature2': feature2, 'correlation': abs(correlation)}
+            for feature1, feature2, correlation in correlated_pairs(
+                stats.correlation_matrix(), self.correlation_threshold, strict=True, sort=False
+            )
+        ]
 
+        # Wide matrices are not sent as a nested dict; the correlation analysis serves them as tiles
+        wide = len(numeric_cols) > self.tile_settings['wide_columns']
         return {
-            'correlation_matrix': corr_matrix.to_dict(),
+            'correlation_matrix': None if wide else stats.correlation_dict(),
             'high_correlations': high_correlations,
             'threshold': self.correlation_threshold
         }
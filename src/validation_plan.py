@@ -0,0 +1,300 @@
+import io
+import os
+import ast
+import operator
+import tokenize
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import yaml
+from src.logger import setup_logger
+
+logger = setup_logger()
+
+
+class RuleCompileError(ValueError):
+    """Raised when a rule expression uses syntax the vectorized evaluator does not support."""
+
+
+_BINARY_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+    ast.Pow: operator.pow, ast.BitXor: operator.xor
+}
+_COMPARE_OPS = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Lt: operator.lt,
+    ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge
+}
+_UNARY_OPS = {ast.USub: operator.neg, ast.UAdd: operator.pos, ast.Invert: operator.invert}
+_FUNCTIONS = {'abs': np.abs}
+
+
+class CompiledRule:
+    """A custom validation rule parsed once into a vectorized evaluator.
+
+    Expressions are written against a single row (``row['score'] >= 1``). They
+    are parsed into an AST and compiled to a function of the whole DataFrame in
+    which ``row['col']`` becomes the column, so a rule is evaluated with a few
+    column operations instead of one ``pd.eval`` per row. Expressions outside the
+    supported subset fall back to the row-wise evaluation.
+    """
+
+    def __init__(self, name: str, details: Dict[str, Any]):
+        """Initialize CompiledRule.
+
+        Args:
+            name: Rule name
+            details: Rule configuration (column, type, expression/script, description)
+        """
+        self.name = name
+        self.details = details
+        self.column = details.get('column')
+        self.rule_type = details.get('type')
+        self.expression = details.get('expression')
+        self.description = details.get('description', name)
+        self.config_error = None
+        self.referenced_columns: List[str] = []
+        self.cacheable = True
+        self._evaluator: Optional[Callable[[pd.DataFrame], Any]] = None
+
+        if self.rule_type == 'expression' and self.expression:
+            try:
+                self._evaluator, self.referenced_columns = compile_expression(self.expression)
+            except RuleCompileError as e:
+                logger.warning(f"Rule {name} will be evaluated row by row: {str(e)}")
+                # The row-wise rule still reads only the columns it subscripts, unless it uses row otherwise
+                columns = row_columns(self.expression)
+                self.referenced_columns = columns or []
+                self.cacheable = columns is not None
+            except SyntaxError as e:
+                self.config_error = f"Error evaluating expression: {e}"
+        elif self.rule_type == 'script' and details.get('script'):
+            # Execute script (not implemented for security reasons, consider using expression instead)
+            self.config_error = "Script execution is not supported for security reasons. Use 'expression' type instead."
+        else:
+            self.config_error = "Invalid rule configuration: type or expression/script missing"
+
+    @property
+    def vectorized(self) -> bool:
+        return self._evaluator is not None
+
+    def input_columns(self, columns) -> List[str]:
+        """Columns of a DataFrame the rule reads (used for result caching, only when ``cacheable``)."""
+        return sorted({self.column, *(col for col in self.referenced_columns if col in columns)})
+
+    def violations(self, df: pd.DataFrame) -> np.ndarray:
+        """Boolean mask of rows where the rule evaluates to False."""
+        if self._evaluator is None:
+            result = df.apply(lambda row: pd.eval(self.expression, local_dict={'row': row}), axis=1)
+        else:
+            result = self._evaluator(df)
+        if not isinstance(result, pd.Series):
+            return np.full(len(df), bool(result == False))  # noqa: E712
+        return (result == False).fillna(False).to_numpy(dtype=bool)  # noqa: E712
+
+
+@lru_cache(maxsize=256)
+def compile_expression(expression: str) -> Tuple[Callable[[pd.DataFrame], Any], List[str]]:
+    """Compile a row expression into a function of a DataFrame.
+
+    Returns:
+        Tuple of (evaluator, referenced column names)
+
+    Raises:
+        SyntaxError: If the expression cannot be parsed
+        RuleCompileError: If the expression uses unsupported syntax
+    """
+    tree = ast.parse(_replace_booleans(expression.strip()), mode='eval')
+    columns = []
+    evaluator = _compile_node(tree.body, columns)
+    return evaluator, sorted(set(columns))
+
+
+def _replace_booleans(expression: str) -> str:
+    """Rewrite ``&`` and ``|`` as ``and`` and ``or``, as pd.eval does before parsing.
+
+    pd.eval gives ``&`` and ``|`` the precedence of ``and``/``or``, below
+    comparisons, so ``row['a'] >= 0 & row['b'] <= 4`` means
+    ``(row['a'] >= 0) & (row['b'] <= 4)``; Python would bind ``0 & row['b']``.
+    """
+    tokens = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(expression).readline):
+            if token.type == tokenize.OP and token.string in ('&', '|'):
+                tokens.append((tokenize.NAME, 'and' if token.string == '&' else 'or'))
+            else:
+                tokens.append((token.type, token.string))
+    except tokenize.TokenError as e:
+        raise SyntaxError(str(e)) from None
+    return tokenize.untokenize(tokens)
+
+
+def row_columns(expression: str) -> Optional[List[str]]:
+    """Columns subscripted as ``row['column']`` anywhere in an expression.
+
+    Returns None when the expression uses ``row`` any other way (``row.value``,
+    ``row[name]``), since its inputs are then not known statically.
+    """
+    tree = ast.parse(expression.strip(), mode='eval')
+    columns, subscripted = set(), set()
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id == 'row'
+                and isinstance(node.slice, ast.Constant) and isinstance(node.slice.value, str)):
+            columns.add(node.slice.value)
+            subscripted.add(id(node.value))
+    uses = [node for node in ast.walk(tree) if isinstance(node, ast.Name) and node.id == 'row']
+    if any(id(node) not in subscripted for node in uses):
+        return None
+    return sorted(columns)
+
+
+def _compile_node(node: ast.AST, columns: List[str]) -> Callable[[pd.DataFrame], Any]:
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda df: value
+
+    if isinstance(node, (ast.List, ast.Tuple)):
+        items = [_compile_node(item, columns) for item in node.elts]
+        return lambda df: [item(df) for item in items]
+
+    if isinstance(node, ast.Subscript):
+        if not (isinstance(node.value, ast.Name) and node.value.id == 'row'
+                and isinstance(node.slice, ast.Constant) and isinstance(node.slice.value, str)):
+            raise RuleCompileError("only row['column'] subscripts are supported")
+        column = node.slice.value
+        columns.append(column)
+        return lambda df: df[column]
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        op = _BINARY_OPS[type(node.op)]
+        left, right = _compile_node(node.left, columns), _compile_node(node.right, columns)
+        return lambda df: op(left(df), right(df))
+
+    if isinstance(node, ast.UnaryOp):
+        operand = _compile_node(node.operand, columns)
+        if isinstance(node.op, ast.Not):
+            return lambda df: _logical_not(operand(df))
+        if type(node.op) in _UNARY_OPS:
+            op = _UNARY_OPS[type(node.op)]
+            return lambda df: op(operand(df))
+
+    if isinstance(node, ast.BoolOp):
+        # pd.eval treats and/or as element-wise &/|
+        op = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+        values = [_compile_node(value, columns) for value in node.values]
+
+        def evaluate_bool(df):
+            result = values[0](df)
+            for value in values[1:]:
+                result = op(result, value(df))
+            return result
+        return evaluate_bool
+
+    if isinstance(node, ast.Compare):
+        operands = [_compile_node(node.left, columns)] + [_compile_node(c, columns) for c in node.comparators]
+        comparisons = []
+        for i, cmp_op in enumerate(node.ops):
+            if type(cmp_op) in _COMPARE_OPS:
+                comparisons.append((i, _COMPARE_OPS[type(cmp_op)]))
+            elif isinstance(cmp_op, (ast.In, ast.NotIn)):
+                comparisons.append((i, _isin if isinstance(cmp_op, ast.In) else _not_isin))
+            else:
+                raise RuleCompileError(f"unsupported comparison {type(cmp_op).__name__}")
+
+        def evaluate_compare(df):
+            values = [operand(df) for operand in operands]
+            result = None
+            for i, op in comparisons:
+                part = op(values[i], values[i + 1])
+                result = part if result is None else result & part
+            return result
+        return evaluate_compare
+
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id in _FUNCTIONS and not node.keywords):
+        function = _FUNCTIONS[node.func.id]
+        args = [_compile_node(arg, columns) for arg in node.args]
+        return lambda df: function(*(arg(df) for arg in args))
+
+    raise RuleCompileError(f"unsupported syntax {type(node).__name__}")
+
+
+def _logical_not(value):
+    return ~value if isinstance(value, pd.Series) else not value
+
+
+def _isin(left, right):
+    return left.isin(right) if isinstance(left, pd.Series) else left in right
+
+
+def _not_isin(left, right):
+    return ~left.isin(right) if isinstance(left, pd.Series) else left not in right
+
+
+class ValidationPlan:
+    """Validation settings resolved and compiled once from config.yaml.
+
+    Holds the resolved thresholds and per-check settings, range bounds grouped
+    by column and the compiled custom rules. Plans are shared process-wide via
+    ``get_validation_plan`` and rebuilt only when the config file changes.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """Initialize ValidationPlan.
+
+        Args:
+            config: Parsed configuration (the whole config.yaml)
+        """
+        validation = config['validation']
+        self.mode = validation.get('mode', 'exact')
+        self.profile = validation.get('profile', 'full')
+        self.profiles = validation.get('profiles', {})
+        self.missing_threshold = validation['missing_threshold']
+        self.outlier_sensitivity = validation['outlier_sensitivity']
+        self.z_score_threshold = self.outlier_sensitivity['z_score']
+        self.iqr_threshold = self.outlier_sensitivity['iqr']
+        self.mad_threshold = self.outlier_sensitivity.get('mad', 3.5)
+        self.multivariate_settings = validation.get('multivariate_outliers', {})
+        self.imputation_settings = validation.get('imputation', {})
+        self.distribution_settings = validation.get('distribution', {})
+        self.type_inference_settings = validation.get('type_inference', {})
+        self.categorical_settings = validation.get('categorical_profile', {})
+        self.approximate_settings = validation.get('approximate', {})
+        self.cache_config = config.get('cache', {})
+        self.tile_settings = config.get('plots', {}).get('tiles', {})
+
+        self.range_validation_config = validation.get('range_validation') or {}
+        self.range_bounds = {
+            column: (ranges.get('min'), ranges.get('max'))
+            for column, ranges in self.range_validation_config.items()
+        }
+
+        self.custom_rules_config = validation.get('custom_validation_rules') or {}
+        self.rules = {name: CompiledRule(name, details) for name, details in self.custom_rules_config.items()}
+
+    @classmethod
+    def load(cls, config_path: str = 'config.yaml') -> 'ValidationPlan':
+        """Read and compile a plan from a YAML file."""
+        with open(config_path, 'r') as f:
+            return cls(yaml.safe_load(f))
+
+
+_plans: Dict[str, Tuple[Tuple[int, int], ValidationPlan]] = {}
+_plans_lock = Lock()
+
+
+def get_validation_plan(config_path: str = 'config.yaml') -> ValidationPlan:
+    """Return the process-wide plan for a config file, recompiling it when the file changes."""
+    path = os.path.abspath(config_path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _plans_lock:
+        cached = _plans.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        plan = ValidationPlan.load(path)
+        _plans[path] = (signature, plan)
+        logger.info(f"Compiled validation plan from {path}")
+        return plan
@@ -0,0 +1,105 @@
+import numpy as np
+from typing import Dict, Any, List
+
+# Number of set bits in every possible byte value
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+class ViolationBitmap:
+    """Row-level violation mask stored as a compressed bitmap.
+
+    The mask is packed with ``np.packbits`` (one bit per row) and a cumulative
+    popcount is kept per block of bytes, so a single page of violating rows can
+    be decoded without unpacking the whole mask.
+    """
+
+    BLOCK_BYTES = 1024  # 8192 rows per block
+
+    def __init__(self, packed: np.ndarray, length: int):
+        """Initialize ViolationBitmap.
+
+        Args:
+            packed: Bits packed with ``np.packbits`` (big bit order)
+            length: Number of rows covered by the bitmap
+        """
+        self.packed = np.asarray(packed, dtype=np.uint8)
+        self.length = int(length)
+
+        byte_counts = _POPCOUNT[self.packed]
+        if len(byte_counts):
+            starts = np.arange(0, len(byte_counts), self.BLOCK_BYTES)
+            block_counts = np.add.reduceat(byte_counts, starts)
+        else:
+            block_counts = np.zeros(0, dtype=np.int64)
+        self._cumulative = np.concatenate(([0], np.cumsum(block_counts, dtype=np.int64)))
+
+    @classmethod
+    def from_mask(cls, mask) -> 'ViolationBitmap':
+        """Build a bitmap from a boolean mask (array or Series)."""
+        mask = np.asarray(mask, dtype=bool)
+        return cls(np.packbits(mask), len(mask))
+
+    @classmethod
+    def from_positions(cls, positions, length: int) -> 'ViolationBitmap':
+        """Build a bitmap from the row positions of violating rows."""
+        mask = np.zeros(length, dtype=bool)
+        mask[np.asarray(positions, dtype=np.int64)] = True
+        return cls.from_mask(mask)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, length: int) -> 'ViolationBitmap':
+        """Rebuild a bitmap from the output of ``to_bytes``."""
+        return cls(np.frombuffer(data, dtype=np.uint8), length)
+
+    def to_bytes(self) -> bytes:
+        """Return the packed bitmap as raw bytes."""
+        return self.packed.tobytes()
+
+    @property
+    def count(self) -> int:
+        """Total number of violating rows."""
+        return int(self._cumulative[-1])
+
+    def to_mask(self) -> np.ndarray:
+        """Decode the full boolean mask."""
+        return np.unpackbits(self.packed, count=self.length).astype(bool)
+
+    def rows(self, start: int = 0, stop: int = None) -> np.ndarray:
+        """Decode the positions of violating rows ``start:stop`` (in violation order).
+
+        Only the blocks that contain the requested violations are unpacked.
+        """
+        stop = self.count if stop is None else min(int(stop), self.count)
+        start = max(int(start), 0)
+        if start >= stop:
+            return np.zeros(0, dtype=np.int64)
+
+        block = int(np.searchsorted(self._cumulative, start, side='right')) - 1
+        skip = start - int(self._cumulative[block])
+        needed = stop - start
+        found = []
+
+        while needed > 0 and block < len(self._cumulative) - 1:
+            byte_start = block * self.BLOCK_BYTES
+            bits = np.unpackbits(self.packed[byte_start:byte_start + self.BLOCK_BYTES])
+            positions = np.flatnonzero(bits)[skip:skip + needed] + byte_start * 8
+            found.append(positions)
+            needed -= len(positions)
+            skip = 0
+            block += 1
+
+        return np.concatenate(found).astype(np.int64)
+
+    def page(self, page: int = 1, page_size: int = 100) -> List[int]:
+        """Return the row positions on a 1-based page of violations."""
+        if page < 1 or page_size < 1:
+            raise ValueError("page and page_size must be positive")
+        start = (page - 1) * page_size
+        return self.rows(start, start + page_size).tolist()
+
+    def summary(self) -> Dict[str, Any]:
+        """Summary counts suitable for inclusion in task results."""
+        return {
+            'violation_count': self.count,
+            'total_rows': self.length
+        }
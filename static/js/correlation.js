@@ -125,13 +125,34 @@ export function renderCorrelationMatrix(correlationData) {
                 </div>`;
         }
 
-        // Add correlation matrix visualization
-        if (correlationData.correlation_matrix_path) {
+        // Wide matrices come as tiles of a clustered matrix instead of one heatmap
+        if (correlationData.matrix_tiles) {
+            const tiles = correlationData.matrix_tiles;
+            html += `
+                <div class="bg-white p-6 rounded-lg shadow-sm mt-6">
+                    <div class="flex items-center justify-between mb-4">
+                        <h4 class="font-medium text-gray-900">Correlation Matrix (${tiles.size} columns, clustered)</h4>
+                        <div class="flex items-center space-x-2 text-sm">
+                            <button id="correlation-tiles-zoom-out" class="px-2 py-1 border rounded">-</button>
+                            <span id="correlation-tiles-level" class="text-gray-500"></span>
+                            <button id="correlation-tiles-zoom-in" class="px-2 py-1 border rounded">+</button>
+                        </div>
+                    </div>
+                    <div id="correlation-matrix-tiles" class="overflow-auto" style="max-height: 640px;"></div>
+                    <p id="correlation-tiles-hover" class="mt-2 text-sm text-gray-500"></p>
+                </div>`;
+        }
+
+        // Add correlation matrix visualization; a pending heatmap is attached when it is rendered
+        if (correlationData.correlation_matrix_path || correlationData.correlation_matrix_status === 'pending') {
+            const image = correlationData.correlation_matrix_path
+                ? `<img src="/${correlationData.correlation_matrix_path}" alt="Correlation Matrix" class="w-full">`
+                : '<p class="text-sm text-gray-500">Rendering heatmap...</p>';
             html += `
                 <div class="bg-white p-6 rounded-lg shadow-sm mt-6">
                     <h4 class="font-medium text-gray-900 mb-4">Correlation Matrix Visualization</h4>
-                    <div class="overflow-x-auto">
-                        <img src="/${correlationData.correlation_matrix_path}" alt="Correlation Matrix" class="w-full">
+                    <div id="correlation-matrix-image" class="overflow-x-auto">
+                        ${image}
                     </div>
                 </div>`;
         }
@@ -188,6 +209,10 @@ export function renderCorrelationMatrix(correlationData) {
         html += '</div>';
         correlationDiv.innerHTML = html;
 
+        if (correlationData.matrix_tiles) {
+            initializeTiledMatrix(correlationData.matrix_tiles);
+        }
+
         // Initialize and render correlation chart
         const correlationCanvas = document.getElementById('correlation-canvas');
         if (correlationCanvas) {
@@ -323,6 +348,71 @@ function generateColors(context) {
 // Export chart instance and functions for testing
 export { correlationChart, processData, generateColors };
 
+export function initializeTiledMatrix(tiles) {
+    const viewport = document.getElementById('correlation-matrix-tiles');
+    if (!viewport) return;
+    const levelLabel = document.getElementById('correlation-tiles-level');
+    const hover = document.getElementById('correlation-tiles-hover');
+    const overviewCells = Math.ceil(tiles.size / 2 ** (tiles.levels - 1));
+    const scale = Math.max(1, Math.floor(512 / overviewCells));  // Screen pixels per tile pixel
+    let level = tiles.levels - 1;  // Start from the single-tile overview
+
+    const draw = () => {
+        const factor = 2 ** level;
+        const cells = Math.ceil(tiles.size / factor);
+        const count = Math.ceil(cells / tiles.tile_size);
+        const images = [];
+        // Only tiles scrolled into view are requested; the server renders and caches each once
+        for (let row = 0; row < count; row++) {
+            for (let col = 0; col < count; col++) {
+                const width = Math.min(tiles.tile_size, cells - col * tiles.tile_size) * scale;
+                const height = Math.min(tiles.tile_size, cells - row * tiles.tile_size) * scale;
+                images.push(`<img loading="lazy" alt="" src="/correlation_tiles/${tiles.key}/${level}/${row}/${col}.png"
+                    style="position: absolute; left: ${col * tiles.tile_size * scale}px; top: ${row * tiles.tile_size * scale}px;
+                           width: ${width}px; height: ${height}px; image-rendering: pixelated;">`);
+            }
+        }
+        viewport.innerHTML = `<div style="position: relative; width: ${cells * scale}px; height: ${cells * scale}px;">${images.join('')}</div>`;
+        if (levelLabel) levelLabel.textContent = level === 0 ? 'Full resolution' : `1:${factor}`;
+    };
+
+    const zoom = (step) => {
+        const next = Math.min(tiles.levels - 1, Math.max(0, level + step));
+        if (next === level) return;
+        // Keep the point at the centre of the viewport in place
+        const ratio = 2 ** (level - next);
+        const centerX = (viewport.scrollLeft + viewport.clientWidth / 2) * ratio;
+        const centerY = (viewport.scrollTop + viewport.clientHeight / 2) * ratio;
+        level = next;
+        draw();
+        viewport.scrollLeft = centerX - viewport.clientWidth / 2;
+        viewport.scrollTop = centerY - viewport.clientHeight / 2;
+    };
+
+    document.getElementById('correlation-tiles-zoom-in')?.addEventListener('click', () => zoom(-1));
+    document.getElementById('correlation-tiles-zoom-out')?.addEventListener('click', () => zoom(1));
+    viewport.addEventListener('mousemove', (event) => {
+        if (!hover) return;
+        const bounds = viewport.firstElementChild.getBoundingClientRect();
+        const factor = 2 ** level;
+        const row = Math.floor((event.clientY - bounds.top) / scale) * factor;
+        const col = Math.floor((event.clientX - bounds.left) / scale) * factor;
+        if (row < 0 || col < 0 || row >= tiles.size || col >= tiles.size) return;
+        hover.textContent = factor === 1
+            ? `${tiles.columns[row]} vs ${tiles.columns[col]}`
+            : `${tiles.columns[row]}... vs ${tiles.columns[col]}... (strongest of ${factor}x${factor} pairs)`;
+    });
+    draw();
+}
+
+export function attachCorrelationMatrixImage(path, error) {
+    const container = document.getElementById('correlation-matrix-image');
+    if (!container) return;
+    container.innerHTML = path
+        ? `<img src="/${path}" alt="Correlation Matrix" class="w-full">`
+        : `<p class="text-sm text-red-500">Heatmap could not be rendered${error ? `: ${error}` : ''}</p>`;
+}
+
 export function renderCorrelationTable(correlationData) {
     const container = document.getElementById('correlation-table');
     if (!container) return;
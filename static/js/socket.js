@@ -1,8 +1,9 @@
 // Socket.IO functionality
 import { showToast } from './utils.js';
 import { showResults } from './validation.js';
+import { attachCorrelationMatrixImage } from './correlation.js';
 import { updateProgress } from './utils.js';
-import { getCurrentTaskId, setCurrentTaskId } from './state.js';
+import { getCurrentTaskId, setCurrentTaskId, getDisplayedTaskId, setDisplayedTaskId } from './state.js';
 
 let socket;
 let reconnectAttempts = 0;
@@ -83,6 +84,7 @@ function initializeSocket() {
                         return value === null ? '' : value;
                     });
                     
+                    setDisplayedTaskId(data.task_id);
                     showResults(cleanResults);
                     showToast('Processing complete!', 'success');
                 } catch (error) {
@@ -105,6 +107,17 @@ function initializeSocket() {
         }
     });
 
+    // Plots are rendered in the background and arrive after the task's results
+    socket.on('plot_ready', (data) => {
+        console.log('Plot ready:', data);
+        if (data.task_id !== getDisplayedTaskId()) {
+            return;  // A plot of another task than the results on screen
+        }
+        if (data.kind === 'correlation_matrix') {
+            attachCorrelationMatrixImage(data.path, data.error);
+        }
+    });
+
     return socket;
 }
 
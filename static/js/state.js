@@ -1,5 +1,6 @@
 // Shared state management
 let currentTaskId = null;
+let displayedTaskId = null;  // Task whose results are shown; outlives currentTaskId for late plots
 let uploadedFiles = [];
 let filenameMapping = {};
 
@@ -79,6 +80,14 @@ export function setCurrentTaskId(taskId) {
     }
 }
 
+export function getDisplayedTaskId() {
+    return displayedTaskId;
+}
+
+export function setDisplayedTaskId(taskId) {
+    displayedTaskId = taskId;
+}
+
 export function addFileToUploadedFiles(originalFilename, serverFilename) {
     // Initialize state first
     initializeState();
@@ -3,14 +3,17 @@ import io
 import json
 import time
 import logging
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
 import numpy as np
 from flask import Flask
 from flask_socketio import SocketIO
+from src.results_store import ResultsStore
 
-from app import app, socketio, tasks, erd_generator
+from app import app, socketio, tasks, task_violations, erd_generator, profile_store
+from src.violations import ViolationBitmap
 from src import correlation
 
 logger = logging.getLogger(__name__)
@@ -46,8 +49,16 @@ class TestWebInterface(unittest.TestCase):
         # Clear any existing tasks
         tasks.clear()
 
+        # Each test gets an empty results store so earlier runs are not reused
+        self.store_dir = tempfile.TemporaryDirectory()
+        self.results_store = ResultsStore(self.store_dir.name)
+        self.store_patch = patch('app.results_store', self.results_store)
+        self.store_patch.start()
+
     def tearDown(self):
         """Clean up test files and directories."""
+        self.store_patch.stop()
+        self.store_dir.cleanup()
         # Clean up uploaded files
         if os.path.exists(self.test_upload_dir):
             for file in os.listdir(self.test_upload_dir):
@@ -319,6 +330,170 @@ class TestWebInterface(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn(b'API Documentation', response.data)
 
+    def test_violations_pagination(self):
+        """Test paginated drill-down into violating rows."""
+        mask = np.zeros(1000, dtype=bool)
+        mask[::7] = True
+        task_violations['task-1'] = {'range_validation.value': ViolationBitmap.from_mask(mask)}
+
+        response = self.app.get('/tasks/task-1/violations/range_validation.value?page=2&page_size=10')
+        self.assertEqual(response.status_code, 200)
+        result = json.loads(response.data)
+        self.assertEqual(result['total_count'], int(mask.sum()))
+        self.assertEqual(result['total_pages'], 15)
+        self.assertEqual(result['rows'], list(range(70, 140, 7)))
+
+        response = self.app.get('/tasks/task-1/violations/missing_check')
+        self.assertEqual(response.status_code, 404)
+
+        response = self.app.get('/tasks/task-1/violations/range_validation.value?page=0')
+        self.assertEqual(response.status_code, 400)
+        task_violations.clear()
+
+    def test_drift_endpoint(self):
+        """Test drift between the stored profiles of two uploads of a dataset."""
+        from src.drift import DatasetProfiler
+        rng = np.random.default_rng(42)
+        profiler = DatasetProfiler()
+        day1 = pd.DataFrame({'amount': rng.normal(100, 10, 5000), 'city': rng.choice(['a', 'b'], 5000)})
+        day2 = pd.DataFrame({'amount': rng.normal(130, 10, 5000), 'city': rng.choice(['a', 'b'], 5000)})
+        profile_store.save('drift-day1', {**profiler.profile(day1, dataset='feed'), 'created_at': '2024-01-01T00:00:00'})
+        profile_store.save('drift-day2', {**profiler.profile(day2, dataset='feed'), 'created_at': '2024-01-02T00:00:00'})
+        try:
+            response = self.app.get('/tasks/drift-day2/drift')
+            self.assertEqual(response.status_code, 200)
+            result = json.loads(response.data)
+            self.assertEqual(result['reference']['task_id'], 'drift-day1')
+            self.assertEqual(result['drifted_columns'], ['amount'])
+
+            response = self.app.get('/tasks/drift-day1/drift')
+            self.assertEqual(response.status_code, 404)  # No earlier upload of the dataset
+            response = self.app.get('/tasks/drift-day1/drift?reference=../secret')
+            self.assertEqual(response.status_code, 400)
+        finally:
+            for task_id in ('drift-day1', 'drift-day2'):
+                os.remove(profile_store._path(task_id))
+
+    def test_feature_importance_endpoint(self):
+        """Test target importance for an uploaded file, including a non-numeric target."""
+        rng = np.random.default_rng(1)
+        region = rng.choice(['north', 'south'], 200)
+        frame = pd.DataFrame({'region': region, 'rooms': rng.integers(1, 5, 200),
+                              'price': np.where(region == 'north', 2e6, 1e6) + rng.normal(0, 1e5, 200)})
+        data = {'file': (io.BytesIO(frame.to_csv(index=False).encode()), 'importance.csv')}
+        filename = json.loads(self.app.post('/upload', content_type='multipart/form-data', data=data).data)['filename']
+
+        response = self.app.post('/feature_importance', content_type='application/json',
+                                 data=json.dumps({'filename': filename, 'target': 'price'}))
+        self.assertEqual(response.status_code, 200)
+        result = json.loads(response.data)
+        self.assertEqual(result['top_features'][0], 'region')
+        self.assertEqual(result['measures']['region'], 'correlation_ratio')
+
+        response = self.app.post('/feature_importance', content_type='application/json',
+                                 data=json.dumps({'filename': filename, 'target': 'region'}))
+        self.assertEqual(json.loads(response.data)['target_type'], 'categorical')
+
+        response = self.app.post('/feature_importance', content_type='application/json',
+                                 data=json.dumps({'filename': filename, 'target': 'missing'}))
+        self.assertEqual(response.status_code, 400)
+
+    def test_correlation_tile_endpoints(self):
+        """Test metadata, PNG and value tiles of a stored wide correlation matrix."""
+        from app import correlation_analyzer
+        from src.matrix_tiles import MatrixTiles
+        rng = np.random.default_rng(2)
+        matrix = pd.DataFrame(rng.normal(size=(50, 300))).add_prefix('c').corr()
+        with tempfile.TemporaryDirectory() as directory:
+            with patch.object(correlation_analyzer, 'matrix_tiles', MatrixTiles({'directory': directory})):
+                key = correlation_analyzer.matrix_tiles.save(matrix)['key']
+
+                response = self.app.get(f'/correlation_tiles/{key}')
+                self.assertEqual(json.loads(response.data)['levels'], 2)
+                response = self.app.get(f'/correlation_tiles/{key}/1/0/0.png')
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.mimetype, 'image/png')
+                response.close()
+                response = self.app.get(f'/correlation_tiles/{key}/0/1/1.json')
+                self.assertEqual(len(json.loads(response.data)['values']), 44)
+
+                self.assertEqual(self.app.get(f'/correlation_tiles/{key}/2/0/0.png').status_code, 400)
+                self.assertEqual(self.app.get(f"/correlation_tiles/{'0' * 32}/0/0/0.png").status_code, 404)
+                self.assertEqual(self.app.get('/correlation_tiles/not-a-key').status_code, 400)
+
+    @patch('src.correlation.CorrelationAnalyzer.analyze')
+    def test_stored_results_reused_and_survive_restart(self, mock_analyze):
+        """Test that identical inputs reuse stored results, which outlive the in-memory tasks."""
+        mock_analyze.return_value = {'correlations': {}, 'high_correlations': [], 'correlation_matrix_path': None}
+        data = {'file': (io.BytesIO(b'id,amount\n1,10\n2,20\n3,-5'), 'stored.csv')}
+        upload_response = self.app.post('/upload', content_type='multipart/form-data', data=data)
+        filename = json.loads(upload_response.data)['filename']
+
+        task_ids = []
+        for _ in range(2):
+            response = self.app.post('/process', content_type='application/json',
+                                     data=json.dumps({'filename': filename}))
+            task_ids.append(json.loads(response.data)['task_id'])
+            self.assertEqual(self.wait_for_task_completion(task_ids[-1])['status'], 'Complete')
+
+        self.assertEqual(mock_analyze.call_count, 1)
+        self.assertEqual(tasks[task_ids[1]]['stored_task_id'], task_ids[0])
+        self.assertEqual(self.results_store.query(filename=filename)[0]['task_id'], task_ids[0])
+
+        # After a restart only the store is left
+        tasks.clear()
+        task_violations.clear()
+        response = self.app.get(f'/results/{task_ids[0]}')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('amount', json.loads(response.data)['basic_validation']['negative_values'])
+        self.assertEqual(self.app.get('/results/unknown-task').status_code, 404)
+        response = self.app.get(f'/results?filename={filename}')
+        self.assertEqual([row['task_id'] for row in json.loads(response.data)], [task_ids[0]])
+
+    def test_stored_tiled_results_outlive_the_tile_cache(self):
+        """Test that reused or served stored results get their expired tiled matrix back."""
+        from app import correlation_analyzer
+        from src.matrix_tiles import MatrixTiles
+        rng = np.random.default_rng(3)
+        matrix = pd.DataFrame(rng.normal(size=(50, 30))).add_prefix('c').corr()
+        data = {'file': (io.BytesIO(b'id,amount\n1,10\n2,20\n3,-7'), 'tiled.csv')}
+        filename = json.loads(self.app.post('/upload', content_type='multipart/form-data', data=data).data)['filename']
+
+        with tempfile.TemporaryDirectory() as directory:
+            tiles = MatrixTiles({'directory': directory})
+            meta = tiles.save(matrix)
+            analysis = {'correlations': {}, 'high_correlations': [], 'correlation_matrix_path': None,
+                        'matrix_tiles': meta}
+            with patch.object(correlation_analyzer, 'matrix_tiles', tiles), \
+                    patch('src.correlation.CorrelationAnalyzer.analyze', return_value=analysis) as analyze:
+                task_ids = []
+                for _ in range(2):
+                    response = self.app.post('/process', content_type='application/json',
+                                             data=json.dumps({'filename': filename}))
+                    task_ids.append(json.loads(response.data)['task_id'])
+                    self.assertEqual(self.wait_for_task_completion(task_ids[-1])['status'], 'Complete')
+                    if len(task_ids) == 1:
+                        for path in tiles.files(meta['key']).values():
+                            os.remove(path)  # Collected before the identical upload is processed
+
+                self.assertEqual(analyze.call_count, 1)
+                self.assertEqual(tasks[task_ids[1]]['stored_task_id'], task_ids[0])
+                self.assertEqual(self.app.get(f"/correlation_tiles/{meta['key']}").status_code, 200)
+
+                tasks.clear()
+                for path in tiles.files(meta['key']).values():
+                    os.remove(path)
+                response = json.loads(self.app.get(f'/results/{task_ids[0]}').data)
+                self.assertEqual(response['correlation_analysis']['matrix_tiles']['key'], meta['key'])
+                self.assertEqual(self.app.get(f"/correlation_tiles/{meta['key']}").status_code, 200)
+
+                for path in tiles.files(meta['key']).values():
+                    os.remove(path)
+                for ext in ('npy', 'json'):
+                    os.remove(self.results_store.file_path(task_ids[0], f"tiles.{ext}"))
+                response = json.loads(self.app.get(f'/results/{task_ids[0]}').data)
+                self.assertIsNone(response['correlation_analysis']['matrix_tiles'])
+
     @patch('app.data_ingestion')
     def test_upload_with_nan_values(self, mock_ingestion):
         """Test file upload with NaN values."""
@@ -814,5 +989,37 @@ class TestWebInterface(unittest.TestCase):
             self.assertEqual(final_progress['status'], 'Complete')
             self.assertIn('results', final_progress)
 
+    def test_plot_ready_sent_to_task_room(self):
+        """Test that a background heatmap is announced only to the clients of its task."""
+        rows = '\n'.join(f"{i},{i * 7 % 11},{time.time_ns() % 1000 + i}" for i in range(20))
+        data = {'file': (io.BytesIO(f"a,b,c\n{rows}".encode()), 'test.csv', 'text/csv')}
+        self.assertEqual(self.app.post('/upload', content_type='multipart/form-data', data=data).status_code, 200)
+
+        with patch('app.socketio.emit') as mock_emit:
+            response = self.app.post('/process', content_type='application/json',
+                                     data=json.dumps({'filename': 'test.csv'}))
+            task_id = json.loads(response.data)['task_id']
+            self.wait_for_task_completion(task_id)
+
+            deadline = time.time() + 60
+            plot_calls = []
+            while not plot_calls and time.time() < deadline:
+                plot_calls = [call for call in mock_emit.call_args_list
+                              if call[0][0] == 'plot_ready' and call[0][1]['task_id'] == task_id]
+                time.sleep(0.5)
+
+        self.assertEqual(len(plot_calls), 1)  # Plots of earlier tests' tasks may also arrive meanwhile
+        self.assertEqual(plot_calls[0][1].get('room'), task_id)
+
+    def test_socket_started_tasks_join_their_room(self):
+        """Test that tasks started over the socket subscribe the client to the task's events."""
+        task_id = 'room-test'
+        tasks[task_id] = {'filepath': 'test.csv', 'config': {'filename': 'test.csv'}, 'status': 'Pending'}
+        for event in ('process_data', 'start_processing'):
+            with patch('app.join_room') as join, patch('app.Thread'), \
+                    patch('app.socketio.start_background_task'):
+                self.socket_client.emit(event, {'task_id': task_id})
+            join.assert_called_once_with(task_id)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import pandas as pd
+import numpy as np
+from scipy.stats import chi2_contingency
+from src.association import association_matrix, correlation_ratio, cramers_v, encode
+
+
+def reference_cramers_v(x, y):
+    """Bias-corrected Cramér's V from a pandas crosstab and scipy's chi-squared."""
+    table = pd.crosstab(x, y)
+    n = table.to_numpy().sum()
+    chi2 = chi2_contingency(table, correction=False)[0]
+    r, k = table.shape
+    phi2 = max(0.0, chi2 / n - (k - 1) * (r - 1) / (n - 1))
+    r_corrected = r - (r - 1) ** 2 / (n - 1)
+    k_corrected = k - (k - 1) ** 2 / (n - 1)
+    return np.sqrt(phi2 / min(k_corrected - 1, r_corrected - 1))
+
+
+def reference_correlation_ratio(categories, values):
+    frame = pd.DataFrame({'category': categories, 'value': values}).dropna()
+    groups = frame.groupby('category')['value']
+    between = (groups.count() * (groups.mean() - frame['value'].mean()) ** 2).sum()
+    total = ((frame['value'] - frame['value'].mean()) ** 2).sum()
+    return np.sqrt(between / total)
+
+
+class TestAssociation(unittest.TestCase):
+    def setUp(self):
+        """Set up categorical columns related to each other and to price."""
+        rng = np.random.default_rng(3)
+        n = 3000
+        region = rng.choice(['North', 'South', 'East', 'West'], n)
+        suburb = np.where(rng.random(n) < 0.8, np.char.add(region, rng.choice(['1', '2'], n)),
+                          rng.choice(['North1', 'South2', 'Other'], n))
+        self.test_data = pd.DataFrame({
+            'Region': region,
+            'Suburb': suburb,
+            'Type': rng.choice(['h', 'u', 't'], n),
+            'Address': [f'{i} Some St' for i in range(n)],
+            'Price': np.where(region == 'North', 2.0, 1.0) * 1e6 + rng.normal(0, 2e5, n),
+            'Noise': rng.normal(size=n)
+        })
+        self.test_data.loc[rng.random(n) < 0.1, 'Suburb'] = None
+        self.test_data.loc[rng.random(n) < 0.1, 'Price'] = np.nan
+
+    def test_matches_reference(self):
+        """Test both measures against crosstab/chi-squared and groupby formulations."""
+        for a, b in (('Region', 'Suburb'), ('Region', 'Type'), ('Suburb', 'Type')):
+            with self.subTest(pair=(a, b)):
+                x, y = self.test_data[a], self.test_data[b]
+                shared = x.notna() & y.notna()
+                expected = reference_cramers_v(x[shared], y[shared])
+                self.assertAlmostEqual(cramers_v(*encode(x), *encode(y)), expected, places=10)
+
+        for column in ('Price', 'Noise'):
+            with self.subTest(column=column):
+                values = self.test_data[column].to_numpy(dtype=float)
+                expected = reference_correlation_ratio(self.test_data['Region'], values)
+                self.assertAlmostEqual(correlation_ratio(*encode(self.test_data['Region']), values), expected, places=10)
+
+    def test_association_matrix(self):
+        """Test the matrix layout, strong pairs and the cardinality cap, serial and parallel."""
+        serial = association_matrix(self.test_data, settings={'n_jobs': 1})
+        parallel = association_matrix(self.test_data, settings={'n_jobs': 2, 'parallel_min_work': 0})
+        self.assertEqual(serial, parallel)
+
+        self.assertEqual(serial['skipped_columns'], {'Address': len(self.test_data)})
+        self.assertEqual(set(serial['cramers_v']), {'Region', 'Suburb', 'Type'})
+        self.assertEqual(serial['cramers_v']['Region']['Region'], 1.0)
+        self.assertGreater(serial['cramers_v']['Region']['Suburb'], 0.5)
+        self.assertLess(serial['cramers_v']['Region']['Type'], 0.1)
+        self.assertGreater(serial['correlation_ratio']['Region']['Price'], 0.8)
+        self.assertLess(serial['correlation_ratio']['Region']['Noise'], 0.1)
+
+        strong = serial['strong_associations']
+        self.assertEqual([item['association'] for item in strong],
+                         sorted((item['association'] for item in strong), reverse=True))
+        self.assertIn(('Region', 'Price', 'correlation_ratio'),
+                      [(item['column1'], item['column2'], item['measure']) for item in strong])
+
+    def test_degenerate_columns(self):
+        """A constant column or constant numeric column has no defined association."""
+        data = pd.DataFrame({'a': ['x'] * 10, 'b': ['p', 'q'] * 5, 'v': 1.0})
+        result = association_matrix(data)
+        self.assertTrue(np.isnan(result['cramers_v']['a']['b']))
+        self.assertTrue(np.isnan(result['correlation_ratio']['b']['v']))
+        self.assertEqual(result['strong_associations'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src.categorical_profile import CategoricalProfiler, CategoricalSketch, categorical_columns, to_arrow_strings
+from src.validation import DataValidation
+
+def exact_entropy(series):
+    probabilities = series.value_counts(normalize=True).to_numpy()
+    return float(-(probabilities * np.log2(probabilities)).sum())
+
+class TestCategoricalProfiler(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        rng = np.random.default_rng(42)
+        n = 20000
+        city = rng.choice(['Melbourne', 'Sydney', 'Perth', None], n, p=[0.5, 0.3, 0.15, 0.05])
+        self.test_data = pd.DataFrame({
+            'city': city,
+            'code': pd.Series(rng.zipf(1.5, n)).astype(str),
+            'kind': pd.Categorical(rng.choice(['h', 'u'], n)),
+            'flag': rng.random(n) > 0.5,
+            'amount': rng.normal(0, 1, n)
+        })
+        self.settings = {'chunk_rows': 3000, 'top_k': 10, 'sample_size': 500}
+
+    def test_low_cardinality_is_exact(self):
+        """Test exact counts, lengths and entropy for columns under the sample size."""
+        profile = CategoricalProfiler(self.settings).profile(self.test_data)
+        city = self.test_data['city']
+
+        self.assertEqual(set(profile), {'city', 'code', 'kind', 'flag'})
+        self.assertEqual(profile['city']['missing'], int(city.isna().sum()))
+        self.assertEqual(profile['city']['distinct_count'], {'estimate': 3.0, 'error_bound': 0.0})
+        expected_top = city.value_counts()
+        self.assertEqual([(entry['value'], entry['count']) for entry in profile['city']['top_values']],
+                         list(expected_top.items()))
+        self.assertAlmostEqual(profile['city']['entropy']['estimate'], exact_entropy(city))
+        self.assertTrue(profile['city']['entropy']['exact'])
+
+        lengths = city.dropna().str.len()
+        self.assertEqual(profile['city']['string_length']['min'], lengths.min())
+        self.assertEqual(profile['city']['string_length']['max'], lengths.max())
+        self.assertAlmostEqual(profile['city']['string_length']['mean'], lengths.mean())
+        self.assertAlmostEqual(profile['city']['string_length']['std'], lengths.std(ddof=0))
+        self.assertEqual(profile['kind']['distinct_count']['estimate'], 2.0)
+
+    def test_high_cardinality_within_bounds(self):
+        """Test sketch estimates against exact values for a long-tailed column."""
+        profile = CategoricalProfiler(self.settings).profile(self.test_data)['code']
+        code = self.test_data['code']
+
+        self.assertFalse(profile['entropy']['exact'])
+        distinct = profile['distinct_count']
+        self.assertLessEqual(abs(distinct['estimate'] - code.nunique()), distinct['error_bound'])
+        # The distinct sample holds about half of the values
+        self.assertAlmostEqual(profile['entropy']['estimate'], exact_entropy(code), delta=0.1 * exact_entropy(code))
+
+        expected = code.value_counts()
+        top = profile['top_values'][0]
+        self.assertEqual(top['value'], expected.index[0])
+        self.assertLessEqual(top['count'], expected.iloc[0])
+        self.assertGreaterEqual(top['count'] + top['error_bound'], expected.iloc[0])
+
+    def test_merge_matches_single_pass(self):
+        """Test that merging sketches of two halves equals one sketch of the whole."""
+        code = self.test_data['code']
+        whole = CategoricalSketch(top_k=10, sample_size=500).update(to_arrow_strings(code)).result()
+        first = CategoricalSketch(top_k=10, sample_size=500).update(to_arrow_strings(code[:7000]))
+        second = CategoricalSketch(top_k=10, sample_size=500).update(to_arrow_strings(code[7000:]))
+        merged = first.merge(second).result()
+
+        self.assertEqual(merged['count'], whole['count'])
+        self.assertEqual(merged['string_length'], whole['string_length'])
+        self.assertAlmostEqual(merged['distinct_count']['estimate'], whole['distinct_count']['estimate'])
+        self.assertAlmostEqual(merged['entropy']['estimate'], whole['entropy']['estimate'], delta=0.05)
+
+    def test_mixed_objects(self):
+        """Test that mixed Python objects are profiled by their string form."""
+        mixed = pd.Series(['a', 1, 2.5, None, 'a'], dtype=object)
+        self.assertEqual(to_arrow_strings(mixed).to_pylist(), ['a', '1', '2.5', None, 'a'])
+        self.assertEqual(categorical_columns(self.test_data), ['city', 'code', 'kind', 'flag'])
+
+    def test_validation_results(self):
+        """Test that both validation modes report the categorical profile."""
+        exact = DataValidation(mode='exact').validate_data(self.test_data)
+        approx = DataValidation(mode='approximate').validate_data(self.test_data)
+
+        self.assertEqual(exact['advanced_validation']['categorical_profile']['city']['distinct_count']['estimate'], 3.0)
+        self.assertIn('city', approx['advanced_validation']['categorical_profile'])
+        self.assertEqual(approx['advanced_validation']['categorical_top_k']['city'][0]['value'], 'Melbourne')
+
+if __name__ == '__main__':
+    unittest.main()
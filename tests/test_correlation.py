@@ -2,7 +2,10 @@ import unittest
 import pandas as pd
 import numpy as np
 import os
-from src.correlation import CorrelationAnalyzer
+import tempfile
+from unittest.mock import patch
+from src.correlation import CorrelationAccumulator, CorrelationAnalyzer
+from src.feature_importance import target_importance
 
 class TestCorrelationAnalyzer(unittest.TestCase):
     def setUp(self):
@@ -95,6 +98,29 @@ class TestCorrelationAnalyzer(unittest.TestCase):
         # Check number of top features
         self.assertLessEqual(len(results['top_features']), 5)
 
+    def test_feature_importance_categorical(self):
+        """Test importance for a categorical target and for categorical features."""
+        results = self.correlation.get_feature_importance(self.test_data, 'categorical')
+        self.assertEqual(results['target_type'], 'categorical')
+        self.assertEqual(results['measures']['x'], 'correlation_ratio')
+        self.assertGreater(results['feature_importance']['x'], 0.8)  # x splits cleanly at the A/B boundary
+        self.assertEqual(set(results['top_features'][:2]), {'x', 'y'})
+        self.assertGreater(results['mutual_information']['x'], results['mutual_information']['random'])
+
+        results = self.correlation.get_feature_importance(self.test_data, 'y')
+        self.assertEqual(results['measures'], {'x': 'pearson', 'z': 'pearson', 'random': 'pearson',
+                                               'categorical': 'correlation_ratio'})
+        self.assertEqual(set(results['mutual_information']), {'x', 'z', 'random', 'categorical'})
+
+    def test_feature_importance_cached(self):
+        """Test that repeated requests for a dataset and target reuse the result."""
+        with patch('src.correlation.target_importance', wraps=target_importance) as compute:
+            first = self.correlation.get_feature_importance(self.test_data, 'z')
+            self.assertIs(self.correlation.get_feature_importance(self.test_data.copy(), 'z'), first)
+            self.correlation.get_feature_importance(self.test_data, 'x')
+            self.correlation.get_feature_importance(self.test_data, 'z', method='spearman')
+        self.assertEqual(compute.call_count, 3)
+
     def test_invalid_target_column(self):
         """Test feature importance with invalid target column."""
         with self.assertRaises(ValueError):
@@ -154,5 +180,57 @@ class TestCorrelationAnalyzer(unittest.TestCase):
             self.assertIn(corr['column1'], self.test_data.columns)
             self.assertIn(corr['column2'], self.test_data.columns)
 
+
+class TestCorrelationAccumulator(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        x = rng.normal(1000, 5, 600)
+        self.data = pd.DataFrame({
+            'x': x,
+            'y': x * 0.5 + rng.normal(0, 2, 600),
+            'z': rng.normal(-3, 1, 600),
+            'label': ['a', 'b', 'c'] * 200
+        })
+        self.data.loc[rng.random(600) < 0.1, 'y'] = np.nan
+        self.data.loc[rng.random(600) < 0.05, 'z'] = np.nan
+        self.expected = self.data[['x', 'y', 'z']].corr()
+
+    def test_chunks_match_full_frame(self):
+        """Accumulating chunks gives the pairwise-complete matrix of the whole frame."""
+        chunks = (self.data.iloc[start:start + 64] for start in range(0, 600, 64))
+        result = CorrelationAccumulator.from_chunks(chunks).result()
+        self.assertEqual(list(result.columns), ['x', 'y', 'z'])
+        np.testing.assert_allclose(result.to_numpy(), self.expected.to_numpy(), atol=1e-9)
+
+    def test_merge_partial_states(self):
+        """States built on separate parts with different shifts merge to the full result."""
+        first = CorrelationAccumulator().update(self.data.iloc[:200])
+        second = CorrelationAccumulator().update(self.data.iloc[200:])
+        merged = CorrelationAccumulator().merge(first).merge(second)
+        self.assertEqual(merged.rows, 600)
+        np.testing.assert_allclose(merged.result().to_numpy(), self.expected.to_numpy(), atol=1e-9)
+
+    def test_merge_adds_new_columns(self):
+        """Files with different columns merge on the union of their columns."""
+        first = CorrelationAccumulator().update(self.data[['x', 'y']].iloc[:300])
+        second = CorrelationAccumulator().update(self.data[['x', 'y', 'z']].iloc[300:])
+        result = first.merge(second).result()
+
+        combined = pd.concat([self.data[['x', 'y']].iloc[:300], self.data[['x', 'y', 'z']].iloc[300:]])
+        np.testing.assert_allclose(result.to_numpy(), combined.corr().to_numpy(), atol=1e-9)
+
+    def test_save_and_update(self):
+        """A saved state picks up appended rows without the old ones."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'state.npz')
+            CorrelationAccumulator().update(self.data.iloc[:400]).save(path)
+            result = CorrelationAccumulator.load(path).update(self.data.iloc[400:]).result()
+        np.testing.assert_allclose(result.to_numpy(), self.expected.to_numpy(), atol=1e-9)
+
+    def test_empty(self):
+        """An accumulator without rows reports undefined correlations."""
+        result = CorrelationAccumulator(['x', 'y']).result()
+        self.assertTrue(result.isna().all().all())
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import pandas as pd
+import numpy as np
+from scipy import stats
+from src.correlation_engine import (
+    benjamini_hochberg, correlation_matrix, correlation_significance, correlation_vector, pairwise_counts, tie_sums
+)
+from src.correlation import CorrelationAnalyzer
+
+class TestCorrelationEngine(unittest.TestCase):
+    def setUp(self):
+        """Set up columns with ties, missing values and degenerate cases."""
+        rng = np.random.default_rng(42)
+        n = 2000
+        self.test_data = pd.DataFrame({
+            'ties': rng.integers(0, 5, n).astype(float),
+            'normal': rng.normal(size=n),
+            'skewed': rng.lognormal(size=n),
+            'constant': 1.0,
+            'sparse': rng.integers(0, 3, n).astype(float)
+        })
+        self.test_data.loc[rng.random(n) < 0.1, 'normal'] = np.nan
+        self.test_data.loc[rng.random(n) < 0.5, 'sparse'] = np.nan
+        self.test_data['single'] = np.nan
+        self.test_data.loc[0, 'single'] = 1.0
+
+    def test_matches_pandas(self):
+        """Test both rank methods against DataFrame.corr, serial and parallel."""
+        for method in ('spearman', 'kendall'):
+            expected = self.test_data.corr(method=method)
+            for settings in ({'n_jobs': 1}, {'n_jobs': 2, 'parallel_min_work': 0}):
+                with self.subTest(method=method, settings=settings):
+                    result = correlation_matrix(self.test_data, method, settings)
+                    pd.testing.assert_frame_equal(result, expected, rtol=0, atol=1e-12)
+
+        with self.assertRaises(ValueError):
+            correlation_matrix(self.test_data, 'distance')
+
+    def test_pearson_kernel_matches_pandas(self):
+        """Test the blockwise pairwise-complete kernel in both precisions."""
+        rng = np.random.default_rng(7)
+        values = rng.normal(size=(5000, 12)) * rng.uniform(1, 1e4, 12) + rng.uniform(-1e6, 1e6, 12)
+        values[rng.random(values.shape) < 0.2] = np.nan
+        wide = pd.concat([pd.DataFrame(values).add_prefix('f'), self.test_data], axis=1)
+        expected = wide.corr()
+
+        for block_bytes in (1 << 12, 1 << 28):  # Many row blocks, then one
+            result = correlation_matrix(wide, 'pearson', {'block_bytes': block_bytes})
+            pd.testing.assert_frame_equal(result, expected, rtol=0, atol=1e-9)
+        single = correlation_matrix(wide, 'pearson', {'dtype': 'float32'})
+        pd.testing.assert_frame_equal(single, expected, rtol=0, atol=1e-5)
+
+    def test_vector_matches_matrix_column(self):
+        """Test that the target-only vector equals the target's column of the full matrix."""
+        features = self.test_data.drop(columns='normal')
+        for method in ('pearson', 'spearman', 'kendall'):
+            for settings in ({'n_jobs': 1, 'block_bytes': 1 << 12}, {'n_jobs': 2, 'parallel_min_work': 0}):
+                with self.subTest(method=method, settings=settings):
+                    expected = self.test_data.corr(method=method)['normal'].drop('normal')
+                    result = correlation_vector(features, self.test_data['normal'], method, settings)
+                    pd.testing.assert_series_equal(result, expected, rtol=0, atol=1e-9, check_names=False)
+
+    def test_significance_matches_scipy(self):
+        """Test vectorized p-values against scipy's per-pair tests on pairwise-complete rows."""
+        data = self.test_data[['ties', 'normal', 'skewed', 'sparse']]
+        counts = pairwise_counts(data.to_numpy())
+        tests = {'pearson': stats.pearsonr, 'spearman': stats.spearmanr, 'kendall': stats.kendalltau}
+        for method, test in tests.items():
+            with self.subTest(method=method):
+                matrix = correlation_matrix(data, method)
+                ties = tie_sums(data.to_numpy()) if method == 'kendall' else None
+                pvalues, qvalues = correlation_significance(matrix.to_numpy(), counts, method, ties)
+                for i, a in enumerate(data.columns):
+                    for j, b in enumerate(data.columns[i + 1:], start=i + 1):
+                        shared = data[[a, b]].dropna()
+                        self.assertEqual(counts[i, j], len(shared))
+                        expected = test(shared[a], shared[b]).pvalue
+                        self.assertAlmostEqual(pvalues[i, j], expected, delta=1e-8 * expected + 1e-12)
+                self.assertTrue(np.isnan(np.diag(pvalues)).all())
+                np.testing.assert_array_equal(qvalues, qvalues.T)
+
+    def test_benjamini_hochberg(self):
+        """Test q-values against scipy and that missing p-values are not counted as tests."""
+        pvalues = np.random.default_rng(1).uniform(size=500) ** 3
+        np.testing.assert_allclose(benjamini_hochberg(pvalues), stats.false_discovery_control(pvalues))
+        with_missing = np.r_[pvalues[:10], np.nan]
+        np.testing.assert_allclose(benjamini_hochberg(with_missing)[:10], stats.false_discovery_control(pvalues[:10]))
+        self.assertTrue(np.isnan(benjamini_hochberg(with_missing)[10]))
+
+    def test_analyze_requires_significance(self):
+        """Test that strong but insignificant pairs on a tiny sample are not reported as high."""
+        rng = np.random.default_rng(11)
+        small = pd.DataFrame(rng.normal(size=(6, 12))).add_prefix('c')
+        small['twin'] = small['c0'] + rng.normal(0, 1e-3, 6)
+        analyzer = CorrelationAnalyzer()
+
+        results = analyzer.analyze(small)
+        self.assertTrue(all(item['q_value'] <= 0.05 for item in results['high_correlations']))
+        self.assertIn(('c0', 'twin'), [(item['column1'], item['column2']) for item in results['high_correlations']])
+        self.assertGreater(results['significance']['strong_but_not_significant'], 0)
+        self.assertEqual(results['significance']['tested_pairs'], 13 * 12 // 2)
+
+        analyzer.correlation_settings = {**analyzer.correlation_settings, 'alpha': None}
+        unfiltered = analyzer.analyze(small)
+        self.assertNotIn('significance', unfiltered)
+        self.assertGreater(len(unfiltered['high_correlations']), len(results['high_correlations']))
+
+    def test_analyze_with_rank_method(self):
+        """Test that a monotonic but skewed relation is perfectly rank-correlated."""
+        rng = np.random.default_rng(0)
+        area = rng.uniform(50, 300, 500)
+        df = pd.DataFrame({'area': area, 'price': np.exp(area / 20), 'noise': rng.normal(size=500)})
+        analyzer = CorrelationAnalyzer()
+
+        pearson = analyzer.analyze(df)
+        spearman = analyzer.analyze(df, method='spearman')
+        self.assertEqual(spearman['method'], 'spearman')
+        self.assertLess(pearson['top_correlations'][0]['correlation'], 0.9)
+        self.assertAlmostEqual(spearman['top_correlations'][0]['correlation'], 1.0)
+        with self.assertRaises(ValueError):
+            analyzer.analyze(df, method='distance')
+
+if __name__ == '__main__':
+    unittest.main()
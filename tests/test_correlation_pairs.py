@@ -0,0 +1,41 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src.correlation_pairs import correlated_pairs, top_pairs
+
+def all_pairs(matrix):
+    """Every upper-triangle pair, the way the loops used to build them."""
+    columns = matrix.columns
+    return [(columns[i], columns[j], matrix.iloc[i, j])
+            for i in range(len(columns)) for j in range(i + 1, len(columns))]
+
+class TestCorrelationPairs(unittest.TestCase):
+    def setUp(self):
+        """Set up a matrix with ties and undefined correlations."""
+        rng = np.random.default_rng(42)
+        values = np.round(rng.uniform(-1, 1, (30, 30)), 1)  # Rounded so many pairs tie
+        values = (values + values.T) / 2
+        np.fill_diagonal(values, 1.0)
+        values[4, :] = values[:, 4] = np.nan
+        columns = [f"c{i}" for i in range(30)]
+        self.matrix = pd.DataFrame(values, index=columns, columns=columns)
+        self.pairs = [pair for pair in all_pairs(self.matrix) if not np.isnan(pair[2])]
+
+    def test_top_pairs_match_stable_sort(self):
+        """Test top-k against a stable sort of every pair."""
+        expected = sorted(self.pairs, key=lambda pair: abs(pair[2]), reverse=True)
+        for k in (1, 5, 17, len(self.pairs), len(self.pairs) + 10):
+            self.assertEqual(top_pairs(self.matrix, k), expected[:k])
+        self.assertEqual(top_pairs(self.matrix, 0), [])
+
+    def test_threshold_pairs(self):
+        """Test thresholding, strictness and ordering."""
+        self.assertEqual(correlated_pairs(self.matrix, 0.5, sort=False),
+                         [pair for pair in self.pairs if abs(pair[2]) >= 0.5])
+        self.assertEqual(correlated_pairs(self.matrix, 0.5, strict=True),
+                         sorted([pair for pair in self.pairs if abs(pair[2]) > 0.5],
+                                key=lambda pair: abs(pair[2]), reverse=True))
+        self.assertEqual(correlated_pairs(self.matrix, 2.0), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src.distribution import DistributionAnalyzer
+
+class TestDistributionAnalyzer(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        self.analyzer = DistributionAnalyzer({'histogram_bins': 10})
+        rng = np.random.default_rng(42)
+
+        self.test_data = pd.DataFrame({
+            'normal': rng.normal(0, 1, 200),
+            'skewed': rng.exponential(2, 200),
+            'constant': [5.0] * 200,
+            'category': ['A', 'B'] * 100
+        })
+
+    def test_summary_statistics(self):
+        """Test that summary statistics match pandas."""
+        results = self.analyzer.analyze(self.test_data)
+
+        self.assertNotIn('category', results)
+        self.assertAlmostEqual(results['normal']['mean'], self.test_data['normal'].mean())
+        self.assertAlmostEqual(results['skewed']['skewness'], self.test_data['skewed'].skew())
+        self.assertIn('shapiro_wilk', results['normal']['normality_tests'])
+        self.assertIn('zero variance', results['constant']['normality_tests'])
+
+    def test_histograms_match_numpy(self):
+        """Test vectorized histograms against np.histogram."""
+        results = self.analyzer.analyze(self.test_data)
+
+        for col in ['normal', 'skewed']:
+            counts, edges = np.histogram(self.test_data[col], bins=10)
+            np.testing.assert_array_equal(results[col]['histogram']['counts'], counts)
+            np.testing.assert_allclose(results[col]['histogram']['bin_edges'], edges)
+
+            kde = results[col]['kde']
+            self.assertEqual(len(kde['grid']), 10)
+            self.assertGreater(kde['bandwidth'], 0)
+
+    def test_large_columns_are_subsampled(self):
+        """Test that expensive tests run on a seeded subsample of large columns."""
+        large = pd.DataFrame({'x': np.random.default_rng(0).normal(size=20000)})
+        first = self.analyzer.analyze(large)['x']['normality_tests']
+        second = self.analyzer.analyze(large)['x']['normality_tests']
+
+        self.assertEqual(first['shapiro_wilk']['sample_size'], 5000)
+        self.assertEqual(first['shapiro_wilk']['sampled'], 1)
+        self.assertEqual(first['dagostino_pearson']['sample_size'], 20000)
+        self.assertEqual(first['shapiro_wilk']['statistic'], second['shapiro_wilk']['statistic'])
+
+    def test_time_budget_skips_tests(self):
+        """Test graceful degradation once the time budget is spent."""
+        results = self.analyzer.analyze(self.test_data, time_budget=-1)
+
+        self.assertIn('time budget', results['normal']['normality_tests'])
+        self.assertIn('histogram', results['normal'])  # Cheap summaries are still reported
+
+    def test_too_few_samples(self):
+        """Test that columns with fewer than 3 values are skipped."""
+        results = self.analyzer.analyze(pd.DataFrame({'x': [1.0, np.nan, 2.0]}))
+        self.assertEqual(results, {})
+
+if __name__ == '__main__':
+    unittest.main()
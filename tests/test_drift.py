@@ -0,0 +1,116 @@
+import json
+import tempfile
+import shutil
+import unittest
+import pandas as pd
+import numpy as np
+from scipy import stats
+from src.drift import DatasetProfiler, DriftDetector, ProfileStore, dataset_name
+
+class TestDriftDetection(unittest.TestCase):
+    def setUp(self):
+        """Set up two snapshots of the same feed."""
+        rng = np.random.default_rng(42)
+        n = 20000
+        self.reference_df = pd.DataFrame({
+            'amount': rng.normal(100, 10, n),
+            'stable': rng.exponential(5, n),
+            'city': rng.choice(['Melbourne', 'Sydney', 'Perth'], n, p=[0.5, 0.3, 0.2]),
+            'day': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 30, n), unit='D')
+        })
+        self.current_df = pd.DataFrame({
+            'amount': rng.normal(103, 12, n),
+            'stable': rng.exponential(5, n),
+            'city': rng.choice(['Melbourne', 'Sydney', 'Perth'], n, p=[0.2, 0.3, 0.5]),
+            'day': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 30, n), unit='D'),
+            'new_column': 1
+        })
+        self.current_df.loc[:3000, 'stable'] = np.nan
+        profiler = DatasetProfiler({'chunk_rows': 7000})
+        self.reference = profiler.profile(self.reference_df, dataset='feed')
+        self.current = profiler.profile(self.current_df, dataset='feed')
+
+    def test_profile_is_compact_and_serializable(self):
+        """Test the profile layout and size."""
+        self.assertEqual(self.reference['columns']['amount']['kind'], 'numeric')
+        self.assertEqual(self.reference['columns']['day']['kind'], 'datetime')
+        self.assertEqual(self.reference['columns']['city']['kind'], 'categorical')
+        self.assertAlmostEqual(sum(self.reference['columns']['amount']['histogram']['counts']), 20000, delta=20)
+        self.assertLess(len(json.dumps(self.reference)), 50000)
+
+    def test_metrics_match_raw_data(self):
+        """Test sketch-based KS and categorical PSI against the raw data."""
+        result = DriftDetector().compare(self.reference, self.current)
+        amount = result['columns']['amount']
+
+        exact_ks = stats.ks_2samp(self.reference_df['amount'], self.current_df['amount']).statistic
+        self.assertAlmostEqual(amount['ks'], exact_ks, delta=0.01)
+
+        p = self.reference_df['city'].value_counts(normalize=True)
+        q = self.current_df['city'].value_counts(normalize=True)[p.index]
+        self.assertAlmostEqual(result['columns']['city']['psi'], float(((q - p) * np.log(q / p)).sum()))
+        self.assertIsNone(result['columns']['city']['ks'])
+
+    def test_drifted_columns(self):
+        """Test which columns are flagged and why."""
+        result = DriftDetector().compare(self.reference, self.current)
+
+        self.assertEqual(sorted(result['drifted_columns']), ['amount', 'city', 'stable'])
+        self.assertAlmostEqual(result['columns']['stable']['null_rate_change'], 3001 / 20000)
+        self.assertLess(result['columns']['stable']['psi'], 0.05)  # Flagged for nulls, not the distribution
+        self.assertLess(result['columns']['day']['ks'], 0.05)
+        self.assertEqual(result['added_columns'], ['new_column'])
+
+        identical = DriftDetector().compare(self.reference, self.reference)
+        self.assertEqual(identical['drifted_columns'], [])
+        self.assertAlmostEqual(identical['columns']['amount']['js'], 0.0)
+
+    def test_high_cardinality_samples_not_drifted(self):
+        """Test that samples of one high-cardinality distribution with different top lists are not flagged."""
+        rng = np.random.default_rng(7)
+        categories = np.array([f"c{i}" for i in range(300)])
+        profiler = DatasetProfiler()
+        first = profiler.profile(pd.DataFrame({'code': rng.choice(categories, 30000)}))
+        second = profiler.profile(pd.DataFrame({'code': rng.choice(categories, 30000)}))
+        top = lambda profile: {entry['value'] for entry in profile['columns']['code']['top_values']}
+        self.assertNotEqual(top(first), top(second))
+
+        result = DriftDetector().compare(first, second)
+        self.assertEqual(result['drifted_columns'], [])
+        self.assertLess(result['columns']['code']['psi'], 0.05)
+
+    def test_store_finds_previous_upload(self):
+        """Test that the store returns the latest earlier profile of the same dataset."""
+        with tempfile.TemporaryDirectory() as directory:
+            store = ProfileStore(directory)
+            store.save('t1', {**self.reference, 'created_at': '2024-01-01T00:00:00'})
+            store.save('t2', {**self.reference, 'created_at': '2024-01-02T00:00:00'})
+            store.save('other', {**self.reference, 'dataset': 'other', 'created_at': '2024-01-02T12:00:00'})
+            store.save('t3', {**self.current, 'created_at': '2024-01-03T00:00:00'})
+
+            self.assertEqual(store.previous(store.load('t3'))['task_id'], 't2')
+            self.assertIsNone(store.previous(store.load('t1')))
+            self.assertIsNone(store.load('missing'))
+            with self.assertRaises(ValueError):
+                store.load('../config')
+
+    def test_store_keeps_latest_profiles_per_dataset(self):
+        """Test that old profiles are deleted and existing ones are indexed on start."""
+        with tempfile.TemporaryDirectory() as directory:
+            store = ProfileStore(directory, max_per_dataset=2)
+            for day in range(1, 5):
+                store.save(f't{day}', {**self.reference, 'created_at': f'2024-01-0{day}T00:00:00'})
+            store.save('other', {**self.reference, 'dataset': 'other', 'created_at': '2024-01-01T00:00:00'})
+
+            self.assertIsNone(store.load('t2'))
+            self.assertIsNotNone(store.load('other'))
+            self.assertEqual(store.previous(store.load('t4'))['task_id'], 't3')
+            self.assertIsNone(store.previous(store.load('t3')))
+
+            shutil.rmtree(store.index_directory)  # Profiles saved before the index existed
+            self.assertEqual(ProfileStore(directory).previous(store.load('t4'))['task_id'], 't3')
+
+        self.assertEqual(dataset_name('/data/uploads/sales_2.csv'), 'sales')
+
+if __name__ == '__main__':
+    unittest.main()
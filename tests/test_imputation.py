@@ -0,0 +1,130 @@
+import os
+import json
+import tempfile
+import unittest
+import pandas as pd
+import numpy as np
+from src.imputation import ImputationPlanner, KNNImputation, IterativeImputation
+
+class TestImputationPlanner(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        rng = np.random.default_rng(42)
+        symmetric = rng.normal(10, 1, 200)
+        skewed = rng.exponential(2, 200)
+        symmetric[::10] = np.nan
+        skewed[::20] = np.nan
+
+        self.test_data = pd.DataFrame({
+            'symmetric': symmetric,
+            'skewed': skewed,
+            'category': (['A', 'B', 'B', None] * 50),
+            'empty_text': pd.Series([None] * 200, dtype=object)
+        })
+        self.planner = ImputationPlanner()
+
+    def test_plan_matches_column_statistics(self):
+        """Test that the plan records the same statistics as per-column pandas calls."""
+        plan = self.planner.plan(self.test_data)
+        columns = plan['columns']
+
+        self.assertEqual(columns['symmetric']['method'], 'mean')
+        self.assertAlmostEqual(columns['symmetric']['value'], self.test_data['symmetric'].mean())
+        self.assertEqual(columns['skewed']['method'], 'median')
+        self.assertAlmostEqual(columns['skewed']['value'], self.test_data['skewed'].median())
+        self.assertEqual(columns['category'], {'method': 'mode', 'value': 'B', 'dtype': 'object'})
+        self.assertEqual(columns['empty_text']['value'], 'Unknown')
+
+    def test_apply_fills_without_modifying_input(self):
+        """Test that applying a plan fills all columns and leaves the input untouched."""
+        original = self.test_data.copy()
+        plan = self.planner.plan(self.test_data, method='median')
+        filled = self.planner.apply(self.test_data, plan)
+
+        self.assertFalse(filled.isnull().any().any())
+        self.assertEqual(filled['symmetric'].iloc[0], self.test_data['symmetric'].median())
+        pd.testing.assert_frame_equal(self.test_data, original)
+
+        self.assertIsNone(self.planner.apply(self.test_data, plan, inplace=True))
+        self.assertFalse(self.test_data.isnull().any().any())
+
+    def test_plan_reuse_after_round_trip(self):
+        """Test that a saved plan is reused on a later chunk without recomputation."""
+        plan = self.planner.plan(self.test_data)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'plan.json')
+            self.planner.save(plan, path)
+            loaded = self.planner.load(path)
+        self.assertEqual(json.loads(json.dumps(plan)), loaded)
+
+        chunk = pd.DataFrame({'symmetric': [np.nan, 1.0], 'category': [None, 'A'], 'other': [np.nan, 2.0]})
+        filled = self.planner.apply(chunk, loaded)
+
+        self.assertAlmostEqual(filled['symmetric'].iloc[0], plan['columns']['symmetric']['value'])
+        self.assertEqual(filled['category'].iloc[0], 'B')
+        self.assertTrue(np.isnan(filled['other'].iloc[0]))  # Not in the plan
+
+    def test_datetime_values_round_trip(self):
+        """Test that datetime fill values survive JSON serialization."""
+        df = pd.DataFrame({'when': pd.to_datetime(['2024-01-01', None, '2024-01-01', '2024-02-01'])})
+        plan = json.loads(json.dumps(self.planner.plan(df)))
+        filled = self.planner.apply(df, plan)
+
+        self.assertEqual(filled['when'].dtype, df['when'].dtype)
+        self.assertEqual(filled['when'].iloc[1], pd.Timestamp('2024-01-01'))
+
+    def test_unknown_method(self):
+        """Test that an unknown method is rejected."""
+        with self.assertRaises(ValueError):
+            self.planner.plan(self.test_data, method='knn')
+
+class TestModelBasedImputation(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        rng = np.random.default_rng(0)
+        x = rng.normal(0, 1, 2000)
+        self.complete = pd.DataFrame({
+            'x': x,
+            'y': 2 * x + rng.normal(0, 0.1, 2000),
+            'noise': rng.normal(0, 1, 2000),
+            'id': np.arange(2000),
+            'label': ['a', 'b'] * 1000
+        })
+        self.missing = rng.random(2000) < 0.1
+        self.test_data = self.complete.copy()
+        self.test_data.loc[self.missing, 'y'] = np.nan
+
+    def _rmse(self, imputed):
+        errors = imputed.loc[self.missing, 'y'] - self.complete.loc[self.missing, 'y']
+        return float(np.sqrt((errors ** 2).mean()))
+
+    def test_knn_uses_related_features(self):
+        """Test that KNN imputation beats mean imputation on correlated data."""
+        imputed = KNNImputation({'batch_size': 50, 'n_jobs': 1}).impute(self.test_data, columns=['x', 'y'])
+
+        self.assertFalse(imputed['y'].isnull().any())
+        self.assertLess(self._rmse(imputed), 0.25)
+        self.assertEqual(imputed['id'].dtype, np.int64)
+        pd.testing.assert_series_equal(imputed['label'], self.test_data['label'])
+
+    def test_knn_partial_patterns(self):
+        """Test rows with different missing-value patterns, including all features missing."""
+        data = self.test_data[['x', 'y']].copy()
+        data.loc[[0, 1], 'x'] = np.nan
+        data.loc[1, 'y'] = np.nan
+        imputed = KNNImputation({'max_fit_rows': 500}).impute(data)
+
+        self.assertFalse(imputed.isnull().any().any())
+        self.assertAlmostEqual(imputed.loc[1, 'y'], data['y'].dropna().mean(), delta=0.5)
+
+    def test_iterative_imputation(self):
+        """Test chained-equations imputation with early stopping."""
+        backend = IterativeImputation({'max_iter': 20, 'n_nearest_features': 2})
+        imputed = backend.impute(self.test_data, columns=['x', 'y', 'noise'])
+
+        self.assertFalse(imputed['y'].isnull().any())
+        self.assertLess(self._rmse(imputed), 0.25)
+        self.assertLess(backend.n_iter_, 20)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import time
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from PIL import Image
+from src import matrix_tiles
+from src.matrix_tiles import MatrixTiles, cluster_order, pool_strongest
+from src.correlation import CorrelationAnalyzer
+
+
+class TestMatrixTiles(unittest.TestCase):
+    def setUp(self):
+        """Set up a wide frame of shuffled column groups that correlate within each group."""
+        rng = np.random.default_rng(5)
+        n_rows, groups, per_group = 400, 6, 50
+        factors = rng.normal(size=(n_rows, groups))
+        columns = {}
+        for group in range(groups):
+            for member in range(per_group):
+                columns[f"g{group}_{member}"] = factors[:, group] + rng.normal(0, 0.5, n_rows)
+        names = list(columns)
+        rng.shuffle(names)
+        self.data = pd.DataFrame({name: columns[name] for name in names})
+        self.matrix = self.data.corr()
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.tiles = MatrixTiles({'directory': self.directory.name, 'tile_size': 64, 'wide_columns': 100})
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_cluster_order_groups_columns(self):
+        """Test that clustering makes each group of correlated columns contiguous."""
+        ordered = [self.matrix.columns[i].split('_')[0] for i in cluster_order(self.matrix)]
+        changes = sum(1 for a, b in zip(ordered, ordered[1:]) if a != b)
+        self.assertEqual(changes, 5)
+
+    def test_pool_strongest(self):
+        """Test pooling keeps the largest magnitude with its sign and ignores missing values."""
+        block = np.array([[0.1, -0.9, 0.2], [0.5, np.nan, 0.3], [np.nan, np.nan, 0.0]])
+        pooled = pool_strongest(block, 2)
+        self.assertEqual(pooled.shape, (2, 2))
+        np.testing.assert_allclose(pooled[0], [-0.9, 0.3], rtol=1e-6)
+        self.assertTrue(np.isnan(pooled[1, 0]))
+        self.assertEqual(pooled[1, 1], 0.0)
+
+    def test_save_and_tiles(self):
+        """Test storage, level layout, tile images and values, and per-tile caching."""
+        meta = self.tiles.save(self.matrix)
+        self.assertEqual(meta['size'], 300)
+        self.assertEqual(meta['levels'], 4)  # 300 -> 150 -> 75 -> 38 cells per side
+        self.assertEqual(sorted(meta['columns']), sorted(self.matrix.columns))
+        stored = np.load(os.path.join(self.directory.name, f"{meta['key']}.npy"))
+        self.assertEqual(stored.dtype, np.float32)
+        self.assertEqual(self.tiles.save(self.matrix.copy())['key'], meta['key'])
+
+        with Image.open(self.tiles.tile(meta['key'], 3, 0, 0)) as overview:
+            self.assertEqual(overview.size, (38, 38))
+        with Image.open(self.tiles.tile(meta['key'], 0, 4, 2)) as edge:
+            self.assertEqual(edge.size, (64, 44))  # Last row of tiles holds the remaining 44 columns
+
+        with patch('src.matrix_tiles.encode_png', wraps=matrix_tiles.encode_png) as encode:
+            self.tiles.tile(meta['key'], 3, 0, 0)
+            self.tiles.tile(meta['key'], 1, 1, 0)
+        self.assertEqual(encode.call_count, 1)
+
+        values = self.tiles.tile_values(meta['key'], 0, 0, 1)
+        first, second = values['row_labels'][0], values['col_labels'][0]
+        self.assertAlmostEqual(values['values'][0][0], self.matrix.loc[first, second], places=3)
+
+        for level, row, col in ((4, 0, 0), (3, 1, 0), (0, 5, 0)):
+            with self.assertRaises(ValueError):
+                self.tiles.tile(meta['key'], level, row, col)
+        with self.assertRaises(ValueError):
+            self.tiles.tile('../escape', 0, 0, 0)
+        with self.assertRaises(FileNotFoundError):
+            self.tiles.metadata('0' * 32)
+
+    def test_browsing_keeps_matrix_and_files_evicted_together(self):
+        """Test that tile reads refresh the stored matrix and that its two files expire as a pair."""
+        meta = self.tiles.save(self.matrix)
+        self.tiles.tile(meta['key'], 3, 0, 0)
+        stored = [os.path.join(self.directory.name, f"{meta['key']}.{ext}") for ext in ('npy', 'json')]
+        old = time.time() - 30 * 86400
+        for path in stored:
+            os.utime(path, (old, old))
+
+        self.tiles.tile(meta['key'], 3, 0, 0)  # Cached tile
+        self.assertGreater(os.path.getmtime(stored[0]), old)
+        self.assertGreater(os.path.getmtime(stored[1]), old)
+        self.tiles.matrix_cache.collect()
+        self.assertTrue(all(os.path.exists(path) for path in stored))
+
+        os.utime(stored[1], (old, old))  # Only the metadata is stale; the matrix was used recently
+        self.tiles.matrix_cache.collect()
+        self.assertTrue(all(os.path.exists(path) for path in stored))
+
+        os.remove(stored[0])
+        with self.assertRaises(FileNotFoundError):
+            self.tiles.metadata(meta['key'])
+        self.assertFalse(os.path.exists(stored[1]))
+
+    def test_restore_expired_matrix(self):
+        """Test that a matrix removed from the tile cache is restored from a kept copy."""
+        meta = self.tiles.save(self.matrix)
+        with tempfile.TemporaryDirectory() as kept:
+            copies = {}
+            for ext, path in self.tiles.files(meta['key']).items():
+                copies[ext] = os.path.join(kept, f"copy.{ext}")
+                os.replace(path, copies[ext])
+
+            self.assertFalse(self.tiles.restore(meta['key'], {'npy': copies['npy'], 'json': None}))
+            self.assertTrue(self.tiles.restore(meta['key'], copies))
+            self.assertEqual(self.tiles.metadata(meta['key']), meta)
+            self.assertTrue(os.path.exists(self.tiles.tile(meta['key'], 3, 0, 0)))
+            self.assertTrue(self.tiles.restore(meta['key'], {}))  # Still stored: nothing to copy
+
+    def test_concurrent_writes_of_the_same_files(self):
+        """Test that threads storing one matrix or rendering one uncached tile do not collide."""
+        with ThreadPoolExecutor(4) as pool:
+            keys = {meta['key'] for meta in pool.map(lambda _: self.tiles.save(self.matrix), range(4))}
+            self.assertEqual(len(keys), 1)
+            key = keys.pop()
+            for level, row, col in ((0, 0, 0), (0, 1, 2), (1, 0, 1), (2, 0, 0)):
+                paths = list(pool.map(lambda _: self.tiles.tile(key, level, row, col), range(4)))
+                self.assertEqual(len(set(paths)), 1)
+        with Image.open(paths[0]) as overview:
+            self.assertEqual(overview.size, (64, 64))
+        leftovers = [name for _, _, names in os.walk(self.directory.name) for name in names if '.tmp.' in name]
+        self.assertEqual(leftovers, [])
+
+    def test_analyze_wide_data(self):
+        """Test that analysis of a wide frame returns tile metadata instead of the dict and heatmap."""
+        analyzer = CorrelationAnalyzer()
+        analyzer.matrix_tiles = self.tiles
+        with patch('src.correlation.render_heatmap') as render:
+            results = analyzer.analyze(self.data)
+        render.assert_not_called()
+        self.assertEqual(results['correlations'], {})
+        self.assertIsNone(results['correlation_matrix_path'])
+        self.assertEqual(results['matrix_tiles']['size'], 300)
+        self.assertEqual(len(results['top_correlations']), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
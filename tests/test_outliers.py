@@ -0,0 +1,83 @@
+import unittest
+import pandas as pd
+import numpy as np
+from scipy import stats
+from src.outliers import OutlierDetector
+
+class TestOutlierDetector(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        rng = np.random.default_rng(42)
+        normal = rng.normal(0, 1, 500)
+        normal[[10, 200, 450]] = [9.0, -8.0, 12.0]
+        with_missing = rng.normal(50, 5, 500)
+        with_missing[::25] = np.nan
+
+        self.test_data = pd.DataFrame({
+            'normal': normal,
+            'with_missing': with_missing,
+            'skewed': rng.exponential(2, 500),
+            'category': ['A', 'B'] * 250
+        })
+        self.detector = OutlierDetector(n_jobs=2, block_columns=2)
+
+    def test_counts_match_reference(self):
+        """Test vectorized counts against scipy z-scores and pandas quantiles."""
+        summaries, _ = self.detector.detect(self.test_data)
+
+        self.assertNotIn('category', summaries)
+        for col in ['normal', 'with_missing', 'skewed']:
+            series = self.test_data[col]
+            z_expected = int((np.abs(stats.zscore(series.dropna())) > 3).sum())
+            q1, q3 = series.quantile(0.25), series.quantile(0.75)
+            iqr = q3 - q1
+            iqr_expected = int(((series < q1 - 1.5 * iqr) | (series > q3 + 1.5 * iqr)).sum())
+
+            self.assertEqual(summaries[col]['z_score_outliers'], z_expected)
+            self.assertEqual(summaries[col]['iqr_outliers'], iqr_expected)
+            self.assertAlmostEqual(summaries[col]['iqr_bounds'][0], q1 - 1.5 * iqr)
+
+    def test_bitmaps_mark_rows(self):
+        """Test that bitmaps record the flagged rows."""
+        _, bitmaps = self.detector.detect(self.test_data)
+
+        z_rows = bitmaps['normal']['z_score'].rows().tolist()
+        self.assertEqual(z_rows, [10, 200, 450])
+        self.assertTrue({10, 200, 450}.issubset(bitmaps['normal']['mad'].rows().tolist()))
+        self.assertEqual(len(bitmaps['normal']['iqr'].to_mask()), len(self.test_data))
+
+    def test_mad_zero_falls_back_to_mean_deviation(self):
+        """Test that columns where most values equal the median only flag extreme values."""
+        sparse = np.zeros(500)
+        sparse[100:190] = 1.0
+        sparse[5] = 100.0
+        summaries, bitmaps = self.detector.detect(pd.DataFrame({'sparse': sparse, 'constant': np.ones(500)}))
+
+        self.assertEqual(bitmaps['sparse']['mad'].rows().tolist(), [5])
+        self.assertEqual(summaries['constant']['mad_outliers'], 0)
+
+    def test_multivariate_outliers(self):
+        """Test that injected multivariate outliers are detected."""
+        rng = np.random.default_rng(0)
+        x = rng.normal(0, 1, 1000)
+        df = pd.DataFrame({'x': x, 'y': 2 * x + rng.normal(0, 0.1, 1000)})
+        # Each value is ordinary on its own but breaks the x/y relationship
+        df.loc[[5, 500], 'x'] = [1.5, -1.5]
+        df.loc[[5, 500], 'y'] = [-3.0, 3.0]
+        df.loc[7, 'x'] = np.nan
+
+        summaries, bitmaps = self.detector.detect_multivariate(df)
+
+        self.assertEqual(summaries['mahalanobis']['rows_scored'], 999)
+        self.assertTrue({5, 500}.issubset(bitmaps['mahalanobis'].rows().tolist()))
+        self.assertTrue({5, 500}.issubset(bitmaps['isolation_forest'].rows().tolist()))
+        self.assertNotIn(7, bitmaps['mahalanobis'].rows().tolist())
+
+    def test_multivariate_requires_two_columns(self):
+        """Test the message returned when there is nothing to compare."""
+        summaries, bitmaps = self.detector.detect_multivariate(self.test_data[['normal']])
+        self.assertIn('message', summaries)
+        self.assertEqual(bitmaps, {})
+
+if __name__ == '__main__':
+    unittest.main()
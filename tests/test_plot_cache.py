@@ -0,0 +1,129 @@
+import os
+import time
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import numpy as np
+from src.plot_cache import PlotCache
+from src.correlation import CorrelationAnalyzer
+
+class TestPlotCache(unittest.TestCase):
+    def setUp(self):
+        """Set up an empty cache directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = PlotCache({'directory': self.temp_dir.name, 'max_bytes': 2500, 'max_age_days': 1})
+        rng = np.random.default_rng(42)
+        self.test_data = pd.DataFrame(rng.normal(size=(100, 3)), columns=['x', 'y', 'z'])
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name, size, age_seconds):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'wb') as f:
+            f.write(b'0' * size)
+        used = time.time() - age_seconds
+        os.utime(path, (used, used))
+        return path
+
+    def test_key_depends_on_content_and_params(self):
+        """Test that equal matrices share a path and any difference changes it."""
+        matrix = self.test_data.corr()
+        self.assertEqual(self.cache.path('heatmap', matrix), self.cache.path('heatmap', matrix.copy()))
+        self.assertNotEqual(self.cache.key(matrix), self.cache.key(matrix, {'annotate': False}))
+        self.assertNotEqual(self.cache.key(matrix), self.cache.key(matrix.rename(columns={'x': 'w'})))
+        self.assertNotEqual(self.cache.key(matrix), self.cache.key((self.test_data * [1, 1, -1]).corr()))
+
+    def test_collect_by_age_then_lru(self):
+        """Test that expired plots go first, then the least recently used over the size limit."""
+        expired = self.write('a.png', 100, 2 * 86400)
+        oldest = self.write('b.png', 1000, 300)
+        older = self.write('c.png', 1000, 200)
+        newest = self.write('d.png', 1000, 100)
+        in_progress = self.write('e.png.1.tmp.png', 1000, 400)
+
+        self.assertTrue(self.cache.lookup(oldest))  # A hit makes b the most recently used
+        self.assertFalse(self.cache.lookup(os.path.join(self.temp_dir.name, 'missing.png')))
+        stats = self.cache.collect()
+
+        self.assertEqual(stats['removed'], 3)
+        self.assertFalse(os.path.exists(expired))
+        self.assertFalse(os.path.exists(older))
+        self.assertFalse(os.path.exists(newest))
+        self.assertTrue(os.path.exists(oldest))
+        self.assertTrue(os.path.exists(in_progress))
+
+    def test_collect_removes_related_files_together(self):
+        """Test that files sharing a name stem are kept while any of them is in use."""
+        matrix = self.write('m.npy', 1000, 2 * 86400)
+        metadata = self.write('m.json', 100, 100)
+        self.write('n.npy', 1000, 300)
+        self.write('n.json', 100, 2 * 86400)
+        self.assertEqual(self.cache.collect()['removed'], 0)
+        self.assertTrue(os.path.exists(matrix))
+
+        self.write('p.png', 1000, 50)  # Over the size limit: the least recently used pair goes
+        self.assertEqual(self.cache.collect()['removed'], 2)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir.name, 'n.npy')))
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir.name, 'n.json')))
+        self.assertTrue(os.path.exists(metadata))
+
+    def test_analyze_reuses_cached_heatmap(self):
+        """Test that an identical analysis reuses the heatmap instead of drawing it again."""
+        analyzer = CorrelationAnalyzer()
+        analyzer.plot_cache = PlotCache({'directory': self.temp_dir.name})
+
+        def render_heatmap(matrix, path, **params):
+            open(path, 'wb').close()
+            return path
+
+        with patch('src.correlation.render_heatmap', side_effect=render_heatmap) as render:
+            first = analyzer.analyze(self.test_data)
+            second = analyzer.analyze(self.test_data.copy())
+            third = analyzer.analyze(self.test_data + self.test_data[['y', 'z', 'x']].to_numpy())
+
+        self.assertEqual(render.call_count, 2)
+        self.assertEqual(first['correlation_matrix_path'], second['correlation_matrix_path'])
+        self.assertNotEqual(first['correlation_matrix_path'], third['correlation_matrix_path'])
+        self.assertTrue(first['correlation_matrix_path'].startswith(self.temp_dir.name))
+
+    def test_restore_collected_heatmap_of_stored_results(self):
+        """Test that stored results whose heatmap was collected get it redrawn, or lose the path."""
+        analyzer = CorrelationAnalyzer()
+        analyzer.plot_cache = PlotCache({'directory': self.temp_dir.name})
+
+        def render_heatmap(matrix, path, **params):
+            open(path, 'wb').close()
+            return path
+
+        with patch('src.correlation.render_heatmap', side_effect=render_heatmap) as render:
+            stored = analyzer.analyze(self.test_data)
+            path = stored['correlation_matrix_path']
+            analyzer.restore_heatmap(stored)
+            self.assertEqual(render.call_count, 1)  # Still cached
+
+            os.remove(path)
+            analyzer.restore_heatmap(stored)
+            self.assertEqual(render.call_count, 2)
+            self.assertEqual(stored['correlation_matrix_path'], path)
+            self.assertTrue(os.path.exists(path))
+
+        os.remove(path)
+        renderer = MagicMock()
+        renderer.heatmap_params.return_value = {'annotate': True, 'dpi': 100}
+        renderer.submit_heatmap.side_effect = lambda matrix, path: MagicMock(result=lambda: render_heatmap(matrix, path))
+        waited = analyzer.restore_heatmap(dict(stored), renderer=renderer, wait=True)
+        self.assertEqual(waited['correlation_matrix_path'], path)  # Ready on return: no event needed
+        self.assertNotIn('correlation_matrix_status', waited)
+        self.assertTrue(os.path.exists(path))
+
+        renderer.submit_heatmap.side_effect = lambda matrix, path: MagicMock(result=MagicMock(side_effect=TimeoutError()))
+        os.remove(path)
+        self.assertIsNone(analyzer.restore_heatmap(dict(stored), renderer=renderer, wait=True)['correlation_matrix_path'])
+
+        without_matrix = analyzer.restore_heatmap({'correlations': {}, 'correlation_matrix_path': path})
+        self.assertIsNone(without_matrix['correlation_matrix_path'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from threading import Event
+import pandas as pd
+import numpy as np
+from src.plot_renderer import PlotRenderer
+from src.correlation import CorrelationAnalyzer
+
+class TestPlotRenderer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Start one warm worker for all tests."""
+        cls.renderer = PlotRenderer({'workers': 1, 'timeout_seconds': 30})
+        cls.renderer.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.renderer.shutdown()
+
+    def setUp(self):
+        """Set up test cases."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(42)
+        x = rng.normal(0, 1, 200)
+        self.test_data = pd.DataFrame({'x': x, 'y': x + rng.normal(0, 0.1, 200), 'z': rng.normal(0, 1, 200)})
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_renders_in_worker(self):
+        """Test that a queued heatmap is written and reported to the callback."""
+        path = os.path.join(self.temp_dir.name, 'heatmap.png')
+        reported, done = [], Event()
+        future = self.renderer.submit_heatmap(self.test_data.corr(), path,
+                                              callback=lambda *args: (reported.append(args), done.set()))
+
+        self.assertEqual(future.result(timeout=60), path)
+        self.assertGreater(os.path.getsize(path), 0)
+        self.assertTrue(done.wait(10))  # Callbacks run after waiters on the future are released
+        self.assertEqual(reported, [(path, None)])
+
+    def test_timeout_reports_error(self):
+        """Test that a render exceeding the timeout fails without killing the worker."""
+        renderer = PlotRenderer({'workers': 1, 'timeout_seconds': 0.01, 'annotate_max_columns': 100})
+        wide = pd.DataFrame(np.random.default_rng(0).normal(size=(100, 60))).corr()
+        reported, done = [], Event()
+        try:
+            future = renderer.submit_heatmap(wide, os.path.join(self.temp_dir.name, 'wide.png'),
+                                             callback=lambda *args: (reported.append(args), done.set()))
+            with self.assertRaises(TimeoutError):
+                future.result(timeout=60)
+            self.assertTrue(done.wait(10))
+            self.assertIsNone(reported[0][0])
+            self.assertIsInstance(reported[0][1], TimeoutError)
+        finally:
+            renderer.shutdown()
+
+    def test_analyze_attaches_plot_later(self):
+        """Test that correlation results are returned before the heatmap is attached."""
+        done = Event()
+        results = CorrelationAnalyzer().analyze(self.test_data, renderer=self.renderer,
+                                                on_plot=lambda path, error: done.set())
+        self.assertEqual(results['high_correlations'][0]['column1'], 'x')
+        self.assertIn(results['correlation_matrix_status'], ('pending', 'ready'))
+
+        self.assertTrue(done.wait(60))
+        self.assertEqual(results['correlation_matrix_status'], 'ready')
+        self.assertTrue(os.path.exists(results['correlation_matrix_path']))
+        os.remove(results['correlation_matrix_path'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src.range_validation import RangeValidator
+
+class TestRangeValidator(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        rng = np.random.default_rng(42)
+        self.test_data = pd.DataFrame({
+            'value': rng.normal(0, 50, 1000),
+            'score': rng.uniform(0, 5, 1000),
+            'count': rng.integers(-10, 100, 1000),
+            'name': ['a'] * 1000
+        })
+        self.test_data.loc[::7, 'value'] = np.nan
+        self.range_config = {
+            'value': {'min': -30, 'max': 40},
+            'score': {'max': 4},
+            'count': {'min': 0},
+            'name': {'min': 0},
+            'missing': {'min': 0},
+            'unbounded': {}
+        }
+        self.test_data['unbounded'] = 1.0
+
+    def expected_mask(self, column):
+        ranges = self.range_config[column]
+        series = self.test_data[column]
+        mask = pd.Series(False, index=series.index)
+        if ranges.get('min') is not None:
+            mask |= series < ranges['min']
+        if ranges.get('max') is not None:
+            mask |= series > ranges['max']
+        return mask.to_numpy()
+
+    def test_matches_per_column_comparison(self):
+        """Test counts and bitmaps against per-column pandas comparisons."""
+        summary, bitmaps = RangeValidator(self.range_config).validate(self.test_data)
+
+        for column in ['value', 'score', 'count']:
+            expected = self.expected_mask(column)
+            self.assertEqual(summary[column]['out_of_range_count'], int(expected.sum()))
+            np.testing.assert_array_equal(bitmaps[summary[column]['violation_check']].to_mask(), expected)
+
+        self.assertEqual(summary['score']['min_range'], None)
+        self.assertEqual(summary['name'], "Column is not numeric")
+        self.assertEqual(summary['missing'], "Column not found")
+        self.assertNotIn('unbounded', summary)
+
+    def test_streaming_matches_single_pass(self):
+        """Test that chunked evaluation gives the same results as one pass."""
+        expected_summary, expected_bitmaps = RangeValidator(self.range_config).validate(self.test_data)
+
+        validator = RangeValidator(self.range_config)
+        for start in range(0, len(self.test_data), 333):
+            validator.update(self.test_data.iloc[start:start + 333])
+        summary, bitmaps = validator.results()
+
+        self.assertEqual(summary, expected_summary)
+        for check_name, bitmap in expected_bitmaps.items():
+            np.testing.assert_array_equal(bitmaps[check_name].to_mask(), bitmap.to_mask())
+
+    def test_counts_only(self):
+        """Test that counts are kept without row tracking."""
+        summary, bitmaps = RangeValidator(self.range_config, track_rows=False).validate(self.test_data)
+
+        self.assertEqual(bitmaps, {})
+        self.assertNotIn('violation_check', summary['value'])
+        self.assertEqual(summary['count']['out_of_range_count'], int(self.expected_mask('count').sum()))
+
+if __name__ == '__main__':
+    unittest.main()
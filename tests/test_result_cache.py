@@ -0,0 +1,109 @@
+import os
+import time
+import unittest
+import tempfile
+import shutil
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+from src import result_cache
+from src.result_cache import ResultCache
+from src.validation import DataValidation
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = ResultCache(self.cache_dir, max_entries=2)
+
+    def tearDown(self):
+        """Remove the on-disk store."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_column_hash_tracks_content(self):
+        """Test that column hashes change with values but not with the index."""
+        series = pd.Series([1, 2, 3], name='a')
+        self.assertEqual(ResultCache.column_hash(series), ResultCache.column_hash(series.set_axis([7, 8, 9])))
+        self.assertNotEqual(ResultCache.column_hash(series), ResultCache.column_hash(pd.Series([1, 2, 4], name='a')))
+        self.assertNotEqual(ResultCache.column_hash(series), ResultCache.column_hash(series.rename('b')))
+
+    def test_config_slice_changes_key(self):
+        """Test that config slices are part of the key."""
+        key1 = ResultCache.make_key('abc', 'range_validation', {'min': 0, 'max': 10})
+        key2 = ResultCache.make_key('abc', 'range_validation', {'max': 10, 'min': 0})
+        key3 = ResultCache.make_key('abc', 'range_validation', {'min': 0, 'max': 11})
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, key3)
+
+    def test_pipeline_version_changes_key(self):
+        """Test that results of an earlier pipeline version are not served."""
+        key = ResultCache.make_key('abc', 'range_validation', {'min': 0})
+        self.cache.set(key, {'value': 1})
+        with patch.object(result_cache, 'PIPELINE_VERSION', 'next'):
+            self.assertNotEqual(ResultCache.make_key('abc', 'range_validation', {'min': 0}), key)
+            upgraded = ResultCache(self.cache_dir)
+            self.assertIsNone(upgraded.get(key))
+            self.assertTrue(upgraded.store_dir.endswith('vnext'))
+
+    def test_disk_store_collection(self):
+        """Test that expired and least recently used entries are removed from disk."""
+        cache = ResultCache(self.cache_dir, settings={'max_bytes': 10 ** 9, 'max_age_days': 1})
+        for i in range(3):
+            cache.set(f"key{i}", list(range(1000)))
+        old = time.time() - 2 * 86400
+        os.utime(cache._path('key0'), (old, old))
+        self.assertEqual(cache.collect()['removed'], 1)
+        self.assertFalse(os.path.exists(cache._path('key0')))
+
+        size = os.path.getsize(cache._path('key1'))
+        os.utime(cache._path('key1'), (old + 86400 + 60, old + 86400 + 60))  # Within the age, least recently used
+        cache.settings['max_bytes'] = size
+        self.assertEqual(cache.collect()['removed'], 1)
+        self.assertFalse(os.path.exists(cache._path('key1')))
+        self.assertTrue(os.path.exists(cache._path('key2')))
+
+    def test_lru_eviction_spills_to_disk(self):
+        """Test that evicted entries are still served from disk."""
+        for i in range(3):
+            self.cache.set(f"key{i}", {'value': i})
+
+        self.assertEqual(self.cache.stats()['memory_entries'], 2)
+        self.assertEqual(self.cache.get('key0'), {'value': 0})
+        self.assertIsNone(self.cache.get('unknown'))
+
+        # A fresh cache over the same directory sees earlier results
+        restarted = ResultCache(self.cache_dir)
+        self.assertEqual(restarted.get('key2'), {'value': 2})
+
+    def test_incremental_revalidation(self):
+        """Test that a range bound change only recomputes the affected column."""
+        validation = DataValidation()
+        validation.result_cache = ResultCache(self.cache_dir)
+        df = pd.DataFrame({'a': np.arange(10), 'b': np.arange(10) * 2})
+
+        config = {'a': {'min': 0, 'max': 5}, 'b': {'min': 0, 'max': 5}}
+        first = validation.check_range_validation(df, config)
+        misses = validation.result_cache.misses
+
+        config['b'] = {'min': 0, 'max': 10}
+        second = validation.check_range_validation(df, config)
+
+        self.assertEqual(validation.result_cache.misses, misses + 1)  # Only 'b' recomputed
+        self.assertEqual(first['a'], second['a'])
+        self.assertEqual(second['b']['out_of_range_count'], 4)
+        self.assertIn('range_validation.a', validation.violations)
+
+    def test_row_wise_rule_tracks_referenced_columns(self):
+        """Test that a rule evaluated row by row is recomputed when only a referenced column changes."""
+        validation = DataValidation()
+        validation.result_cache = ResultCache(self.cache_dir)
+        rules = {'log_rule': {'column': 'a', 'type': 'expression', 'expression': "log(row['b']) > row['a']"}}
+        df = pd.DataFrame({'a': [1.0, 1.0, 1.0], 'b': [10.0, 10.0, 10.0]})
+        self.assertEqual(validation.check_custom_validation_rules(df, rules), {})
+
+        df['b'] = 0.5
+        result = validation.check_custom_validation_rules(df, rules)
+        self.assertEqual(result['log_rule']['violated_count'], 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.results_store import ResultsStore, PIPELINE_VERSION
+from src.violations import ViolationBitmap
+
+class TestResultsStore(unittest.TestCase):
+    def setUp(self):
+        """Create an empty store."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = ResultsStore(self.temp_dir.name)
+        mask = np.zeros(1000, dtype=bool)
+        mask[::9] = True
+        self.violations = {
+            'outliers.z_score.amount': ViolationBitmap.from_mask(mask),
+            'range_validation.price': ViolationBitmap.from_positions([3, 500], 1000)
+        }
+        self.results = {'basic_validation': {'missing_values': {'total_missing': {'amount': 2}}}}
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        """Test that results and single violation bitmaps are read back."""
+        self.store.save('task-1', 'sales.csv', 'content', 'config', self.results, self.violations, dataset='sales')
+
+        self.assertEqual(self.store.load_results('task-1'), self.results)
+        bitmap = self.store.load_violation('task-1', 'outliers.z_score.amount')
+        np.testing.assert_array_equal(bitmap.to_mask(), self.violations['outliers.z_score.amount'].to_mask())
+        self.assertEqual(self.store.load_violation('task-1', 'range_validation.price').page(1, 10), [3, 500])
+        self.assertIsNone(self.store.load_violation('task-1', 'missing'))
+        self.assertIsNone(self.store.load_results('task-2'))
+
+        row = self.store.get('task-1')
+        self.assertEqual(row['pipeline_version'], PIPELINE_VERSION)
+        self.assertEqual(row['violation_checks'], 2)
+
+        updated = {**self.results, 'correlation_analysis': {'correlation_matrix_path': 'static/plots/a.png'}}
+        self.assertTrue(self.store.update_results('task-1', updated))
+        self.assertEqual(self.store.load_results('task-1'), updated)
+        self.assertFalse(self.store.update_results('task-2', updated))
+
+    def test_files_kept_with_results(self):
+        """Test that files copied in with a task are served and deleted with it."""
+        source = os.path.join(self.temp_dir.name, 'matrix.npy')
+        np.save(source, np.eye(3))
+        self.store.save('task-1', 'sales.csv', 'content', 'config', self.results, files={'tiles.npy': source})
+        os.remove(source)
+
+        np.testing.assert_array_equal(np.load(self.store.file_path('task-1', 'tiles.npy')), np.eye(3))
+        self.assertIsNone(self.store.file_path('task-1', 'tiles.json'))
+        self.store.delete('task-1')
+        self.assertIsNone(self.store.file_path('task-1', 'tiles.npy'))
+
+    def test_lookup_by_key_file_and_date(self):
+        """Test indexed lookups by content/config hash, file name and date."""
+        self.store.save('old', 'sales.csv', 'content', 'config', self.results)
+        self.store.save('new', 'sales.csv', 'content', 'config', self.results)
+        self.store.save('other', 'stock.csv', 'content', 'other-config', self.results)
+
+        self.assertEqual(self.store.find('content', 'config')['task_id'], 'new')
+        self.assertIsNone(self.store.find('content', 'config', pipeline_version='0'))
+        self.assertIsNone(self.store.find('changed', 'config'))
+        self.assertEqual([row['task_id'] for row in self.store.query(filename='sales.csv')], ['new', 'old'])
+        self.assertEqual(self.store.query(since='2999-01-01'), [])
+        self.assertEqual(len(self.store.query(limit=2)), 2)
+
+        self.store.delete('new')
+        self.assertEqual(self.store.find('content', 'config')['task_id'], 'old')
+
+    def test_hashes(self):
+        """Test file and config hashing."""
+        path = os.path.join(self.temp_dir.name, 'data.csv')
+        with open(path, 'w') as f:
+            f.write('a,b\n1,2\n')
+        first = ResultsStore.file_hash(path)
+        with open(path, 'a') as f:
+            f.write('3,4\n')
+        self.assertNotEqual(ResultsStore.file_hash(path), first)
+
+        self.assertEqual(ResultsStore.config_hash({'a': 1, 'b': 2}), ResultsStore.config_hash({'b': 2, 'a': 1}))
+        self.assertNotEqual(ResultsStore.config_hash({'a': 1}), ResultsStore.config_hash({'a': 2}))
+        with self.assertRaises(ValueError):
+            self.store.load_results('../results')
+
+if __name__ == '__main__':
+    unittest.main()
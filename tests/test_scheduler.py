@@ -0,0 +1,70 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src.validation import DataValidation
+from src.scheduler import ValidationScheduler, SKIPPED_MESSAGE
+
+class TestValidationScheduler(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        rng = np.random.default_rng(42)
+        amount = rng.normal(100, 10, 5000)
+        amount[[5, 2500]] = [1000.0, -1000.0]
+        self.test_data = pd.DataFrame({
+            'amount': amount,
+            'quantity': rng.integers(-5, 50, 5000),
+            'category': rng.choice(['A', 'B', 'C'], 5000)
+        })
+        self.validation = DataValidation(mode='exact')
+
+    def test_full_profile_runs_everything_exactly(self):
+        """Test that the full profile keeps the usual layout and runs every check exactly."""
+        results = self.validation.validate_data(self.test_data, profile='full')
+
+        self.assertEqual(list(results['basic_validation'])[:3], ['missing_values', 'negative_values', 'duplicates'])
+        self.assertIn('outliers', results['advanced_validation'])
+        statuses = {entry['status'] for entry in results['schedule']['checks'].values()}
+        self.assertEqual(statuses, {'exact'})
+        self.assertEqual(results['schedule']['profile'], 'full')
+
+    def test_sampled_checks_map_violations_to_full_rows(self):
+        """Test that sampled checks are marked and their bitmaps cover the full frame."""
+        scheduler = ValidationScheduler('fast', profiles={'fast': {'max_sample_rows': 2000}})
+        self.validation.violations = {}
+        results = scheduler.run(self.validation, self.test_data)
+        checks = results['schedule']['checks']
+
+        self.assertEqual(checks['missing_values']['status'], 'exact')
+        self.assertEqual(checks['outliers']['status'], 'sampled')
+        self.assertEqual(checks['outliers']['rows'], 2000)
+        self.assertEqual(checks['multivariate_outliers']['status'], 'skipped')
+        self.assertIn('fast', results['advanced_validation']['multivariate_outliers'])
+
+        bitmap = self.validation.violations['outliers.z_score.amount']
+        self.assertEqual(len(bitmap.to_mask()), len(self.test_data))
+        self.assertTrue(set(bitmap.rows().tolist()).issubset({5, 2500}))
+
+    def test_exhausted_deadline_skips_expensive_checks(self):
+        """Test that cheap checks still run exactly when the deadline has passed."""
+        published = []
+        results = self.validation.validate_data(
+            self.test_data, profile='standard', deadline_seconds=0,
+            on_result=lambda section, name, result: published.append(name)
+        )
+        checks = results['schedule']['checks']
+
+        self.assertEqual(checks['negative_values']['status'], 'exact')
+        self.assertIn('quantity', results['basic_validation']['negative_values'])
+        self.assertEqual(checks['distribution_analysis']['status'], 'skipped')
+        self.assertEqual(results['advanced_validation']['distribution_analysis'], SKIPPED_MESSAGE)
+        self.assertEqual(published[0], 'type_inference')  # Published before the checks run
+        self.assertEqual(published[1], 'data_types')  # Cheapest check runs first
+        self.assertEqual(len(published), len(checks) + 1)
+
+    def test_unknown_profile(self):
+        """Test that an unknown profile is rejected."""
+        with self.assertRaises(ValueError):
+            ValidationScheduler('instant')
+
+if __name__ == '__main__':
+    unittest.main()
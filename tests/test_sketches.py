@@ -0,0 +1,105 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src.sketches import HyperLogLog, TDigest, MisraGries, StreamingMoments
+from src.validation import DataValidation
+
+class TestSketches(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        rng = np.random.default_rng(42)
+        self.values = rng.lognormal(size=200000)
+        self.chunks = np.array_split(self.values, 8)
+
+    def test_hyperloglog_estimate_within_bound(self):
+        """Test HyperLogLog distinct counts and merging."""
+        ints = np.floor(self.values * 100)
+        left, right = HyperLogLog(12), HyperLogLog(12)
+        left.update(ints[:100000])
+        right.update(ints[100000:])
+        result = left.merge(right).result()
+
+        self.assertLess(abs(result['estimate'] - len(np.unique(ints))), result['error_bound'])
+
+        small = HyperLogLog().update(np.array([1, 2, 3, 3, 3]))
+        self.assertAlmostEqual(small.estimate(), 3, delta=0.1)
+
+    def test_tdigest_quantiles(self):
+        """Test t-digest quantiles against exact quantiles."""
+        digest = TDigest()
+        for chunk in self.chunks:
+            digest.update(chunk)
+
+        self.assertEqual(digest.count, len(self.values))
+        self.assertLessEqual(len(digest.means), 200)
+        for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+            result = digest.quantile_result(q)
+            self.assertLessEqual(abs(result['estimate'] - np.quantile(self.values, q)), result['error_bound'] + 1e-9)
+
+        self.assertAlmostEqual(float(digest.cdf(1.0)), (self.values <= 1.0).mean(), delta=0.01)
+        self.assertEqual(digest.quantile(0), self.values.min())
+        self.assertEqual(digest.quantile(1), self.values.max())
+
+    def test_misra_gries_heavy_hitters(self):
+        """Test Misra-Gries counts stay within the error bound."""
+        data = pd.Series(np.random.default_rng(0).zipf(2, 50000))
+        sketch = MisraGries(k=10)
+        for chunk in np.array_split(data.to_numpy(), 5):
+            sketch.update(chunk)
+
+        exact = data.value_counts()
+        top = sketch.top(3)
+        self.assertEqual([item['value'] for item in top], exact.index[:3].tolist())
+        for item in top:
+            self.assertLessEqual(item['count'], exact[item['value']])
+            self.assertLessEqual(exact[item['value']] - item['count'], item['error_bound'])
+        self.assertLessEqual(sketch.error, len(data) / 11)
+
+    def test_streaming_moments(self):
+        """Test streaming mean/std are exact and sampled moments are bounded."""
+        moments = StreamingMoments(sample_size=5000)
+        for chunk in self.chunks:
+            moments.update(chunk)
+        result = moments.result()
+
+        self.assertAlmostEqual(result['mean']['estimate'], self.values.mean())
+        self.assertAlmostEqual(result['std']['estimate'], self.values.std(ddof=1))
+        self.assertEqual(result['sample_size'], 5000)
+        self.assertGreater(result['skewness']['error_bound'], 0)
+
+    def test_approximate_validation_mode(self):
+        """Test approximate mode against exact validation."""
+        rng = np.random.default_rng(1)
+        df = pd.DataFrame({
+            'id': np.arange(5000),
+            'amount': rng.normal(0, 1, 5000),
+            'category': rng.choice(['A', 'B', 'C'], 5000, p=[0.6, 0.3, 0.1])
+        })
+        df.loc[::50, 'amount'] = np.nan
+
+        exact = DataValidation(mode='exact').validate_data(df)
+        approx = DataValidation(mode='approximate').validate_data(df)
+
+        self.assertEqual(approx['mode'], 'approximate')
+        self.assertEqual(approx['basic_validation']['missing_values'], exact['basic_validation']['missing_values'])
+        self.assertEqual(approx['basic_validation']['negative_values'], exact['basic_validation']['negative_values'])
+
+        scores = approx['advanced_validation']['quality_scores']['column_scores']
+        self.assertTrue(scores['id']['is_unique'])
+        self.assertFalse(scores['category']['is_unique'])
+
+        outliers = approx['advanced_validation']['outliers']['amount']
+        exact_outliers = exact['advanced_validation']['outliers']['amount']
+        self.assertLessEqual(abs(outliers['iqr_outliers'] - exact_outliers['iqr_outliers']),
+                             outliers['error_bounds']['iqr_outliers'] + 1)
+
+        top = approx['advanced_validation']['categorical_top_k']['category']
+        self.assertEqual(top[0]['value'], 'A')
+
+    def test_invalid_mode(self):
+        """Test that unknown modes are rejected."""
+        with self.assertRaises(ValueError):
+            DataValidation(mode='fuzzy')
+
+if __name__ == '__main__':
+    unittest.main()
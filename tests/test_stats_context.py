@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+from src.stats_context import StatsContext, stats_for
+from src.correlation_engine import correlation_matrix
+from src.correlation import CorrelationAnalyzer
+from src.validation import DataValidation
+
+class TestStatsContext(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        rng = np.random.default_rng(42)
+        x = rng.normal(0, 1, 500)
+        self.test_data = pd.DataFrame({
+            'x': x,
+            'y': x * 2 + rng.normal(0, 0.1, 500),
+            'z': rng.normal(0, 1, 500),
+            'label': rng.choice(['a', 'b'], 500)
+        })
+
+    def test_memoizes_per_frame(self):
+        """Test that intermediates are computed once and dropped when the frame changes."""
+        stats = StatsContext(self.test_data)
+        first = stats.correlation_matrix()
+        self.assertIs(stats.correlation_matrix(), first)
+        self.assertEqual(stats.numeric_columns(), ['x', 'y', 'z'])
+        pd.testing.assert_frame_equal(first, self.test_data[['x', 'y', 'z']].corr())
+
+        stats.replace_frame(self.test_data[['x', 'z']])
+        self.assertEqual(list(stats.correlation_matrix().columns), ['x', 'z'])
+        self.assertIsNot(stats_for(self.test_data, stats), stats)
+
+    def test_pipeline_computes_correlation_once(self):
+        """Test that validation and correlation analysis share one correlation matrix."""
+        stats = StatsContext(self.test_data)
+        with patch('src.stats_context.correlation_matrix', side_effect=correlation_matrix) as corr:
+            validation = DataValidation().validate_data(self.test_data, stats=stats)
+            correlation = CorrelationAnalyzer().analyze(stats.frame, stats=stats)
+
+        self.assertEqual(corr.call_count, 1)
+        self.assertIs(correlation['correlations'],
+                      validation['advanced_validation']['multicollinearity']['correlation_matrix'])
+        self.assertEqual(correlation['high_correlations'][0]['column1'], 'x')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src import type_inference
+from src.type_inference import TypeInferencer
+from src.validation import DataValidation
+
+class TestTypeInferencer(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        type_inference._format_cache.clear()
+        rng = np.random.default_rng(42)
+        dates = pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 1000, 3000), unit='D')
+        amounts = rng.normal(100, 10, 3000).round(2).astype(str).astype(object)
+        amounts[10] = 'n/a'
+        self.test_data = pd.DataFrame({
+            'amount': amounts,
+            'day_first': dates.strftime('%d/%m/%Y'),
+            'mixed_dates': np.where(np.arange(3000) % 3 == 0, dates.strftime('%d-%m-%Y'), dates.strftime('%d/%m/%Y')),
+            'label': rng.choice(['north', 'south', '12'], 3000),
+            'count': rng.integers(0, 10, 3000)
+        })
+        self.dates = pd.Series(dates)
+
+    def test_coerces_numeric_and_datetime(self):
+        """Test that parseable columns are converted and failure rates reported."""
+        coerced, report = TypeInferencer().coerce(self.test_data)
+
+        self.assertTrue(pd.api.types.is_float_dtype(coerced['amount']))
+        self.assertTrue(np.isnan(coerced['amount'][10]))
+        self.assertAlmostEqual(report['amount']['failure_rate'], 1 / 3000)
+
+        self.assertEqual(report['day_first']['format'], ['%d/%m/%Y'])
+        pd.testing.assert_series_equal(coerced['day_first'], self.dates, check_names=False)
+
+        self.assertEqual(report['label']['inferred_type'], 'string')
+        self.assertFalse(report['label']['coerced'])
+        self.assertNotIn('count', report)
+        self.assertEqual(self.test_data['amount'].dtype, object)  # Input is left untouched
+
+    def test_mixed_datetime_formats(self):
+        """Test that a column mixing two date formats is parsed with both."""
+        coerced, report = TypeInferencer().coerce(self.test_data)
+
+        self.assertEqual(sorted(report['mixed_dates']['format']), ['%d-%m-%Y', '%d/%m/%Y'])
+        self.assertEqual(report['mixed_dates']['failure_rate'], 0.0)
+        pd.testing.assert_series_equal(coerced['mixed_dates'], self.dates, check_names=False)
+
+    def test_day_and_month_first_not_mixed(self):
+        """Test that a column needing both day-first and month-first formats is reported as ambiguous."""
+        df = pd.DataFrame({
+            'both_orders': ['13/01/2020', '25/02/2020', '03/04/2020', '12/31/2020', '30/06/2020'],
+            'month_first': ['01/13/2020', '02/25/2020', '04/03/2020', '12/31/2020', '06/30/2020']
+        })
+        coerced, report = TypeInferencer().coerce(df)
+
+        self.assertEqual(report['both_orders']['inferred_type'], 'ambiguous_datetime')
+        self.assertFalse(report['both_orders']['coerced'])
+        self.assertEqual(coerced['both_orders'].dtype, object)
+        self.assertEqual(report['month_first']['format'], ['%m/%d/%Y'])
+        self.assertTrue(report['month_first']['coerced'])
+
+    def test_sample_success_is_not_enough(self):
+        """Test that a column is left alone when the full column fails too often."""
+        df = pd.DataFrame({'tail_garbage': ['1.5'] * 1000 + ['bad'] * 100})
+        coerced, report = TypeInferencer({'sample_size': 20, 'seed': 1}).coerce(df)  # Sample holds one bad value
+
+        entry = report['tail_garbage']
+        self.assertEqual(entry['inferred_type'], 'numeric')
+        self.assertFalse(entry['coerced'])
+        self.assertEqual(coerced['tail_garbage'].dtype, object)
+
+    def test_format_cache_tried_first(self):
+        """Test that a format that worked before is reused for the same column."""
+        TypeInferencer().coerce(self.test_data[['day_first']])
+        self.assertEqual(type_inference._format_cache['day_first'], ['%d/%m/%Y'])
+
+        # Ambiguous dates parse with either order; the cached day-first format wins
+        ambiguous = pd.DataFrame({'day_first': ['01/02/2020', '03/04/2021', '05/06/2022']})
+        report = TypeInferencer().infer(ambiguous)
+        self.assertEqual(report['day_first']['format'], ['%d/%m/%Y'])
+
+    def test_validation_uses_coerced_types(self):
+        """Test that validate_data coerces before the checks and reports it."""
+        validation = DataValidation(mode='exact')
+        results = validation.validate_data(self.test_data, expected_dtypes={'amount': 'numeric', 'day_first': 'datetime'})
+
+        self.assertEqual(results['basic_validation']['data_type_validation'], {})
+        self.assertTrue(results['basic_validation']['type_inference']['amount']['coerced'])
+        self.assertIn('amount', results['advanced_validation']['outliers'])
+
+    def test_data_type_hint_for_uncoerced_column(self):
+        """Test that check_data_types explains why a parseable column was not coerced."""
+        validation = DataValidation(mode='exact')
+        validation.type_report = {'tail_garbage': {
+            'inferred_type': 'numeric', 'format': None, 'sample_failure_rate': 0.0,
+            'failure_rate': 0.2, 'coerced': False
+        }}
+        df = pd.DataFrame({'tail_garbage': ['1.5', 'bad']})
+        result = validation.check_data_types(df, {'tail_garbage': 'numeric'})
+        self.assertEqual(result['tail_garbage'], "Expected numeric, got object (parses as numeric, 20.0% failures)")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -86,6 +86,12 @@ class TestDataValidation(unittest.TestCase):
         )
         self.assertEqual(numeric_mean['numeric'].iloc[2], 3.0)  # Mean of [1,2,4,5]
 
+        # Model-based methods fill numeric columns, then the rest with the mode
+        for method in ['knn', 'mice']:
+            imputed_df = self.validation.impute_missing_values(data, method=method)
+            self.assertFalse(imputed_df.isnull().any().any())
+            self.assertEqual(imputed_df['categorical'].iloc[1], 'A')
+
     def test_check_range_validation(self):
         """Test range validation."""
         # Define range configuration for testing
@@ -102,6 +108,9 @@ class TestDataValidation(unittest.TestCase):
         self.assertEqual(results['value']['out_of_range_count'], 2) # -40 and 50 are out of range
         self.assertEqual(results['value']['min_range'], -30)
         self.assertEqual(results['value']['max_range'], 40)
+        self.assertNotIn('out_of_range_values', results['value'])  # Rows are kept as a bitmap instead
+        bitmap = self.validation.violations[results['value']['violation_check']]
+        self.assertEqual(bitmap.page(1, 10), [3, 4])
         self.assertNotIn('score', results) # 'score' should not be in results if no out-of-range values
         
         # Test with no range config for a column
@@ -139,6 +148,8 @@ class TestDataValidation(unittest.TestCase):
         self.assertIn('rule_non_negative_value', results)
         self.assertEqual(results['rule_non_negative_value']['violated_count'], 2) # -20 and -40 are negative
         self.assertEqual(results['rule_non_negative_value']['expression'], "row['value'] >= 0")
+        bitmap = self.validation.violations[results['rule_non_negative_value']['violation_check']]
+        self.assertEqual(bitmap.page(1, 10), [1, 3])
         self.assertNotIn('rule_score_between_1_and_4', results) # No violations for score range
         self.assertIn('rule_invalid_config', results)
         self.assertIn("Invalid rule configuration", results['rule_invalid_config']) # Invalid rule config error message
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+import numpy as np
+import yaml
+from src.validation_plan import CompiledRule, ValidationPlan, get_validation_plan
+
+def rule(expression, column='value'):
+    return {'description': expression, 'column': column, 'type': 'expression', 'expression': expression}
+
+class TestCompiledRule(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        self.test_data = pd.DataFrame({
+            'value': [10, -20, 30, np.nan, 50],
+            'score': [1.5, 2.5, 4.5, 3.0, 0.5],
+            'name': ['a', 'b', 'c', 'd', 'e']
+        })
+
+    def row_wise(self, expression):
+        """Reference result using the previous per-row pd.eval evaluation."""
+        result = self.test_data.apply(lambda row: pd.eval(expression, local_dict={'row': row}), axis=1)
+        return (result == False).to_numpy(dtype=bool)
+
+    def test_matches_row_wise_evaluation(self):
+        """Test that vectorized rules flag the same rows as row-wise pd.eval."""
+        expressions = [
+            "row['value'] >= 0",
+            "(row['score'] >= 1) & (row['score'] <= 4)",
+            "row['score'] >= 1 and row['score'] <= 4",
+            "(row['value'] > 0) | (row['score'] < 1)",
+            "row['value'] * 2 + row['score'] > 20",
+            "abs(row['value']) < 40",
+        ]
+        for expression in expressions:
+            compiled = CompiledRule('rule', rule(expression))
+            self.assertTrue(compiled.vectorized, expression)
+            np.testing.assert_array_equal(compiled.violations(self.test_data), self.row_wise(expression), expression)
+
+    def test_boolean_operator_precedence(self):
+        """Test that unparenthesized & and | bind below comparisons, as in pd.eval."""
+        self.test_data = pd.DataFrame({'value': [-1, 5, 3, -2], 'score': [5, 2, 6, 9]})
+        expected = {
+            "row['value'] >= 0 & row['score'] <= 4": [True, False, True, True],
+            "row['value'] >= 0 | row['score'] > 5": [True, False, False, False],
+            "~(row['value'] > 0) & row['score'] > 5": [True, True, True, False],
+        }
+        for expression, violations in expected.items():
+            compiled = CompiledRule('rule', rule(expression))
+            self.assertTrue(compiled.vectorized, expression)
+            np.testing.assert_array_equal(compiled.violations(self.test_data), violations, expression)
+            np.testing.assert_array_equal(self.row_wise(expression), violations, expression)
+
+    def test_extended_syntax(self):
+        """Test chained comparisons, membership and negation."""
+        compiled = CompiledRule('rule', rule("1 <= row['score'] <= 4"))
+        np.testing.assert_array_equal(compiled.violations(self.test_data), [False, False, True, False, True])
+
+        compiled = CompiledRule('rule', rule("row['name'] in ['a', 'b']", column='name'))
+        np.testing.assert_array_equal(compiled.violations(self.test_data), [False, False, True, True, True])
+
+        compiled = CompiledRule('rule', rule("not (row['score'] > 4)", column='score'))
+        np.testing.assert_array_equal(compiled.violations(self.test_data), [False, False, True, False, False])
+
+    def test_referenced_columns_and_errors(self):
+        """Test referenced columns, row-wise fallback and configuration errors."""
+        compiled = CompiledRule('rule', rule("(row['score'] >= 1) & (row['other'] <= 4)", column='score'))
+        self.assertEqual(compiled.input_columns(self.test_data.columns), ['score'])
+        self.assertEqual(compiled.referenced_columns, ['other', 'score'])
+        with self.assertRaises(KeyError):
+            compiled.violations(self.test_data)
+
+        fallback = CompiledRule('rule', rule("row.value >= 0"))
+        self.assertFalse(fallback.vectorized)
+        self.assertFalse(fallback.cacheable)
+
+        fallback = CompiledRule('rule', rule("log(row['score']) > row['value']"))
+        self.assertFalse(fallback.vectorized)
+        self.assertTrue(fallback.cacheable)
+        self.assertEqual(fallback.input_columns(self.test_data.columns), ['score', 'value'])
+
+        self.assertIn("Invalid rule configuration", CompiledRule('rule', {'column': 'value', 'type': 'other'}).config_error)
+        self.assertIn("not supported", CompiledRule('rule', {'column': 'value', 'type': 'script', 'script': 'x'}).config_error)
+
+class TestValidationPlan(unittest.TestCase):
+    def setUp(self):
+        """Write a minimal config file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.temp_dir.name, 'config.yaml')
+        self.config = {
+            'validation': {
+                'missing_threshold': 0.2,
+                'outlier_sensitivity': {'z_score': 3, 'iqr': 1.5},
+                'range_validation': {'value': {'min': 0, 'max': 100}},
+                'custom_validation_rules': {'positive': rule("row['value'] >= 0")}
+            }
+        }
+        self.write_config()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_config(self, mtime_ns=None):
+        with open(self.config_path, 'w') as f:
+            yaml.dump(self.config, f)
+        if mtime_ns is not None:
+            os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+
+    def test_plan_contents(self):
+        """Test resolved settings and compiled rules."""
+        plan = ValidationPlan.load(self.config_path)
+
+        self.assertEqual(plan.mode, 'exact')
+        self.assertEqual(plan.mad_threshold, 3.5)
+        self.assertEqual(plan.range_bounds, {'value': (0, 100)})
+        self.assertTrue(plan.rules['positive'].vectorized)
+
+    def test_plan_cached_until_config_changes(self):
+        """Test that the shared plan is rebuilt only when the file changes."""
+        self.write_config(mtime_ns=1_000_000_000)
+        first = get_validation_plan(self.config_path)
+        self.assertIs(get_validation_plan(self.config_path), first)
+
+        self.config['validation']['missing_threshold'] = 0.5
+        self.write_config(mtime_ns=2_000_000_000)
+        second = get_validation_plan(self.config_path)
+
+        self.assertIsNot(second, first)
+        self.assertEqual(second.missing_threshold, 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
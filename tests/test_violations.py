@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+from src.violations import ViolationBitmap
+
+class TestViolationBitmap(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        rng = np.random.default_rng(0)
+        # Span several blocks so paging has to cross block boundaries
+        self.mask = rng.random(100_000) < 0.05
+        self.bitmap = ViolationBitmap.from_mask(self.mask)
+
+    def test_count_and_roundtrip(self):
+        """Test counts and full decoding."""
+        self.assertEqual(self.bitmap.count, int(self.mask.sum()))
+        self.assertEqual(self.bitmap.length, len(self.mask))
+        np.testing.assert_array_equal(self.bitmap.to_mask(), self.mask)
+
+    def test_page_matches_flatnonzero(self):
+        """Test that pages decode the right row positions."""
+        expected = np.flatnonzero(self.mask)
+        self.assertEqual(self.bitmap.page(1, 50), expected[:50].tolist())
+        self.assertEqual(self.bitmap.page(40, 250), expected[9750:10000].tolist())
+
+        # Last partial page and pages past the end
+        last_page = -(-len(expected) // 1000)
+        self.assertEqual(self.bitmap.page(last_page, 1000), expected[(last_page - 1) * 1000:].tolist())
+        self.assertEqual(self.bitmap.page(last_page + 1, 1000), [])
+
+    def test_bytes_roundtrip(self):
+        """Test serialization to raw bytes."""
+        restored = ViolationBitmap.from_bytes(self.bitmap.to_bytes(), self.bitmap.length)
+        self.assertEqual(restored.count, self.bitmap.count)
+        self.assertEqual(restored.page(3, 100), self.bitmap.page(3, 100))
+
+    def test_empty_and_invalid_page(self):
+        """Test empty masks and invalid page arguments."""
+        empty = ViolationBitmap.from_mask(np.zeros(0, dtype=bool))
+        self.assertEqual(empty.count, 0)
+        self.assertEqual(empty.page(1, 10), [])
+
+        with self.assertRaises(ValueError):
+            self.bitmap.page(0, 10)
+
+if __name__ == '__main__':
+    unittest.main()
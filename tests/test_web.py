@@ -3,12 +3,14 @@ import io
 import json
 import time
 import logging
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
 import numpy as np
 from flask import Flask
 from flask_socketio import SocketIO
+from src.results_store import ResultsStore
 
 from app import app, socketio, tasks, erd_generator
 from src import correlation
@@ -46,8 +48,16 @@ class TestWebInterface(unittest.TestCase):
         # Clear any existing tasks
         tasks.clear()
 
+        # Each test gets an empty results store so earlier runs are not reused
+        self.store_dir = tempfile.TemporaryDirectory()
+        self.results_store = ResultsStore(self.store_dir.name)
+        self.store_patch = patch('app.results_store', self.results_store)
+        self.store_patch.start()
+
     def tearDown(self):
         """Clean up test files and directories."""
+        self.store_patch.stop()
+        self.store_dir.cleanup()
         # Clean up uploaded files
         if os.path.exists(self.test_upload_dir):
             for file in os.listdir(self.test_upload_dir):